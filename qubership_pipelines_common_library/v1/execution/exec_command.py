@@ -20,7 +20,8 @@
 from qubership_pipelines_common_library.v1.execution.exec_context import ExecutionContext
 from qubership_pipelines_common_library.v1.utils.utils_context import create_execution_context
 from qubership_pipelines_common_library.v2.cli_output.cli_output import CliOutput
-from qubership_pipelines_common_library.v2.utils.crypto_utils import CryptoUtils
+from qubership_pipelines_common_library.v2.profiling.command_profiler import CommandProfiler
+from qubership_pipelines_common_library.v2.utils.crypto_utils import MaskedParamsView
 
 
 class ExecutionCommand:
@@ -47,11 +48,15 @@ def __init__(self, context_path: str = None, input_params: dict = None, input_pa
             parent_context_to_reuse (ExecutionContext): Optional, existing context to propagate input params from.
             pre_execute_actions: Optional, list of actions, implementing ExecutionCommandExtension, to be executed before command
             post_execute_actions: Optional, list of actions, implementing ExecutionCommandExtension, to be executed after command
+
+        When profiling or tracing is enabled, wall time of lifecycle phases is written into `command_timings.json` in logs folder (see **`CommandProfiler`**)
         """
-        if not context_path:
-            context_path = create_execution_context(input_params=input_params, input_params_secure=input_params_secure,
-                                                    folder_path=folder_path, parent_context_to_reuse=parent_context_to_reuse)
-        self.context = ExecutionContext(context_path)
+        self._profiler = CommandProfiler(type(self).__name__)
+        with self._profiler.phase("context_bootstrap"):
+            if not context_path:
+                context_path = create_execution_context(input_params=input_params, input_params_secure=input_params_secure,
+                                                        folder_path=folder_path, parent_context_to_reuse=parent_context_to_reuse)
+            self.context = ExecutionContext(context_path)
         self._pre_execute_actions = []
         if pre_execute_actions:
             self._pre_execute_actions.extend(pre_execute_actions)
@@ -61,22 +66,32 @@ def __init__(self, context_path: str = None, input_params: dict = None, input_pa
 
     def run(self):
         """Runs command following its lifecycle"""
+        self._profiler.start()
         try:
             self._log_command_class_name()
             self._log_border_line()
-            self._log_input_params()
-            if not self._validate():
+            with self._profiler.phase("log_input_params"):
+                self._log_input_params()
+            with self._profiler.phase("validate"):
+                valid = self._validate()
+            if not valid:
                 self._exit(False, ExecutionCommand.FAILURE_MSG)
-            self._pre_execute()
-            self._execute()
-            self._post_execute()
+            with self._profiler.phase("pre_execute"):
+                self._pre_execute()
+            with self._profiler.phase("execute"):
+                self._execute()
+            with self._profiler.phase("post_execute"):
+                self._post_execute()
             self._exit(True, ExecutionCommand.SUCCESS_MSG)
         except Exception:
             logging.error(traceback.format_exc())
             self._exit(False, ExecutionCommand.FAILURE_MSG)
         finally:
             self._log_border_line()
-            self._print_cli_output() # we allow failed commands to produce output
+            with self._profiler.phase("cli_output"):
+                self._print_cli_output() # we allow failed commands to produce output
+            self._profiler.stop(self.context.path_logs)
+            self.context.logger.close()
 
     def _log_command_class_name(self):
         self.context.logger.info("command_class_name = %s", type(self).__name__)
@@ -85,10 +100,13 @@ def _log_border_line(self):
         self.context.logger.info("=" * 60)
 
     def _log_input_params(self):
+        if not self.context.logger.isEnabledFor(logging.INFO):
+            return
+        # params are rendered (and masked) lazily, only if record is actually emitted
         self.context.logger.info(
             "Input context parameters:\n%s\n%s",
-            CryptoUtils.get_parameters_for_print(self.context.input_params_secure.content, True),
-            CryptoUtils.get_parameters_for_print(self.context.input_params.content, False)
+            MaskedParamsView(self.context.input_params_secure.content, True),
+            MaskedParamsView(self.context.input_params.content, False)
         )
 
     def _validate(self):
@@ -96,19 +114,22 @@ def _validate(self):
 
     def _pre_execute(self):
         for action in self._pre_execute_actions:
-            action.with_command(self).execute()
+            with self._profiler.phase(type(action).__name__):
+                action.with_command(self).execute()
 
     def _execute(self):
         logging.info("Status: SKIPPED")
 
     def _post_execute(self):
         for action in self._post_execute_actions:
-            action.with_command(self).execute()
+            with self._profiler.phase(type(action).__name__):
+                action.with_command(self).execute()
 
     def _print_cli_output(self):
         CliOutput.print_command_output(self)
 
     def _exit(self, success: bool, message: str):
+        self._profiler.success = success
         if success:
             self.context.logger.info(message)
             sys.exit(0)
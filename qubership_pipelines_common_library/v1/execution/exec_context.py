@@ -12,16 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
 
 from pathlib import Path
 from qubership_pipelines_common_library.v1.utils.utils_file import UtilsFile
 from qubership_pipelines_common_library.v1.execution.exec_context_file import ExecutionContextFile
 from qubership_pipelines_common_library.v1.execution.exec_logger import ExecutionLogger
+from qubership_pipelines_common_library.v1.utils.utils_string import UtilsString
+from qubership_pipelines_common_library.v2.profiling.command_profiler import CommandProfiler
+from qubership_pipelines_common_library.v2.utils.env_var_utils import EnvVarUtils
 
 
 class ExecutionContext:
 
+    ENCRYPT_OUTPUT_SECURE_PARAMS_ENV = "PIPELINES_DECLARATIVE_EXECUTOR_ENCRYPT_OUTPUT_SECURE_PARAMS"
+    AGE_RECIPIENTS_ENV = "SOPS_AGE_RECIPIENTS"
+    AGE_KEY_ENV = "SOPS_AGE_KEY"
+    CONTEXT_PATHS = ("paths.logs", "paths.temp", "paths.input.params", "paths.input.params_secure", "paths.input.files",
+                     "paths.output.params", "paths.output.params_secure", "paths.output.files")
+
     def __init__(self, context_path: str):
         """
         Interface that provides references and shortcuts to navigating provided input params, storing any output params, and logging messages.
@@ -40,26 +50,26 @@ def __init__(self, context_path: str):
         self.__init_temp_folder()
         self.__init_logger()
         # load context from files
-        self.logger.debug(f"""Execution context params:
-            paths.logs: {self.context.get("paths.logs")}
-            paths.temp: {self.context.get("paths.temp")}
-            paths.input.params: {self.context.get("paths.input.params")}
-            paths.input.params_secure: {self.context.get("paths.input.params_secure")}
-            paths.input.files: {self.context.get("paths.input.files")}
-            paths.output.params: {self.context.get("paths.output.params")}
-            paths.output.params_secure: {self.context.get("paths.output.params_secure")}
-            paths.output.files: {self.context.get("paths.output.files")}
-        """)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Execution context params:\n%s", "\n".join(
+                f"    {path}: {self.context.get(path)}" for path in self.CONTEXT_PATHS))
         self.__input_params_load()
 
     def output_params_save(self):
-        """Stores output_param files to disk"""
-        if self.context.get("paths.output.params"):
-            self.logger.info(f"Writing insecure param file '{self.context.get('paths.output.params')}'")
-            self.output_params.save(self.context.get("paths.output.params"))
-        if self.context.get("paths.output.params_secure"):
-            self.logger.info(f"Writing secure param file '{self.context.get('paths.output.params_secure')}'")
-            self.output_params_secure.save(self.context.get("paths.output.params_secure"))
+        """
+        Stores output_param files to disk
+
+        Secure params are encrypted in-process with SOPS (age) when `PIPELINES_DECLARATIVE_EXECUTOR_ENCRYPT_OUTPUT_SECURE_PARAMS`
+        is enabled and recipients are provided via `SOPS_AGE_RECIPIENTS` (or `SOPS_AGE_RECIPIENTS_FILE`)
+        """
+        with CommandProfiler.measure("output_params_save"):
+            if self.context.get("paths.output.params"):
+                self.logger.info(f"Writing insecure param file '{self.context.get('paths.output.params')}'")
+                self.output_params.save(self.context.get("paths.output.params"))
+            if self.context.get("paths.output.params_secure"):
+                self.logger.info(f"Writing secure param file '{self.context.get('paths.output.params_secure')}'")
+                self.output_params_secure.save(self.context.get("paths.output.params_secure"),
+                                               age_public_key=self.__get_output_age_public_key())
 
     def input_param_get(self, path, def_value=None):
         """Gets parameter from provided params files by its param path, supporting dot-separated nested keys (e.g. 'parent_obj.child_obj.param_name')"""
@@ -98,7 +108,17 @@ def __input_params_load(self):
         if self.context.get("paths.input.params"):
             self.input_params = ExecutionContextFile(self.context.get("paths.input.params"))
         if self.context.get("paths.input.params_secure"):
-            self.input_params_secure = ExecutionContextFile(self.context.get("paths.input.params_secure"))
+            self.input_params_secure = ExecutionContextFile(self.context.get("paths.input.params_secure"),
+                                                            age_private_key=EnvVarUtils.get_from_env_or_file(self.AGE_KEY_ENV))
+
+    def __get_output_age_public_key(self):
+        if not UtilsString.convert_to_bool(os.getenv(self.ENCRYPT_OUTPUT_SECURE_PARAMS_ENV, False)):
+            return None
+        if age_public_key := EnvVarUtils.get_from_env_or_file(self.AGE_RECIPIENTS_ENV):
+            return age_public_key
+        self.logger.warning(f"{self.ENCRYPT_OUTPUT_SECURE_PARAMS_ENV} is enabled, but {self.AGE_RECIPIENTS_ENV} is not set. "
+                            f"Secure output params will be saved unencrypted")
+        return None
 
     def __init_temp_folder(self):
         # get temp path either from context variable or calculate path to temp folder using context_path value
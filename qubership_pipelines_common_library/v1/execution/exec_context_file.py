@@ -34,11 +34,16 @@ class ExecutionContextFile:
     API_VERSION_V1 = "v1"
     SUPPORTED_API_VERSIONS = [API_VERSION_V1]
 
-    def __init__(self, path=None):
+    # same as `SopsCrypto.METADATA_KEY`, so plain files are loaded without importing crypto modules
+    SOPS_METADATA_KEY = "sops"
+
+    def __init__(self, path=None, age_private_key: str = None):
         """
         Interface to work with **`params`** and **`context`** files, used in **`ExecutionContext`**.
 
         Provides methods to init default content for different types of descriptors (e.g. **`init_context_descriptor`**, **`init_params`**)
+
+        SOPS-encrypted files are decrypted on load when **`age_private_key`** is provided
         """
         self.content = {
             "kind": "",
@@ -46,7 +51,7 @@ def __init__(self, path=None):
         }
         self.path = path
         if path:
-            self.load(path)
+            self.load(path, age_private_key=age_private_key)
 
     def init_empty(self):
         """"""
@@ -127,11 +132,17 @@ def init_params_secure(self):
         }
         return self
 
-    def load(self, path):
-        """Loads and validates file as one of supported types of descriptors"""
+    def load(self, path, age_private_key: str = None):
+        """Loads and validates file as one of supported types of descriptors, decrypting it with `age_private_key` if it's SOPS-encrypted"""
         full_path = os.path.abspath(path)
         try:
             self.content = UtilsFile.read_yaml(full_path)
+            if isinstance(self.content, dict) and ExecutionContextFile.SOPS_METADATA_KEY in self.content:
+                if age_private_key:
+                    from qubership_pipelines_common_library.v2.sops.sops_crypto import SopsCrypto
+                    self.content = SopsCrypto().decrypt_content(self.content, age_private_key)
+                else:
+                    logging.warning(f"File '{full_path}' is encrypted with SOPS, but no age private key is provided")
             # validate supported kinds and versions
             if self.content["kind"] not in ExecutionContextFile.SUPPORTED_KINDS:
                 logging.error(f"Incorrect kind value: {self.content['kind']} in file '{full_path}'. "
@@ -144,10 +155,13 @@ def load(self, path):
         except FileNotFoundError:
             self.init_empty()
 
-    def save(self, path):
-        """Writes current file content from memory to disk"""
-        # TODO: support encryption with SOPS
-        UtilsFile.write_yaml(path, self.content)
+    def save(self, path, age_public_key: str = None):
+        """Writes current file content from memory to disk, encrypting it in-process with SOPS (age) if `age_public_key` is provided"""
+        if age_public_key:
+            from qubership_pipelines_common_library.v2.sops.sops_crypto import SopsCrypto
+            UtilsFile.write_yaml(path, SopsCrypto().encrypt_content(self.content, age_public_key))
+        else:
+            UtilsFile.write_yaml(path, self.content)
 
     def get(self, path, def_value=None):
         """Gets parameter from current file content by its param path, supporting dot-separated nested keys (e.g. 'parent_obj.child_obj.param_name')"""
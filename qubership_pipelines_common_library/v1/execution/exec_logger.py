@@ -12,8 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import weakref
+
+from qubership_pipelines_common_library.v1.utils.utils_string import UtilsString
 
 
 class ExecutionLogger:
@@ -22,6 +29,14 @@ class ExecutionLogger:
     EXECUTION_LOG_LEVEL = logging.INFO
     FULL_LOG_LEVEL = logging.DEBUG
     DEFAULT_FORMAT = u'[%(asctime)s] [%(levelname)-7s] [class=%(filename)s:%(lineno)-3s] %(message)s'
+    LOGGER_NAME = "execution_logger"
+
+    ASYNC_LOGGING_ENV = "PIPELINES_ASYNC_LOGGING"
+    ASYNC_LOGGING = None  # when not configured explicitly, value from environment is used
+    QUEUE_MAX_SIZE = 10000
+    QUEUE_PUT_TIMEOUT_SECONDS = 1.0
+
+    _open_loggers = weakref.WeakSet()
 
     def __init__(self, path_logs):
         """
@@ -30,26 +45,99 @@ def __init__(self, path_logs):
         Reference to it is available from instance of **`ExecutionContext`**.
 
         Provides common logging methods of different log levels - e.g. **`debug`**, **`info`**, **`error`**
+
+        Writes `execution.log` (own records) and `full.log` (records of all loggers) into `path_logs`.
+        In async mode (`ExecutionLogger.configure(async_logging=True)` or `PIPELINES_ASYNC_LOGGING=true`),
+        records are only put into bounded in-memory queue, and formatted and written by background thread.
+        File handlers stay attached until **`close`** is called (done at the end of `ExecutionCommand.run`)
         """
-        # todo: Currently all commands (if more than one are invoked in one go) will reuse same logger
-        #  Also, file handlers are never removed
         self.path_logs = path_logs
-        self.logger = logging.getLogger("execution_logger")
+        self.logger = logging.getLogger(ExecutionLogger.LOGGER_NAME)
         self.logger.setLevel(logging.DEBUG)  # set to the lowest level to allow handlers to capture anything
         self.logger.propagate = True
+        self._attached_handlers = []  # (logger, handler) pairs, detached on close
+        self._file_handlers = []
+        self._listener = None
 
         if path_logs:
-            # execution logs - only in local logger
+            # execution logs - only records of local logger
             handler_exec = logging.FileHandler(os.path.join(path_logs, ExecutionLogger.FILE_NAME_EXECUTION))
             handler_exec.setLevel(ExecutionLogger.EXECUTION_LOG_LEVEL)
             handler_exec.setFormatter(logging.Formatter(ExecutionLogger.DEFAULT_FORMAT))
-            self.logger.addHandler(handler_exec)
 
-            # full logs - attach to a global logger
+            # full logs - records of all loggers, via global logger
             handler_full = logging.FileHandler(os.path.join(path_logs, ExecutionLogger.FILE_NAME_FULL))
             handler_full.setLevel(ExecutionLogger.FULL_LOG_LEVEL)
             handler_full.setFormatter(logging.Formatter(ExecutionLogger.DEFAULT_FORMAT))
-            logging.getLogger().addHandler(handler_full)
+            self._file_handlers = [handler_exec, handler_full]
+
+            if ExecutionLogger.is_async_logging():
+                # single queue on global logger, local records are routed to execution log by logger name
+                handler_exec.addFilter(logging.Filter(ExecutionLogger.LOGGER_NAME))
+                log_queue = queue.Queue(maxsize=ExecutionLogger.QUEUE_MAX_SIZE)
+                queue_handler = _BoundedQueueHandler(log_queue, ExecutionLogger.QUEUE_PUT_TIMEOUT_SECONDS)
+                queue_handler.setLevel(min(ExecutionLogger.EXECUTION_LOG_LEVEL, ExecutionLogger.FULL_LOG_LEVEL))
+                self._listener = logging.handlers.QueueListener(log_queue, handler_exec, handler_full,
+                                                                respect_handler_level=True)
+                self._listener.start()
+                self._attach(logging.getLogger(), queue_handler)
+            else:
+                self._attach(self.logger, handler_exec)
+                self._attach(logging.getLogger(), handler_full)
+            ExecutionLogger._open_loggers.add(self)
+
+    @staticmethod
+    def configure(async_logging: bool):
+        ExecutionLogger.ASYNC_LOGGING = async_logging
+
+    @staticmethod
+    def is_async_logging() -> bool:
+        if ExecutionLogger.ASYNC_LOGGING is not None:
+            return ExecutionLogger.ASYNC_LOGGING
+        return UtilsString.convert_to_bool(os.getenv(ExecutionLogger.ASYNC_LOGGING_ENV, False))
+
+    def close(self):
+        """Writes out buffered records, detaches and closes file handlers of this logger. Safe to call more than once"""
+        dropped = sum(handler.dropped for _, handler in self._attached_handlers if isinstance(handler, _BoundedQueueHandler))
+        for logger, handler in self._attached_handlers:
+            logger.removeHandler(handler)
+        self._attached_handlers = []
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+        if dropped:
+            # queue handler is already detached (and queue can be full again), so warning is written into files directly
+            fn, lno, func, _ = self.logger.findCaller()
+            record = self.logger.makeRecord(self.logger.name, logging.WARNING, fn, lno,
+                                            "%s log records were dropped because log queue was full", (dropped,), None, func)
+            for handler in self._file_handlers:
+                handler.handle(record)
+        for handler in self._file_handlers:
+            handler.close()
+        self._file_handlers = []
+        ExecutionLogger._open_loggers.discard(self)
+        if dropped:
+            self.logger.warning("%s log records were dropped because log queue was full", dropped)
+
+    @staticmethod
+    def close_all():
+        for execution_logger in list(ExecutionLogger._open_loggers):
+            execution_logger.close()
+
+    def _attach(self, logger: logging.Logger, handler: logging.Handler):
+        logger.addHandler(handler)
+        self._attached_handlers.append((logger, handler))
+
+    def isEnabledFor(self, level) -> bool:
+        """Checks if messages of `level` are processed by logger or any of its handlers"""
+        if not self.logger.isEnabledFor(level):
+            return False
+        logger = self.logger
+        while logger:
+            if any(level >= handler.level for handler in logger.handlers):
+                return True
+            logger = logger.parent if logger.propagate else None
+        return logging.lastResort is not None and level >= logging.lastResort.level
 
     def info(self, msg, *args, **kwargs):
         self.logger.info(msg, *args, **kwargs)
@@ -71,3 +159,33 @@ def critical(self, msg, *args, **kwargs):
 
     def fatal(self, msg, *args, **kwargs):
         self.logger.fatal(msg, *args, **kwargs)
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Puts records into bounded queue, waiting up to `put_timeout_seconds` when it's full (then record is dropped and counted).
+    Only message itself is rendered in calling thread, everything else (formatting, I/O) is done by `QueueListener`
+    """
+
+    def __init__(self, log_queue: queue.Queue, put_timeout_seconds: float):
+        super().__init__(log_queue)
+        self.put_timeout_seconds = put_timeout_seconds
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # args are merged right away, as they could be changed by caller after logging
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put(record, timeout=self.put_timeout_seconds)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+atexit.register(ExecutionLogger.close_all)
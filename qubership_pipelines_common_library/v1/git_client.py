@@ -100,14 +100,14 @@ def push(self):
         """"""
         if not self._is_cloned():
             raise Exception("Cannot push without preliminary cloning")
-        logging.debug(f"Push into remote = {self.repo.remote().name} and branch = {self.repo.active_branch.name}")
+        logging.debug("Push into remote = %s and branch = %s", self.repo.remote().name, self.repo.active_branch.name)
         self.repo.git.push(self.repo.remote().name, self.repo.active_branch.name)
 
     def pull(self, **kwargs):
         """"""
         if not self._is_cloned():
             raise Exception("Cannot pull without preliminary cloning")
-        logging.debug(f"Pull with options: {kwargs}")
+        logging.debug("Pull with options: %s", kwargs)
         self.repo.git.pull(**kwargs)
 
     def get_file_content_utf8(self, relative_path: str):
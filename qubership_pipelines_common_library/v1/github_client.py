@@ -19,12 +19,12 @@
 import zipfile
 import requests
 
-from ghapi.all import GhApi
 from datetime import datetime, timezone
 from pathlib import Path
 from time import sleep
 
 from qubership_pipelines_common_library.v1.execution.exec_info import ExecutionInfo
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
 
 
 class GithubClient:
@@ -65,6 +65,7 @@ def __init__(self, token: str = None, api_url: str = None, **kwargs):
                 DeprecationWarning,
                 stacklevel=2
             )
+        from ghapi.all import GhApi
         self.gh = GhApi(token=token, gh_host=api_url, **kwargs)
         logging.info("Github Client configured")
 
@@ -155,7 +156,8 @@ def wait_workflow_run_execution(self, execution: ExecutionInfo, timeout_seconds:
             except Exception:
                 pass
             timeout += wait_seconds
-            logging.info(f"Waiting workflow run execution timeout {wait_seconds} seconds")
+            Metrics.poll_ticks.inc(system="github")
+            logging.info("Waiting workflow run execution timeout %s seconds", wait_seconds)
             sleep(wait_seconds)
             continue
         return execution
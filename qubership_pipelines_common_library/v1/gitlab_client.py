@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging, gitlab, time
+import logging, time
 from pathlib import Path
 
-from gitlab import GitlabGetError
 from qubership_pipelines_common_library.v1.execution.exec_info import ExecutionInfo
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
 
 
 class GitlabClient:
@@ -57,7 +58,9 @@ def __init__(self, host: str, username: str, password: str, email: str = None, *
         self.username = username
         self.email = email
         self.password = password
+        import gitlab
         self.gl = gitlab.Gitlab(url=self.host, private_token=self.password, **kwargs)
+        Instrumentation.instrument_session(getattr(self.gl, "session", None), "gitlab")
         logging.info("Gitlab Client configured for %s", self.host)
 
     def get_file_content(self, project_id: str, ref: str, file_path: str):
@@ -67,7 +70,7 @@ def get_file_content(self, project_id: str, ref: str, file_path: str):
 
     def create_file(self, project_id: str, file_path: str, content: str, ref: str, commit_message: str):
         """"""
-        logging.debug(f"Creating file {file_path} on branch {ref}...")
+        logging.debug("Creating file %s on branch %s...", file_path, ref)
         self.gl.projects.get(project_id, lazy=True).files.create(
             {'file_path': file_path,
              'branch': ref,
@@ -80,8 +83,9 @@ def create_file(self, project_id: str, file_path: str, content: str, ref: str, c
     def update_file(self, project_id: str, file_path: str, content: str, ref: str,
                     commit_message: str, create_if_not_exists: bool = False):
         """"""
+        from gitlab import GitlabGetError
         try:
-            logging.debug(f"Updating file {file_path} on branch {ref}...")
+            logging.debug("Updating file %s on branch %s...", file_path, ref)
             file = self.gl.projects.get(project_id, lazy=True).files.get(file_path=file_path, ref=ref)
             file.content = content
             file.save(branch=ref, commit_message=commit_message, author_email=self.email)
@@ -94,7 +98,7 @@ def update_file(self, project_id: str, file_path: str, content: str, ref: str,
 
     def delete_file(self, project_id: str, file_path: str, ref: str, commit_message: str):
         """"""
-        logging.debug(f"Deleting file {file_path} on branch {ref}...")
+        logging.debug("Deleting file %s on branch %s...", file_path, ref)
         self.gl.projects.get(project_id, lazy=True).files \
             .get(file_path=file_path, ref=ref).delete(branch=ref, commit_message=commit_message)
 
@@ -169,8 +173,9 @@ def wait_pipeline_execution(self, execution: ExecutionInfo, timeout_seconds: flo
                 pass
             now = time.perf_counter()
             retries += 1
+            Metrics.poll_ticks.inc(system="gitlab")
             if now - last_log_time >= 10.0:
-                logging.info(f"Made [{retries} of {estimated_max_attempts}] retries. Waiting pipeline execution {count_seconds} of {timeout_seconds}")
+                logging.info("Made [%s of %s] retries. Waiting pipeline execution %s of %s", retries, estimated_max_attempts, count_seconds, timeout_seconds)
                 last_log_time = now
             count_seconds += wait_seconds
             time.sleep(wait_seconds)
@@ -198,27 +203,27 @@ def get_latest_job(self, project_id: str, pipeline_id: str):
         pipeline = project.pipelines.get(pipeline_id, lazy=True)
 
         jobs = pipeline.jobs.list(get_all=True)
-        logging.debug(f"All jobs from the pipeline: {jobs}")
+        logging.debug("All jobs from the pipeline: %s", jobs)
 
         # get jobs from downstream pipelines
         bridges = pipeline.bridges.list(get_all=True)
-        logging.debug(f"Bridges: {bridges}")
+        logging.debug("Bridges: %s", bridges)
         for bridge in bridges:
             downstream_pipeline_data = bridge.downstream_pipeline
             downstream_project = self.gl.projects.get(downstream_pipeline_data.get('project_id'), lazy=True)
-            logging.debug(f"Getting jobs from a downstream pipeline: {downstream_pipeline_data.get('id')}...")
+            logging.debug("Getting jobs from a downstream pipeline: %s...", downstream_pipeline_data.get('id'))
             downstream_pipeline = downstream_project.pipelines.get(downstream_pipeline_data.get('id'))
             jobs.extend(downstream_pipeline.jobs.list(get_all=True))
 
         # get jobs from child pipelines
         child_pipelines = project.pipelines.list(ref=f"downstream/{pipeline_id}", source="pipeline", all=True)
-        logging.debug(f"Child pipelines: {child_pipelines}")
+        logging.debug("Child pipelines: %s", child_pipelines)
         for child_pipeline in child_pipelines:
-            logging.debug(f"Getting jobs from a child pipeline: {child_pipeline.id}...")
+            logging.debug("Getting jobs from a child pipeline: %s...", child_pipeline.id)
             child_jobs = child_pipeline.jobs.list(get_all=True)
             jobs.extend(child_jobs)
 
-        logging.debug(f"All jobs (+ jobs from downstream pipelines): {jobs}")
+        logging.debug("All jobs (+ jobs from downstream pipelines): %s", jobs)
         jobs = [j for j in jobs if j.started_at]
         jobs = sorted(jobs, key=lambda j: j.started_at, reverse=True)
         return jobs[0] if jobs else None
@@ -227,10 +232,11 @@ def download_job_artifacts(self, project_id, job_id, local_dir):
         project = self.gl.projects.get(project_id, lazy=True)
         job = project.jobs.get(job_id, lazy=True)
         local_file = Path(local_dir, f"{job_id}.zip")
+        from gitlab import GitlabGetError
         with local_file.open('wb') as f:
             try:
                 job.artifacts(streamed=True, action=f.write)
-            except gitlab.GitlabGetError as e:
+            except GitlabGetError as e:
                 if e.response_code == 404:
                     logging.warning(f"No artifacts for job {job_id}")
                     return None
@@ -273,7 +279,7 @@ def is_gitlab_project_exist(gitlab_url, gitlab_project, gitlab_token):
         import requests
         headers = {"PRIVATE-TOKEN": gitlab_token}
         request = f"{gitlab_url}/api/v4/projects/{requests.utils.quote(gitlab_project, safe='')}"
-        logging.debug(f"Sending '{request}' request...")
+        logging.debug("Sending '%s' request...", request)
         response = requests.get(request, headers=headers)
         if response.status_code == 200:
             return True
@@ -287,7 +293,7 @@ def search_group_id(gitlab_url, gitlab_project, gitlab_token):
         import requests
         headers = {"PRIVATE-TOKEN": gitlab_token}
         request = f"{gitlab_url}/api/v4/groups?search={gitlab_project}"
-        logging.debug(f"Sending '{request}' request...")
+        logging.debug("Sending '%s' request...", request)
         response = requests.get(request, headers=headers)
         if response.status_code == 200:
             groups = response.json()
@@ -309,7 +315,7 @@ def create_internal_gitlab_project(gitlab_url, gitlab_token, group_id, repo_name
             "default_branch": repo_branch
         }
         request = f"{gitlab_url}/api/v4/projects"
-        logging.debug(f"Sending '{request}' request...")
+        logging.debug("Sending '%s' request...", request)
         response = requests.post(request, headers=headers, json=data)
         if response.status_code == 201:
             response_json = response.json()
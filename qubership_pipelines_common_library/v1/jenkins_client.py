@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging, jenkins, time
+import logging, time
 
 from pathlib import Path
 from qubership_pipelines_common_library.v1.execution.exec_info import ExecutionInfo
 from qubership_pipelines_common_library.v1.utils.utils_file import UtilsFile
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
 
 
 class JenkinsClient:
@@ -49,7 +51,9 @@ def __init__(self, host: str, user: str, password: str):
         self.url = host
         self.user = user
         self.token = password
+        import jenkins
         self.server = jenkins.Jenkins(self.url, username=self.user, password=self.token)
+        Instrumentation.instrument_session(getattr(self.server, "_session", None), "jenkins")
         who_am_i = self.server.get_whoami()
         jenkins_version = self.server.get_version()
         logging.debug("JenkinsClient initialized for user '%s' and Jenkins version is '%s'",
@@ -141,8 +145,9 @@ def wait_pipeline_execution(self, execution: ExecutionInfo, timeout_seconds: flo
                 logging.error("Failed to get information about job with name '%s' and id '%s'", execution.get_name(), execution.get_id())
             now = time.perf_counter()
             retries += 1
+            Metrics.poll_ticks.inc(system="jenkins")
             if now - last_log_time >= 10.0:
-                logging.info(f"Made [{retries} of {estimated_max_attempts}] retries. Waiting pipeline execution {count_seconds} of {timeout_seconds}")
+                logging.info("Made [%s of %s] retries. Waiting pipeline execution %s of %s", retries, estimated_max_attempts, count_seconds, timeout_seconds)
                 last_log_time = now
             count_seconds += wait_seconds
             time.sleep(wait_seconds)
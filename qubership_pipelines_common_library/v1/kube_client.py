@@ -15,9 +15,6 @@
 import logging
 from enum import StrEnum
 
-from kubernetes import client, config
-from kubernetes.client import Configuration, ApiException, V1Deployment
-
 
 class ScaleMode(StrEnum):
     UP = 'Up'
@@ -43,6 +40,8 @@ def __init__(self, endpoint: str = None, token: str = None, kubeconfig_path: str
             token (str): Token used for cluster access
             kubeconfig_path (str): Path to local .kubeconfig file
         """
+        from kubernetes import client, config
+        from kubernetes.client import Configuration
         if kubeconfig_path:
             config.load_kube_config(config_file=kubeconfig_path)
         elif endpoint and token:
@@ -62,6 +61,7 @@ def namespace_exists(self, namespace: str):
         """"""
         if not namespace:
             return False
+        from kubernetes.client import ApiException
         try:
             self.core_api.read_namespace(namespace)
             return True
@@ -78,11 +78,12 @@ def deployments_exist(self, namespace: str):
     def is_namespace_scaled_to_zero(self, namespace: str):
         """"""
         all_replicas = [i.spec.replicas for i in self.__get_deployments_and_stateful_sets(namespace)]
-        logging.debug(f"StatefulSet and Deployment replica count for {namespace}: {all_replicas}")
+        logging.debug("StatefulSet and Deployment replica count for %s: %s", namespace, all_replicas)
         return len(all_replicas) == 0 or all(r == 0 for r in all_replicas)
 
     def list_not_ready_resources(self, namespace):
         """"""
+        from kubernetes.client import V1Deployment
         deployment_unavailable_replicas = [
             ResourceReplicaCount(p.metadata.name,
                                  ResourceKind.DEPLOYMENT if isinstance(p, V1Deployment) else ResourceKind.STATEFUL_SET,
@@ -93,11 +94,13 @@ def list_not_ready_resources(self, namespace):
 
     def create_namespace(self, namespace: str):
         """"""
+        from kubernetes import client
         body = client.V1Namespace(metadata=client.V1ObjectMeta(name=namespace))
         return self.core_api.create_namespace(body=body)
 
     def delete_namespaces(self, namespaces: list[str], ignore_not_found: bool = False):
         """"""
+        from kubernetes.client import ApiException
         for namespace in namespaces:
             try:
                 self.core_api.delete_namespace(namespace)
@@ -117,18 +120,21 @@ def read_config_map(self, namespace: str, config_map_name: str):
 
     def create_config_map(self, namespace: str, config_map_name: str, config_map_data: dict):
         """"""
+        from kubernetes import client
         object_meta = client.V1ObjectMeta(name=config_map_name, namespace=namespace)
         body = client.V1ConfigMap(api_version="v1", kind="ConfigMap", metadata=object_meta, data=config_map_data)
         self.core_api.create_namespaced_config_map(namespace=namespace, body=body)
 
     def patch_config_map(self, namespace: str, config_map_name: str, config_map_data: dict):
         """ Patching allows adding/removing only specified keys in config map. Removes key-value pair when value is None """
+        from kubernetes import client
         object_meta = client.V1ObjectMeta(name=config_map_name, namespace=namespace)
         body = client.V1ConfigMap(api_version="v1", kind="ConfigMap", metadata=object_meta, data=config_map_data)
         self.core_api.patch_namespaced_config_map(name=config_map_name, namespace=namespace, body=body)
 
     def replace_config_map(self, namespace: str, config_map_name: str, config_map_data: dict):
         """ Replaces all data inside existing config map with value of 'config_map_data' argument """
+        from kubernetes import client
         object_meta = client.V1ObjectMeta(name=config_map_name, namespace=namespace)
         body = client.V1ConfigMap(api_version="v1", kind="ConfigMap", metadata=object_meta, data=config_map_data)
         self.core_api.replace_namespaced_config_map(name=config_map_name, namespace=namespace, body=body)
@@ -68,7 +68,7 @@ def find_artifact_urls(self, artifact_id: str = None, version: str = None, exten
             artifact = Artifact(artifact_id=artifact_id, version=version, extension=extension)
         if not artifact.artifact_id or not artifact.version:
             raise Exception("Artifact 'artifact_id' and 'version' must be specified!")
-        logging.debug(f"Searching for '{artifact.artifact_id}' in {self.registry_url}...")
+        logging.debug("Searching for '%s' in %s...", artifact.artifact_id, self.registry_url)
         return self._search_func(artifact=artifact)
 
     def download_artifact(self, url: str, local_path: str):
@@ -80,7 +80,7 @@ def download_artifact(self, url: str, local_path: str):
         """
         self._check_init()
         self._create_dir(local_path)
-        logging.debug(f"Downloading artifact from '{url}' to '{local_path}'...")
+        logging.debug("Downloading artifact from '%s' to '%s'...", url, local_path)
         return self._download_func(url=url, local_path=local_path)
 
     def _check_init(self):
@@ -7,6 +7,7 @@
 from qubership_pipelines_common_library.v1.execution.exec_logger import ExecutionLogger
 from qubership_pipelines_common_library.v1.utils.utils_string import UtilsString
 from qubership_pipelines_common_library.v2.cli_output.cli_output import CliOutput
+from qubership_pipelines_common_library.v2.profiling.command_profiler import CommandProfiler
 
 DEFAULT_CONTEXT_FILE_PATH = 'context.yaml'
 
@@ -29,10 +30,15 @@ def utils_cli(func):
     @click.option('--cli-output-format', default='YAML', show_default=True,
                   type=click.Choice(['YAML', 'JSON', 'PRETTY_JSON'], case_sensitive=False),
                   help="Set CLI Output Format, configuring desired output format for output_params in STDOUT")
+    @click.option('--profiler', default=None,
+                  type=click.Choice(['OFF', 'TIMINGS', 'CPROFILE', 'PYINSTRUMENT'], case_sensitive=False),
+                  help="Save timings of command phases (and full profile of command execution, with CPROFILE or PYINSTRUMENT) into logs folder. Overrides PIPELINES_COMMAND_PROFILER environment variable")
     @click.pass_context
-    def wrapper(ctx, *args, log_level, cli_output_mode, cli_output_format, **kwargs):
+    def wrapper(ctx, *args, log_level, cli_output_mode, cli_output_format, profiler, **kwargs):
         ExecutionLogger.EXECUTION_LOG_LEVEL = getattr(logging, log_level.upper(), logging.INFO)
         CliOutput.configure(cli_output_mode.upper(), cli_output_format.upper())
+        if profiler:
+            CommandProfiler.configure(profiler.upper())
         _configure_global_logger(logging.getLogger(), log_level)
         _print_command_name()
         _transform_kwargs(kwargs)
@@ -41,6 +47,49 @@ def wrapper(ctx, *args, log_level, cli_output_mode, cli_output_format, **kwargs)
     return wrapper
 
 
+class LazyCommandGroup(click.Group):
+    """
+    `click.Group` that registers `ExecutionCommand` classes by classpath. Command class (and SDKs of its clients)
+    is imported only when this command is invoked, so `--help` and other commands don't pay for these imports.
+
+    Commands are wrapped with `@utils_cli` and can be mixed with regular `@cli.command` ones:
+
+        @click.group(cls=LazyCommandGroup, chain=True, lazy_commands={
+            "github-run-pipeline": "qubership_pipelines_common_library.v2.github.github_run_pipeline_command.GithubRunPipeline",
+        })
+        def cli():
+            pass
+    """
+
+    def __init__(self, *args, lazy_commands: dict[str, str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = {}
+        for name, class_path in (lazy_commands or {}).items():
+            self.add_lazy_command(name, class_path)
+
+    def add_lazy_command(self, name: str, class_path: str, help: str = None):
+        """Registers command `name` running `ExecutionCommand` located by `class_path`"""
+        self.lazy_commands[name] = (class_path, help)
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(_create_lazy_command(cmd_name, *self.lazy_commands[cmd_name]))
+        return super().get_command(ctx, cmd_name)
+
+
+def _create_lazy_command(name: str, class_path: str, help: str = None) -> click.Command:
+    @click.command(name, help=help or f"Runs {class_path.rsplit('.', 1)[-1]}")
+    @utils_cli
+    def lazy_command(**kwargs):
+        from qubership_pipelines_common_library.v1.execution.exec_command import ExecutionCommand
+        from qubership_pipelines_common_library.v2.utils.extension_utils import ExtensionLoader
+        ExtensionLoader.create_instance(class_path, ExecutionCommand, **kwargs).run()
+    return lazy_command
+
+
 def _configure_global_logger(global_logger: logging.Logger, log_level: str):
     """Configure the global logger with a specific log level and formatter."""
     log_level_value = getattr(logging, log_level.upper(), logging.INFO)
@@ -84,5 +84,5 @@ def create_execution_context(input_params: dict = None, input_params_secure: dic
     Path(context_file.get("paths.input.files")).mkdir(parents=True, exist_ok=True)
     Path(context_file.get("paths.output.files")).mkdir(parents=True, exist_ok=True)
 
-    logging.debug(f"Created context at {context_path}")
+    logging.debug("Created context at %s", context_path)
     return context_path
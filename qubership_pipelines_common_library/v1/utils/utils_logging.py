@@ -20,3 +20,21 @@ def format(self, record):
             colored = f"{self.COLOR_CODES[levelname]}{levelname}{self.COLOR_CODES['RESET']}"
             formatted = formatted.replace(levelname, colored, 1)
         return formatted
+
+
+class LazyLog:
+    """
+    Defers computing of expensive log argument until record is actually formatted, e.g.
+    `logger.debug("Folder contents: %s", LazyLog(os.listdir, path))` doesn't list folder when DEBUG level is disabled
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return str(self.func(*self.args, **self.kwargs))
+
+    def __repr__(self):
+        return repr(self.func(*self.args, **self.kwargs))
@@ -16,6 +16,8 @@ class ArtifactFinder:
 
     Providers might slightly differ in functionality, refer to the Provider docs
 
+    Several mirrored registries can be queried concurrently via `CompositeArtifactProvider`
+
     Provides different auth methods for Cloud Providers, implementing `CloudCredentialsProvider` interface
 
     When searching with ``latest=True``, the newest version is chosen by a pluggable comparer.
@@ -55,7 +57,7 @@ def find_artifact_urls(self, artifact_id: str = None, version: str = None, group
             artifact = Artifact(group_id=group_id, artifact_id=artifact_id, version=version, extension=extension)
         if not artifact.artifact_id or not artifact.version:
             raise Exception("Artifact 'artifact_id' and 'version' must be specified!")
-        logging.debug(f"Searching for '{artifact.artifact_id}:{artifact.version}' in {self.provider.get_provider_name()}...")
+        logging.debug("Searching for '%s:%s' in %s...", artifact.artifact_id, artifact.version, self.provider.get_provider_name())
         return self.provider.search_artifacts(artifact=artifact, latest=latest, comparer=self.comparer)
 
     def download_artifact(self, resource_url: str, local_path: str | Path, artifact: Artifact = None):
@@ -64,5 +66,5 @@ def download_artifact(self, resource_url: str, local_path: str | Path, artifact:
         if artifact:
             download_path = download_path.joinpath(artifact.get_filename())
         UtilsFile.create_parent_dirs(download_path)
-        logging.debug(f"Downloading artifact from '{resource_url}' to '{download_path}'...")
+        logging.debug("Downloading artifact from '%s' to '%s'...", resource_url, download_path)
         return self.provider.download_artifact(resource_url=resource_url, local_path=download_path)
@@ -2,6 +2,7 @@
 import os
 import boto3
 
+from datetime import datetime, timezone
 from enum import StrEnum
 from botocore.config import Config
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
@@ -91,6 +92,40 @@ def get_credentials(self) -> Credentials:
         else:
             raise ValueError("Need to initialize this provider with AuthType via .with_*auth_type* method first!")
 
+    @staticmethod
+    def create_client(service_name: str, credentials: Credentials):
+        """
+        Creates boto3 client using given `credentials`.
+        Expiring (assume-role) credentials are passed as botocore `RefreshableCredentials`, reading current values
+        from `credentials_cache` - so long-lived clients keep working after credentials are refreshed
+        """
+        if not credentials.expiration:
+            return boto3.client(
+                service_name=service_name,
+                config=Config(region_name=credentials.region_name),
+                aws_access_key_id=credentials.access_key,
+                aws_secret_access_key=credentials.secret_key,
+                aws_session_token=credentials.session_token,
+            )
+        import botocore.session
+        from botocore.credentials import RefreshableCredentials
+
+        def refresh() -> dict:
+            current = AwsCredentialsProvider.credentials_cache.get_current(credentials)
+            expiration = current.expiration if current.expiration.tzinfo else current.expiration.replace(tzinfo=timezone.utc)
+            return {"access_key": current.access_key, "secret_key": current.secret_key,
+                    "token": current.session_token, "expiry_time": expiration.isoformat()}
+
+        botocore_session = botocore.session.get_session()
+        # boto3 asks for credentials only when they are about to expire - by then they are already refreshed by the cache
+        botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+            metadata=refresh(), refresh_using=refresh, method="credentials-cache",
+            advisory_timeout=AwsCredentialsProvider.credentials_cache.MIN_VALIDITY_SECONDS,
+            mandatory_timeout=AwsCredentialsProvider.credentials_cache.MIN_VALIDITY_SECONDS,
+        )
+        return boto3.Session(botocore_session=botocore_session).client(
+            service_name=service_name, config=Config(region_name=credentials.region_name))
+
     def get_ecr_authorization_token(self) -> str:
         creds = self.get_credentials()
         ecr_client = boto3.client(
@@ -113,6 +148,12 @@ def _get_direct_credentials(self) -> Credentials:
         )
 
     def _get_assume_role_credentials(self) -> Credentials:
+        return self._get_cached_credentials(
+            (self.access_key, self.secret_key, self.region_name, self.role_arn, self.role_session_name),
+            self._fetch_assume_role_credentials,
+        )
+
+    def _fetch_assume_role_credentials(self) -> tuple[Credentials, datetime | None]:
         creds = self._assume_role()
         return Credentials(
             access_key=creds["AccessKeyId"],
@@ -121,7 +162,8 @@ def _get_assume_role_credentials(self) -> Credentials:
             role_arn=self.role_arn,
             role_session_name=self.role_session_name,
             region_name=self.region_name,
-        )
+            expiration=creds.get("Expiration"),
+        ), creds.get("Expiration")
 
     def _assume_role(self) -> dict:
         sts_client = boto3.client(
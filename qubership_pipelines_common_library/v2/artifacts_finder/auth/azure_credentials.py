@@ -1,6 +1,7 @@
 import os
 import requests
 
+from datetime import datetime, timedelta, timezone
 from enum import StrEnum
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials_provider import CloudCredentialsProvider
@@ -70,6 +71,9 @@ def get_credentials(self) -> Credentials:
             raise ValueError("Need to initialize this provider with AuthType via .with_*auth_type* method first!")
 
     def _get_oauth2_credentials(self) -> Credentials:
+        return self._get_cached_credentials((self.tenant_id, self._auth_data), self._fetch_oauth2_credentials)
+
+    def _fetch_oauth2_credentials(self) -> tuple[Credentials, datetime | None]:
         token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
         response = requests.post(
             token_url,
@@ -82,7 +86,9 @@ def _get_oauth2_credentials(self) -> Credentials:
         if not access_token:
             raise Exception(f"Failed to get access token from {token_url}: {response_json}")
 
+        expires_in = response_json.get("expires_in")
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=int(expires_in)) if expires_in else None
         return Credentials(
             access_token=access_token,
             tenant_id=self.tenant_id,
-        )
+        ), expires_at
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
+
+
+class CredentialsCache:
+    """
+    Thread-safe process-wide cache of fetched cloud credentials, keyed by auth parameters (secrets are only kept hashed in keys).
+
+    Credentials are reused until shortly before their expiry, and are refreshed in the background
+    `refresh_margin_seconds` before it. Refreshed values are assigned into the same `Credentials` object field by field
+    (without clearing it first), so clients holding it see new tokens without being re-created, and concurrent readers
+    always see either previous or new value.
+    Entries not read for `idle_ttl_seconds` are no longer refreshed in background - they are fetched again
+    on next read, once expired. Credentials without known expiry are not cached.
+    """
+
+    DEFAULT_REFRESH_MARGIN_SECONDS = 300
+    DEFAULT_IDLE_TTL_SECONDS = 3600
+    MIN_VALIDITY_SECONDS = 60
+    RETRY_REFRESH_SECONDS = 30
+
+    def __init__(self, refresh_margin_seconds: float = DEFAULT_REFRESH_MARGIN_SECONDS,
+                 idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS):
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._entries = {}  # key -> {"credentials", "expires_at", "fetch", "last_used", "timer"}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(key_parts: tuple) -> str:
+        return hashlib.sha256(json.dumps(key_parts, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_or_fetch(self, key_parts: tuple, fetch: Callable[[], tuple[Credentials, datetime | None]]) -> Credentials:
+        """`fetch` must return a (credentials, expires_at) pair, where `expires_at` is a timezone-aware datetime or None"""
+        key = self.make_key(key_parts)
+        credentials = self._get_valid(key)
+        Metrics.record_cache_lookup("credentials", credentials is not None)
+        if credentials:
+            return credentials
+        with self._get_key_lock(key):
+            if credentials := self._get_valid(key):
+                return credentials
+            credentials, expires_at = fetch()
+            return self._store(key, credentials, expires_at, fetch)
+
+    def get_current(self, credentials: Credentials) -> Credentials:
+        """
+        Marks given cached `credentials` as used and returns them, after fetching new values into them synchronously
+        if they are about to expire (e.g. background refresh stopped or failed). Not cached credentials are returned as is
+        """
+        with self._lock:
+            key = next((key for key, entry in self._entries.items() if entry["credentials"] is credentials), None)
+        if key is None or self._get_valid(key):
+            return credentials
+        with self._get_key_lock(key):
+            if self._get_valid(key):
+                return credentials
+            with self._lock:
+                fetch = self._entries[key]["fetch"]
+            new_credentials, expires_at = fetch()
+            return self._store(key, new_credentials, expires_at, fetch)
+
+    def stop_refreshing(self):
+        """Cancels all background refreshes, cached credentials stay usable until they expire"""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry["timer"]:
+                    entry["timer"].cancel()
+                    entry["timer"] = None
+
+    def clear(self):
+        self.stop_refreshing()
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _get_key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _get_valid(self, key: str) -> Credentials | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                entry["last_used"] = time.monotonic()
+        if entry and entry["expires_at"] - timedelta(seconds=self.MIN_VALIDITY_SECONDS) > datetime.now(timezone.utc):
+            return entry["credentials"]
+        return None
+
+    def _store(self, key: str, credentials: Credentials, expires_at: datetime | None, fetch) -> Credentials:
+        if expires_at is None:
+            return credentials
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                if entry["timer"]:
+                    entry["timer"].cancel()
+                current = entry["credentials"]
+                current.update(credentials)
+                for stale_field in set(current) - set(credentials):
+                    current.pop(stale_field, None)
+                entry["expires_at"] = expires_at
+                entry["fetch"] = fetch
+            else:
+                entry = self._entries[key] = {"credentials": credentials, "expires_at": expires_at, "fetch": fetch,
+                                              "last_used": time.monotonic(), "timer": None}
+            refresh_in = (expires_at - datetime.now(timezone.utc)).total_seconds() - self.refresh_margin_seconds
+            entry["timer"] = self._schedule_refresh(key, fetch, max(refresh_in, self.RETRY_REFRESH_SECONDS))
+            return entry["credentials"]
+
+    def _schedule_refresh(self, key: str, fetch, delay: float) -> threading.Timer:
+        timer = threading.Timer(delay, self._refresh, args=(key, fetch))
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def _refresh(self, key: str, fetch):
+        with self._get_key_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+            if not entry:
+                return
+            if time.monotonic() - entry["last_used"] > self.idle_ttl_seconds:
+                logging.debug("Credentials were not used for %ss, stopping their background refresh", self.idle_ttl_seconds)
+                with self._lock:
+                    entry["timer"] = None
+                return
+            try:
+                credentials, expires_at = fetch()
+            except Exception as e:
+                logging.warning(f"Background credentials refresh failed, retrying in {self.RETRY_REFRESH_SECONDS}s: {e}")
+                with self._lock:
+                    if entry["expires_at"] > datetime.now(timezone.utc):
+                        entry["timer"] = self._schedule_refresh(key, fetch, self.RETRY_REFRESH_SECONDS)
+                return
+            self._store(key, credentials, expires_at, fetch)
+            logging.debug("Credentials were refreshed in background")
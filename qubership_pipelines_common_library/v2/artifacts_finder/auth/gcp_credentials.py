@@ -1,5 +1,6 @@
 import json
 import os
+from datetime import datetime
 from enum import StrEnum
 from pathlib import Path
 
@@ -78,6 +79,15 @@ def with_env_vars(self, prefix: str = ""):
         return self
 
     def get_credentials(self) -> Credentials:
+        if self._auth_type == self.AuthType.SA_KEY:
+            key_parts = (self._auth_type, self.service_account_key_content, self.scopes)
+        elif self._auth_type == self.AuthType.OIDC_CREDS:
+            key_parts = (self._auth_type, self.oidc_credential_source, self.audience, self.subject_token_type, self.scopes)
+        else:
+            raise ValueError("Need to initialize this provider with AuthType via .with_*auth_type* method first!")
+        return self._get_cached_credentials(key_parts, self._fetch_credentials)
+
+    def _fetch_credentials(self) -> tuple[Credentials, datetime | None]:
         if self._auth_type == self.AuthType.SA_KEY:
             from google.oauth2 import service_account
             google_creds = service_account.Credentials.from_service_account_info(
@@ -103,4 +113,5 @@ def get_credentials(self) -> Credentials:
         )
         if self._auth_type == self.AuthType.SA_KEY:
             creds.service_account_key_content = self.service_account_key_content
-        return creds
+        # google-auth keeps refreshing 'google_credentials_object' itself, cached entry refresh also renews the plain token
+        return creds, google_creds.expiry
@@ -3,6 +3,8 @@
 from pathlib import Path
 from abc import ABC, abstractmethod
 from qubership_pipelines_common_library.v2.artifacts_finder.model.artifact import Artifact
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
 
 
 class ArtifactProvider(ABC):
@@ -14,13 +16,27 @@ def __init__(self, params: dict = None, **kwargs):
         self.params = params if params else {}
         self._session = requests.Session()
         self._session.verify = self.params.get('verify', True)
+        Instrumentation.instrument_session(self._session, type(self).__name__)
         self.timeout = self.params.get('timeout', None)
 
     def generic_download(self, resource_url: str, local_path: str | Path):
         response = self._session.get(url=resource_url, timeout=self.timeout)
         response.raise_for_status()
         with open(local_path, 'wb') as file:
-            file.write(response.content)
+            written = file.write(response.content)
+        Metrics.downloaded_bytes.inc(written, system=type(self).__name__)
+
+    def handles_resource_url(self, resource_url: str) -> bool:
+        """
+        Whether `resource_url` belongs to registry of this provider, i.e. its credentials can be sent to it
+        (used to pick provider for URLs that were not returned by its search). Not supported by default
+        """
+        return False
+
+    @staticmethod
+    def _url_host(url: str) -> str:
+        from urllib.parse import urlsplit
+        return (urlsplit(url).hostname or "").lower() if url and "://" in url else ""
 
     @abstractmethod
     def download_artifact(self, resource_url: str, local_path: str | Path, **kwargs) -> None:
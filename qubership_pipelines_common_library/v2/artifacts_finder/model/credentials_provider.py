@@ -1,15 +1,33 @@
 from abc import ABC, abstractmethod
 
+from qubership_pipelines_common_library.v2.artifacts_finder.auth.credentials_cache import CredentialsCache
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
 
 
 class CloudCredentialsProvider(ABC):
-    """Base class for all cloud credentials"""
+    """
+    Base class for all cloud credentials
+
+    Fetched short-lived credentials (tokens) are shared via process-wide `credentials_cache` and refreshed before expiry.
+    Call `.with_cache(False)` to always fetch fresh credentials.
+    """
+
+    credentials_cache = CredentialsCache()
+    _use_cache = True
 
     @abstractmethod
     def get_credentials(self) -> Credentials:
         pass
 
+    def with_cache(self, use_cache: bool = True):
+        self._use_cache = use_cache
+        return self
+
+    def _get_cached_credentials(self, key_parts: tuple, fetch) -> Credentials:
+        if not self._use_cache:
+            return fetch()[0]
+        return self.credentials_cache.get_or_fetch((type(self).__name__, *key_parts), fetch)
+
     def validate_mandatory_attrs(self, attrs_names) -> None:
         missing_attrs = [attr for attr in attrs_names if getattr(self, attr, None) is None]
         if missing_attrs:
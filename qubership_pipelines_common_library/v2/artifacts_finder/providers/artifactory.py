@@ -24,6 +24,9 @@ def __init__(self, registry_url: str, username: str = None, password: str = None
             from requests.auth import HTTPBasicAuth
             self._session.auth = HTTPBasicAuth(username, password)
 
+    def handles_resource_url(self, resource_url: str) -> bool:
+        return bool(self._url_host(resource_url)) and self._url_host(resource_url) == self._url_host(self.registry_url)
+
     def download_artifact(self, resource_url: str, local_path: str | Path, **kwargs) -> None:
         return self.generic_download(resource_url=resource_url, local_path=local_path)
 
@@ -77,7 +80,7 @@ def _search_wildcard_versions(self, artifact: Artifact, latest: bool = False, co
 
     def _gavc_search(self, search_params: dict, artifact_id: str) -> list[dict]:
         search_api_url = f"{self.registry_url}/api/search/gavc"
-        logging.debug(f"Search URL: {search_api_url}"f"\nSearch Parameters: {search_params}")
+        logging.debug("Search URL: %s\nSearch Parameters: %s", search_api_url, search_params)
         response = self._session.get(url=search_api_url, params=search_params, timeout=self.timeout)
         if response.status_code != 200:
             raise Exception(f"Could not find '{artifact_id}' - search request returned {response.status_code}!")
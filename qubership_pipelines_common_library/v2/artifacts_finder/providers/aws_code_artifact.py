@@ -1,35 +1,71 @@
 import logging
-import boto3
+import threading
 
 from pathlib import Path
-from botocore.config import Config
+from qubership_pipelines_common_library.v2.artifacts_finder.auth.aws_credentials import AwsCredentialsProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.model.artifact import Artifact
 from qubership_pipelines_common_library.v2.artifacts_finder.model.artifact_provider import ArtifactProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
 from qubership_pipelines_common_library.v2.artifacts_finder.utils.artifact_finder_utils import ArtifactFinderUtils
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
 
 
 class AwsCodeArtifactProvider(ArtifactProvider):
 
-    def __init__(self, credentials: Credentials, domain: str, repository: str, package_format: str = "generic", **kwargs):
+    DEFAULT_MAX_WORKERS = 8
+
+    # boto3 clients are shared across provider instances
+    _clients_cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, credentials: Credentials, domain: str, repository: str, package_format: str = "generic",
+                 max_workers: int = DEFAULT_MAX_WORKERS, **kwargs):
         """
         Initializes this client to work with **AWS Code Artifact** for generic or maven artifacts.
         Requires `Credentials` provided by `AwsCredentialsProvider`.
 
         This provider supports resolving `-SNAPSHOT` artifacts into latest version and searching for versions with asterisk-wildcards.
+
+        Package listings are paginated, and per-namespace version/asset listings are executed concurrently
+        (up to `max_workers` parallel requests).
         """
         super().__init__(**kwargs)
         self._credentials = credentials
         self._domain = domain
         self._repository = repository
         self._format = package_format
-        self._aws_client = boto3.client(
-            service_name='codeartifact',
-            config=Config(region_name=credentials.region_name),
-            aws_access_key_id=credentials.access_key,
-            aws_secret_access_key=credentials.secret_key,
-            aws_session_token=credentials.session_token,
-        )
+        self._max_workers = max_workers
+        self._aws_client = self._get_cached_client(credentials, domain)
+
+    @staticmethod
+    def _cache_key(credentials: Credentials, domain: str) -> tuple:
+        if credentials.expiration:
+            # expiring credentials are refreshed in place by credentials cache, client is bound to that object
+            return domain, credentials.region_name, id(credentials)
+        return domain, credentials.region_name, credentials.access_key, credentials.session_token
+
+    @classmethod
+    def _get_cached_client(cls, credentials: Credentials, domain: str):
+        cache_key = cls._cache_key(credentials, domain)
+        with cls._cache_lock:
+            cached = cls._clients_cache.get(cache_key)
+        if cached and (not credentials.expiration or cached[0] is credentials):
+            return cached[1]
+        client = AwsCredentialsProvider.create_client('codeartifact', credentials)
+        with cls._cache_lock:
+            cached = cls._clients_cache.get(cache_key)
+            if cached and (not credentials.expiration or cached[0] is credentials):
+                return cached[1]
+            cls._clients_cache[cache_key] = (credentials, client)
+            return client
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._cache_lock:
+            cls._clients_cache.clear()
+
+    def handles_resource_url(self, resource_url: str) -> bool:
+        return "://" not in resource_url and len(resource_url.split("/")) == 4
 
     def download_artifact(self, resource_url: str, local_path: str | Path, **kwargs) -> None:
         """ 'resource_url' is actually AWS-specific resource_id, expected to be "namespace/package/version/asset_name" """
@@ -41,7 +77,8 @@ def download_artifact(self, resource_url: str, local_path: str | Path, **kwargs)
             asset=asset_parts[3]
         )
         with open(local_path, 'wb') as file:
-            file.write(response.get('asset').read())
+            written = file.write(response.get('asset').read())
+        Metrics.downloaded_bytes.inc(written, system=type(self).__name__)
 
     def search_artifacts(self, artifact: Artifact, latest: bool = False, comparer=None, **kwargs) -> list[str]:
         namespaces = self._resolve_namespaces(artifact)
@@ -50,21 +87,21 @@ def search_artifacts(self, artifact: Artifact, latest: bool = False, comparer=No
 
         if artifact.has_version_wildcard():
             candidates = self._search_wildcard_versions(artifact, namespaces, latest=latest, comparer=comparer)
-        else:
+        elif artifact.is_snapshot():
+            resolved_versions = ArtifactFinderUtils.run_concurrently(
+                lambda namespace: self._resolve_snapshot_version(artifact, namespace), namespaces, self._max_workers)
             candidates = []
-            for namespace in namespaces:
-                if artifact.is_snapshot():
-                    resolved = self._resolve_snapshot_version(artifact, namespace)
-                    if not resolved:
-                        continue
-                    logging.debug(f"Resolved SNAPSHOT version '{artifact.version}' -> '{resolved}' (namespace: {namespace})")
-                    candidates.append((namespace, resolved))
-                else:
-                    candidates.append((namespace, artifact.version))
+            for namespace, resolved in zip(namespaces, resolved_versions):
+                if not resolved:
+                    continue
+                logging.debug("Resolved SNAPSHOT version '%s' -> '%s' (namespace: %s)", artifact.version, resolved, namespace)
+                candidates.append((namespace, resolved))
+        else:
+            candidates = [(namespace, artifact.version) for namespace in namespaces]
 
-        results = []
-        for namespace, package_version in candidates:
-            results.extend(self._collect_assets(artifact, namespace, package_version))
+        assets_per_candidate = ArtifactFinderUtils.run_concurrently(
+            lambda candidate: self._collect_assets(artifact, *candidate), candidates, self._max_workers)
+        results = [url for assets in assets_per_candidate for url in assets]
         logging.info(f"AWS search results: {results}")
         return results
 
@@ -74,14 +111,13 @@ def get_provider_name(self) -> str:
     def _resolve_namespaces(self, artifact: Artifact) -> list[str]:
         if artifact.group_id:
             return [artifact.group_id]
-        list_packages_response = self._aws_client.list_packages(
+        pages = self._aws_client.get_paginator('list_packages').paginate(
             domain=self._domain, repository=self._repository,
             format=self._format, packagePrefix=artifact.artifact_id
         )
-        logging.debug(f"list_packages_response: {list_packages_response}")
-        namespaces = [package.get('namespace') for package in list_packages_response.get('packages')
+        namespaces = [package.get('namespace') for page in pages for package in page.get('packages', [])
                       if package.get('package') == artifact.artifact_id]
-        logging.debug(f"namespaces: {namespaces}")
+        logging.debug("namespaces: %s", namespaces)
         if not namespaces:
             logging.warning(f"Found no packages with artifactId = {artifact.artifact_id}!")
         elif len(namespaces) > 1:
@@ -92,10 +128,12 @@ def _search_wildcard_versions(self, artifact: Artifact, namespaces: list[str],
                                   latest: bool = False, comparer=None) -> list[tuple[str, str]]:
         # no server-side version wildcard support -> filter client-side
         version_pattern = ArtifactFinderUtils.wildcard_to_regex(artifact.version)
+        versions_per_namespace = ArtifactFinderUtils.run_concurrently(
+            lambda namespace: self._list_all_package_versions(artifact, namespace), namespaces, self._max_workers)
         candidates = [
             (namespace, ver)
-            for namespace in namespaces
-            for ver in self._list_all_package_versions(artifact, namespace)
+            for namespace, versions in zip(namespaces, versions_per_namespace)
+            for ver in versions
             if version_pattern.fullmatch(ver)
         ]
         if latest:
@@ -106,39 +144,27 @@ def _search_wildcard_versions(self, artifact: Artifact, namespaces: list[str],
     def _collect_assets(self, artifact: Artifact, namespace: str, package_version: str) -> list[str]:
         results = []
         try:
-            assets_response = self._aws_client.list_package_version_assets(
+            pages = self._aws_client.get_paginator('list_package_version_assets').paginate(
                 domain=self._domain, repository=self._repository,
                 format=self._format, package=artifact.artifact_id,
                 packageVersion=package_version, namespace=namespace
             )
-            for asset in assets_response.get('assets'):
-                if asset.get('name').lower().endswith(artifact.extension.lower()):
-                    results.append(f"{assets_response.get('namespace')}/{assets_response.get('package')}/"
-                                   f"{assets_response.get('version')}/{asset.get('name')}")
+            for assets_response in pages:
+                for asset in assets_response.get('assets', []):
+                    if asset.get('name').lower().endswith(artifact.extension.lower()):
+                        results.append(f"{assets_response.get('namespace')}/{assets_response.get('package')}/"
+                                       f"{assets_response.get('version')}/{asset.get('name')}")
         except Exception:
             logging.warning(f"Specific version ({package_version}) of package ({namespace}.{artifact.artifact_id}) not found!")
         return results
 
     def _list_all_package_versions(self, artifact: Artifact, namespace: str) -> list[str]:
-        versions = []
-        next_token = None
-        while True:
-            kwargs = {
-                'domain': self._domain,
-                'repository': self._repository,
-                'format': self._format,
-                'package': artifact.artifact_id,
-                'namespace': namespace,
-            }
-            if next_token:
-                kwargs['nextToken'] = next_token
-
-            response = self._aws_client.list_package_versions(**kwargs)
-            versions.extend(entry.get('version', '') for entry in response.get('versions', []))
-
-            next_token = response.get('nextToken')
-            if not next_token:
-                return versions
+        pages = self._aws_client.get_paginator('list_package_versions').paginate(
+            domain=self._domain, repository=self._repository,
+            format=self._format, package=artifact.artifact_id,
+            namespace=namespace
+        )
+        return [entry.get('version', '') for page in pages for entry in page.get('versions', [])]
 
     def _resolve_snapshot_version(self, artifact: Artifact, namespace: str) -> str | None:
         candidate_versions = []
@@ -148,7 +174,7 @@ def _resolve_snapshot_version(self, artifact: Artifact, namespace: str) -> str |
                 candidate_versions.append((parsed[1], ver))
 
         if not candidate_versions:
-            logging.debug(f"No snapshot versions found for {artifact.artifact_id}:{artifact.version} in namespace '{namespace}'")
+            logging.debug("No snapshot versions found for %s:%s in namespace '%s'", artifact.artifact_id, artifact.version, namespace)
             return None
 
         candidate_versions.sort(key=lambda x: x[0], reverse=True)
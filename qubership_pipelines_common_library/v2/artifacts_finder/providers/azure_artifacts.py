@@ -1,5 +1,8 @@
+import hashlib
 import logging
 import re
+import threading
+import time
 
 from pathlib import Path
 from requests.auth import HTTPBasicAuth
@@ -7,24 +10,51 @@
 from qubership_pipelines_common_library.v2.artifacts_finder.model.artifact_provider import ArtifactProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
 from qubership_pipelines_common_library.v2.artifacts_finder.utils.artifact_finder_utils import ArtifactFinderUtils
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
 
 
 class AzureArtifactsProvider(ArtifactProvider):
 
-    def __init__(self, credentials: Credentials, organization: str, project: str, feed: str, **kwargs):
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_CACHE_TTL_SECONDS = 60
+
+    # Package version lists are shared across provider instances with the same feed and credentials
+    _versions_cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, credentials: Credentials, organization: str, project: str, feed: str,
+                 max_workers: int = DEFAULT_MAX_WORKERS, cache_ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS, **kwargs):
         """
         Initializes this client to work with **Azure Artifacts** for generic artifacts.
         Requires `Credentials` provided by `AzureCredentialsProvider`.
 
         This provider supports resolving `-SNAPSHOT` artifacts into latest version (in maven-format feeds)
         and searching for versions with asterisk-wildcards.
+
+        Versions of all matching packages are requested concurrently (up to `max_workers` parallel requests),
+        and each package's version list is cached for `cache_ttl_seconds` (0 disables caching).
         """
         super().__init__(**kwargs)
         self._credentials = credentials
-        self._session.auth = HTTPBasicAuth("", self._credentials.access_token)
+        # Token is read per request, so refreshed credentials are picked up by this session
+        self._session.auth = lambda request: HTTPBasicAuth("", self._credentials.access_token)(request)
         self.organization = organization
         self.project = project
         self.feed = feed
+        self._max_workers = max_workers
+        self._cache_ttl_seconds = cache_ttl_seconds
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._cache_lock:
+            cls._versions_cache.clear()
+
+    def handles_resource_url(self, resource_url: str) -> bool:
+        host = self._url_host(resource_url)
+        if host == f"{self.organization.lower()}.pkgs.visualstudio.com":
+            return True
+        return host in ("pkgs.dev.azure.com", "feeds.dev.azure.com") and \
+            resource_url.split("://", 1)[1].split("/")[1].lower() == self.organization.lower()
 
     def download_artifact(self, resource_url: str, local_path: str | Path, **kwargs) -> None:
         return self.generic_download(resource_url=resource_url, local_path=local_path)
@@ -38,11 +68,10 @@ def search_artifacts(self, artifact: Artifact, latest: bool = False, comparer=No
             acceptable_versions.append(timestamp_version_match.group(1) + "SNAPSHOT")
 
         result_urls = []
-        for feed_pkg in self._search_packages(artifact):
-            pkg_links = feed_pkg.get("_links", {})
+        for pkg_links, pkg_versions in self._list_versions_for_packages(self._search_packages(artifact)):
             # Filter by acceptable versions (stores snapshot versions literally: "5.0.0-SNAPSHOT")
             feed_version = [
-                f for f in self._list_package_versions(pkg_links)
+                f for f in pkg_versions
                 if f.get("protocolMetadata", {}).get("data", {}).get("version") in acceptable_versions
             ]
             if not feed_version:
@@ -67,9 +96,8 @@ def _search_wildcard_versions(self, artifact: Artifact, latest: bool = False, co
         # no server-side version wildcard support -> filter client-side
         version_pattern = ArtifactFinderUtils.wildcard_to_regex(artifact.version)
         candidates = []
-        for feed_pkg in self._search_packages(artifact):
-            pkg_links = feed_pkg.get("_links", {})
-            for version_entry in self._list_package_versions(pkg_links):
+        for pkg_links, pkg_versions in self._list_versions_for_packages(self._search_packages(artifact)):
+            for version_entry in pkg_versions:
                 version = version_entry.get("protocolMetadata", {}).get("data", {}).get("version", "")
                 if not version_pattern.fullmatch(version):
                     continue
@@ -99,23 +127,54 @@ def _search_packages(self, artifact: Artifact) -> list[dict]:
             logging.error(f"Feeds search error ({feeds_response.status_code}) response: {feeds_response_json}")
             raise Exception(f"Could not find '{artifact.artifact_id}' - search request returned {feeds_response.status_code}!")
 
-        logging.debug(f"Feeds search response: {feeds_response_json}")
+        logging.debug("Feeds search response: %s", feeds_response_json)
         packages = feeds_response_json.get("value", [])
         if not packages:
             logging.warning("No packages were found.")
         elif len(packages) > 1:
-            logging.debug(f"Found multiple packages (groups) for '{artifact.artifact_id}', processing all")
+            logging.debug("Found multiple packages (groups) for '%s', processing all", artifact.artifact_id)
         return packages
 
+    def _list_versions_for_packages(self, packages: list[dict]) -> list[tuple[dict, list[dict]]]:
+        # Returns (package links, package versions) pairs, in the same order as found packages
+        links = [feed_pkg.get("_links", {}) for feed_pkg in packages]
+        versions = ArtifactFinderUtils.run_concurrently(self._list_package_versions, links, self._max_workers)
+        return list(zip(links, versions))
+
     def _list_package_versions(self, pkg_links: dict) -> list[dict]:
         pkg_versions_url = pkg_links.get("versions", {}).get("href", "")
         if not pkg_versions_url:
             return []
-        response = self._session.get(url=pkg_versions_url, params={"isDeleted": "false"}, timeout=self.timeout)
+        cache_key = self._versions_cache_key(pkg_versions_url)
+        if self._cache_ttl_seconds > 0:
+            with self._cache_lock:
+                self._evict_expired_versions()
+                cached = self._versions_cache.get(cache_key)
+            Metrics.record_cache_lookup("azure_artifacts_versions", cached is not None)
+            if cached:
+                return list(cached[1])
+        # Version URLs are not needed - only protocol metadata and file names are used
+        response = self._session.get(url=pkg_versions_url, params={"isDeleted": "false", "includeUrls": "false"},
+                                     timeout=self.timeout)
         if response.status_code != 200:
             logging.warning(f"Skipping package, versions request returned {response.status_code}")
             return []
-        return response.json().get("value", [])
+        versions = response.json().get("value", [])
+        if self._cache_ttl_seconds > 0:
+            with self._cache_lock:
+                self._versions_cache[cache_key] = (time.monotonic() + self._cache_ttl_seconds, list(versions))
+        return versions
+
+    def _versions_cache_key(self, pkg_versions_url: str) -> tuple:
+        # token is only kept hashed, it identifies credentials that listed versions are visible with
+        token_hash = hashlib.sha256(str(self._credentials.access_token).encode()).hexdigest()
+        return self.organization, self.project, self.feed, token_hash, pkg_versions_url
+
+    def _evict_expired_versions(self):
+        """Must be called under `_cache_lock`"""
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _) in self._versions_cache.items() if expires_at <= now]:
+            del self._versions_cache[key]
 
     @staticmethod
     def _select_release_file(version_entry: dict, artifact: Artifact) -> dict | None:
@@ -142,7 +201,7 @@ def _resolve_snapshot_file(version_entry: dict, artifact: Artifact) -> dict | No
             return None
         candidate_files.sort(key=lambda x: (x[0], x[1]), reverse=True)
         target_file = candidate_files[0][2]
-        logging.debug(f"Resolved SNAPSHOT version '{artifact.version}' -> '{target_file.get('name')}'")
+        logging.debug("Resolved SNAPSHOT version '%s' -> '%s'", artifact.version, target_file.get('name'))
         return target_file
 
     def _build_download_url(self, pkg_links: dict, version_entry: dict, file_name: str) -> str:
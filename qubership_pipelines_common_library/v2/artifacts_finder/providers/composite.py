@@ -0,0 +1,216 @@
+import logging
+import re
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+from qubership_pipelines_common_library.v2.artifacts_finder.model.artifact import Artifact
+from qubership_pipelines_common_library.v2.artifacts_finder.model.artifact_provider import ArtifactProvider
+from qubership_pipelines_common_library.v2.artifacts_finder.utils.artifact_finder_utils import ArtifactFinderUtils
+
+
+@dataclass
+class ProviderHealth:
+    failures: int = 0
+    demoted_until: float = 0.0
+    last_latency: float | None = None
+
+
+class CompositeArtifactProvider(ArtifactProvider):
+
+    DEFAULT_MAX_FAILURES = 2
+    DEFAULT_DEMOTION_SECONDS = 300
+
+    class Strategy(StrEnum):
+        FIRST_SUCCESS = 'FIRST_SUCCESS'
+        PRIORITY = 'PRIORITY'
+        MERGE_ALL = 'MERGE_ALL'
+
+    def __init__(self, providers: list[ArtifactProvider], strategy: str = Strategy.FIRST_SUCCESS,
+                 provider_timeout_seconds: float = None, slow_threshold_seconds: float = None,
+                 max_failures: int = DEFAULT_MAX_FAILURES, demotion_seconds: float = DEFAULT_DEMOTION_SECONDS, **kwargs):
+        """
+        Queries several configured providers (e.g. mirrors in Nexus, Artifactory and a cloud registry) concurrently.
+
+        `providers` are listed in priority order. Supported `strategy` values:
+          - `FIRST_SUCCESS`: returns results of whichever provider first finds anything
+          - `PRIORITY`: returns non-empty results of the highest-priority provider, without waiting for lower-priority ones
+            once higher-priority ones are done
+          - `MERGE_ALL`: returns de-duplicated results of all providers, in priority order.
+            With `latest=True`, only the latest of them is returned (versions are compared with the given `comparer`)
+
+        Each provider gets `provider_timeout_seconds` to respond (no limit by default).
+        Providers that fail or time out (or respond slower than `slow_threshold_seconds`) `max_failures` times in a row
+        are demoted for `demotion_seconds`: they are queried only after healthy providers, and only if those found nothing.
+
+        URLs returned by search are downloaded by provider that found them. Other URLs are downloaded only by provider
+        whose registry they belong to (see `ArtifactProvider.handles_resource_url`), so credentials are not sent to other hosts.
+        """
+        super().__init__(**kwargs)
+        if not providers:
+            raise Exception("At least one artifact provider is required for CompositeArtifactProvider!")
+        self.providers = list(providers)
+        self.strategy = self.Strategy(str(strategy).upper())
+        self.provider_timeout_seconds = provider_timeout_seconds
+        self.slow_threshold_seconds = slow_threshold_seconds
+        self.max_failures = max_failures
+        self.demotion_seconds = demotion_seconds
+        self._health = {id(provider): ProviderHealth() for provider in self.providers}
+        self._resource_owners = {}
+        self._lock = threading.Lock()
+
+    def download_artifact(self, resource_url: str, local_path: str | Path, **kwargs) -> None:
+        with self._lock:
+            owner = self._resource_owners.get(resource_url)
+        if owner:
+            return owner.download_artifact(resource_url=resource_url, local_path=local_path, **kwargs)
+
+        # URL was not returned by previous search - only provider of its registry gets it (and its credentials)
+        healthy, demoted = self._ordered_providers()
+        owner = next((provider for provider in healthy + demoted if provider.handles_resource_url(resource_url)), None)
+        if not owner:
+            raise Exception(f"'{resource_url}' does not belong to registry of any configured provider: {self._names(self.providers)}")
+        return owner.download_artifact(resource_url=resource_url, local_path=local_path, **kwargs)
+
+    def search_artifacts(self, artifact: Artifact, **kwargs) -> list[str]:
+        healthy, demoted = self._ordered_providers()
+        results = self._search_with(healthy, artifact, **kwargs)
+        if not results and demoted:
+            logging.debug("Nothing found in healthy providers, querying demoted ones: %s", self._names(demoted))
+            results = self._search_with(demoted, artifact, **kwargs)
+        return results
+
+    def get_provider_name(self) -> str:
+        return f"composite({', '.join(self._names(self.providers))})"
+
+    def get_health(self, provider: ArtifactProvider) -> ProviderHealth:
+        return self._health[id(provider)]
+
+    def _search_with(self, providers: list[ArtifactProvider], artifact: Artifact, **kwargs) -> list[str]:
+        if not providers:
+            return []
+        executor = ThreadPoolExecutor(max_workers=len(providers))
+        try:
+            started_at = time.perf_counter()
+            futures = {executor.submit(self._timed_search, provider, artifact, **kwargs): provider for provider in providers}
+            deadline = started_at + self.provider_timeout_seconds if self.provider_timeout_seconds is not None else None
+            results = {}  # provider -> urls, for finished providers
+            pending = set(futures)
+            while pending:
+                timeout = max(0.0, deadline - time.perf_counter()) if deadline is not None else None
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    provider = futures[future]
+                    results[provider] = self._collect_result(provider, future)
+                if winner := self._pick_winner(providers, results):
+                    self._record_timeouts(pending, futures, skipped=True)
+                    return self._register_owner(winner, results[winner])
+            self._record_timeouts(pending, futures)
+            if self.strategy is self.Strategy.MERGE_ALL:
+                merged = []
+                for provider in providers:
+                    for url in results.get(provider) or []:
+                        if url not in merged:
+                            merged.append(url)
+                            self._register_owner(provider, [url])
+                if kwargs.get("latest") and len(merged) > 1:
+                    # each provider returned its own latest - the latest among them is chosen again
+                    return [ArtifactFinderUtils.select_latest([(self._version_of(artifact, url), url) for url in merged],
+                                                              kwargs.get("comparer"))]
+                return merged
+            # Timed-out providers are skipped - pick the highest-priority one among finished
+            if winner := next((provider for provider in providers if results.get(provider)), None):
+                return self._register_owner(winner, results[winner])
+            return []
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _pick_winner(self, providers: list[ArtifactProvider], results: dict) -> ArtifactProvider | None:
+        if self.strategy is self.Strategy.FIRST_SUCCESS:
+            return next((provider for provider, urls in results.items() if urls), None)
+        if self.strategy is self.Strategy.PRIORITY:
+            for provider in providers:
+                if provider not in results:
+                    return None  # higher-priority provider is still running
+                if results[provider]:
+                    return provider
+        return None
+
+    @staticmethod
+    def _timed_search(provider: ArtifactProvider, artifact: Artifact, **kwargs) -> tuple[list[str], float]:
+        started_at = time.perf_counter()
+        urls = provider.search_artifacts(artifact=artifact, **kwargs)
+        return urls, time.perf_counter() - started_at
+
+    def _collect_result(self, provider: ArtifactProvider, future) -> list[str] | None:
+        try:
+            urls, latency = future.result()
+        except Exception as e:
+            logging.warning(f"Artifact search in '{provider.get_provider_name()}' failed: {e}")
+            self._record_failure(provider)
+            return None
+        slow = self.slow_threshold_seconds is not None and latency > self.slow_threshold_seconds
+        with self._lock:
+            health = self._health[id(provider)]
+            health.last_latency = latency
+        if slow:
+            logging.warning(f"Artifact search in '{provider.get_provider_name()}' was slow ({latency:.2f}s)")
+            self._record_failure(provider)
+        else:
+            with self._lock:
+                health.failures = 0
+                health.demoted_until = 0.0
+        return urls
+
+    def _record_timeouts(self, pending: set, futures: dict, skipped: bool = False):
+        for future in pending:
+            provider = futures[future]
+            if skipped:
+                logging.debug("Not waiting for '%s' - result is already chosen", provider.get_provider_name())
+                continue
+            logging.warning(f"Artifact search in '{provider.get_provider_name()}' timed out "
+                            f"after {self.provider_timeout_seconds}s")
+            self._record_failure(provider)
+
+    def _record_failure(self, provider: ArtifactProvider):
+        with self._lock:
+            health = self._health[id(provider)]
+            health.failures += 1
+            if health.failures >= self.max_failures:
+                health.demoted_until = time.monotonic() + self.demotion_seconds
+                logging.warning(f"Demoting '{provider.get_provider_name()}' for {self.demotion_seconds}s "
+                                f"after {health.failures} consecutive failures")
+
+    def _ordered_providers(self) -> tuple[list[ArtifactProvider], list[ArtifactProvider]]:
+        now = time.monotonic()
+        with self._lock:
+            healthy = [p for p in self.providers if self._health[id(p)].demoted_until <= now]
+            demoted = [p for p in self.providers if self._health[id(p)].demoted_until > now]
+        return healthy, demoted
+
+    def _register_owner(self, provider: ArtifactProvider, urls: list[str]) -> list[str]:
+        with self._lock:
+            for url in urls:
+                self._resource_owners.setdefault(url, provider)
+        return urls
+
+    @staticmethod
+    def _version_of(artifact: Artifact, url: str) -> str:
+        """Extracts version from artifact file name, which is present in URLs (or resource ids) of all providers"""
+        prefix, suffix = f"{artifact.artifact_id}-", f".{artifact.extension}"
+        segments = [segment for segment in re.split(r"[/:]", unquote(urlparse(url).path)) if segment]
+        file_name = next((segment for segment in reversed(segments) if segment.startswith(prefix) and segment.endswith(suffix)),
+                         segments[-1] if segments else url)
+        if file_name.startswith(prefix) and file_name.endswith(suffix):
+            return file_name[len(prefix):-len(suffix)]
+        return file_name
+
+    @staticmethod
+    def _names(providers: list[ArtifactProvider]) -> list[str]:
+        return [provider.get_provider_name() for provider in providers]
@@ -7,38 +7,58 @@
 from qubership_pipelines_common_library.v2.artifacts_finder.model.artifact_provider import ArtifactProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
 from qubership_pipelines_common_library.v2.artifacts_finder.utils.artifact_finder_utils import ArtifactFinderUtils
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
 
 
 class GcpArtifactRegistryProvider(ArtifactProvider):
 
     GAR_URL_PREFIX = "https://artifactregistry.googleapis.com/download/v1/"
     GAR_URL_SUFFIX = ":download?alt=media"
+    DEFAULT_PAGE_SIZE = 1000
+    VERSIONS_ORDER_BY = "create_time desc"
 
-    def __init__(self, credentials: Credentials, project: str, region_name: str, repository: str, **kwargs):
+    def __init__(self, credentials: Credentials, project: str, region_name: str, repository: str,
+                 page_size: int = DEFAULT_PAGE_SIZE, use_versions_api: bool = False, **kwargs):
         """
         Initializes this client to work with **GCP Artifact Registry** for generic artifacts.
         Requires `Credentials` provided by `GcpCredentialsProvider`.
 
         This provider supports resolving `-SNAPSHOT` artifacts into latest version (in maven-format repositories)
         and searching for versions with asterisk-wildcards.
+
+        `page_size` is passed to every list request, so large repositories are fetched in fewer round-trips.
+
+        With `use_versions_api=True`, wildcard searches with ``latest=True`` query the `ListVersions` API
+        ordered by creation time (newest first) and only list files of the first matching version,
+        instead of scanning all files of all versions. In this mode "latest" means "most recently created",
+        and the configured comparer is not used.
         """
         super().__init__(**kwargs)
         self._credentials = credentials
         self._project = project
         self._region_name = region_name
         self._repository = repository
+        self._page_size = page_size
+        self._use_versions_api = use_versions_api
         self._repo_resource_id = f"projects/{project}/locations/{region_name}/repositories/{repository}"
 
         self._gcp_client = artifactregistry_v1.ArtifactRegistryClient(
             credentials=self._credentials.google_credentials_object
         )
-        self._authorized_session = self._credentials.authorized_session
+        self._authorized_session = Instrumentation.instrument_session(self._credentials.authorized_session,
+                                                                      type(self).__name__)
+
+    def handles_resource_url(self, resource_url: str) -> bool:
+        host = self._url_host(resource_url)
+        return host == self._url_host(self.GAR_URL_PREFIX) or host.endswith(".pkg.dev")
 
     def download_artifact(self, resource_url: str, local_path: str | Path, **kwargs) -> None:
         response = self._authorized_session.get(url=resource_url, timeout=self.timeout)
         response.raise_for_status()
         with open(local_path, 'wb') as file:
-            file.write(response.content)
+            written = file.write(response.content)
+        Metrics.downloaded_bytes.inc(written, system=type(self).__name__)
 
     def search_artifacts(self, artifact: Artifact, latest: bool = False, comparer=None, **kwargs) -> list[str]:
         if artifact.has_version_wildcard():
@@ -61,8 +81,10 @@ def get_provider_name(self) -> str:
         return "gcp_artifact_registry"
 
     def _search_wildcard_versions(self, artifact: Artifact, latest: bool = False, comparer=None) -> list[str]:
-        literal = f"{artifact.artifact_id}-{artifact.version.split('*', 1)[0]}"
-        files = self._list_files(f"{self._repo_resource_id}/files/*{literal}*")
+        if latest and self._use_versions_api:
+            return self._search_latest_created_version(artifact)
+
+        files = self._list_files(self._wildcard_name_filter(artifact))
 
         version_pattern = ArtifactFinderUtils.wildcard_to_regex(artifact.version)
         group_filter = self._group_filter(artifact)
@@ -85,10 +107,38 @@ def _search_wildcard_versions(self, artifact: Artifact, latest: bool = False, co
             return [latest_url] if latest_url else []
         return [url for _, url in candidates]
 
+    def _wildcard_name_filter(self, artifact: Artifact) -> str:
+        # Narrow server-side listing as much as possible: group path (if known), version wildcard itself and extension
+        # Remaining client-side checks (group directory, exact version regex) are still applied to returned files
+        group_prefix = f"{artifact.group_id.replace('.', '/')}/*" if artifact.group_id else ""
+        return f"{self._repo_resource_id}/files/*{group_prefix}{artifact.artifact_id}-{artifact.version}.{artifact.extension}"
+
+    def _search_latest_created_version(self, artifact: Artifact) -> list[str]:
+        version_pattern = ArtifactFinderUtils.wildcard_to_regex(artifact.version)
+        package_id = f"{artifact.group_id}:{artifact.artifact_id}" if artifact.group_id else artifact.artifact_id
+        package_resource_id = f"{self._repo_resource_id}/packages/{package_id}"
+        list_versions_request = artifactregistry_v1.ListVersionsRequest(
+            parent=package_resource_id,
+            filter=f'name="{package_resource_id}/versions/{artifact.version}"',
+            order_by=self.VERSIONS_ORDER_BY,
+            page_size=self._page_size,
+        )
+        for version in self._gcp_client.list_versions(request=list_versions_request):
+            version_name = unquote(version.name.rsplit("/", 1)[-1])
+            if not version_pattern.fullmatch(version_name):
+                continue
+            urls = self.search_artifacts(Artifact(group_id=artifact.group_id, artifact_id=artifact.artifact_id,
+                                                  version=version_name, extension=artifact.extension))
+            if urls:
+                logging.debug("Latest created version matching '%s' -> '%s'", artifact.version, version_name)
+                return urls[:1]
+        return []
+
     def _list_files(self, name_filter: str):
         list_files_request = artifactregistry_v1.ListFilesRequest(
             parent=self._repo_resource_id,
             filter=f'name="{name_filter}"',
+            page_size=self._page_size,
         )
         return self._gcp_client.list_files(request=list_files_request)
 
@@ -103,11 +153,7 @@ def _search_snapshot_artifacts(self, artifact: Artifact) -> list[str]:
         if artifact.group_id:
             prefix = f"*{artifact.group_id.replace('.', '/')}/"
         name_filter = f"{self._repo_resource_id}/files/{prefix}{artifact.artifact_id}/{artifact.version}/maven-metadata.xml"
-        list_files_request = artifactregistry_v1.ListFilesRequest(
-            parent=self._repo_resource_id,
-            filter=f'name="{name_filter}"',
-        )
-        files = self._gcp_client.list_files(request=list_files_request)
+        files = self._list_files(name_filter)
 
         maven_base_url = f"https://{self._region_name}-maven.pkg.dev/{self._project}/{self._repository}"
         base_version = artifact.version.removesuffix("-SNAPSHOT")
@@ -128,7 +174,7 @@ def _search_snapshot_artifacts(self, artifact: Artifact) -> list[str]:
             resolved_version = f"{base_version}-{timestamp}"
 
             url = f"{maven_base_url}/{group_path}/{artifact.artifact_id}/{artifact.version}/{artifact.artifact_id}-{resolved_version}.{artifact.extension}"
-            logging.debug(f"Resolved SNAPSHOT version '{artifact.version}' -> '{resolved_version}' (group: {group_path})")
+            logging.debug("Resolved SNAPSHOT version '%s' -> '%s' (group: %s)", artifact.version, resolved_version, group_path)
             result_urls.append(url)
 
         return result_urls
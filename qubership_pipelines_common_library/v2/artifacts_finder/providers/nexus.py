@@ -23,6 +23,9 @@ def __init__(self, registry_url: str, username: str = None, password: str = None
             from requests.auth import HTTPBasicAuth
             self._session.auth = HTTPBasicAuth(username, password)
 
+    def handles_resource_url(self, resource_url: str) -> bool:
+        return bool(self._url_host(resource_url)) and self._url_host(resource_url) == self._url_host(self.registry_url)
+
     def download_artifact(self, resource_url: str, local_path: str | Path, **kwargs) -> None:
         return self.generic_download(resource_url=resource_url, local_path=local_path)
 
@@ -54,6 +54,7 @@ def create_aws_provider(provider_params: dict, common_params: dict):
             domain=provider_params.get("domain"),
             repository=provider_params.get("repository"),
             package_format=provider_params.get("package_format", "generic"),
+            max_workers=provider_params.get("max_workers", AwsCodeArtifactProvider.DEFAULT_MAX_WORKERS),
             params=common_params,
         )
         return provider
@@ -95,6 +96,8 @@ def create_gcp_provider(provider_params: dict, common_params: dict):
             project=provider_params.get("project"),
             region_name=provider_params.get("region_name"),
             repository=provider_params.get("repository"),
+            page_size=provider_params.get("page_size", GcpArtifactRegistryProvider.DEFAULT_PAGE_SIZE),
+            use_versions_api=provider_params.get("use_versions_api", False),
             params=common_params,
         )
         return provider
@@ -130,6 +133,8 @@ def create_azure_provider(provider_params: dict, common_params: dict):
             organization=provider_params.get("organization"),
             project=provider_params.get("project"),
             feed=provider_params.get("feed"),
+            max_workers=provider_params.get("max_workers", AzureArtifactsProvider.DEFAULT_MAX_WORKERS),
+            cache_ttl_seconds=provider_params.get("cache_ttl_seconds", AzureArtifactsProvider.DEFAULT_CACHE_TTL_SECONDS),
             params=common_params,
         )
         return provider
@@ -167,27 +172,86 @@ class ArtifactFinderUtils:
 
     @staticmethod
     def create_artifact_finder_for_command(cmd: ExecutionCommand):
+        """
+        Creates `ArtifactFinder` from "systems.registry" section of command's input params.
+
+        When several providers are configured, they are wrapped into `CompositeArtifactProvider`,
+        configured via optional "systems.registry.fanout" section:
+        ```
+        {
+            "strategy": "FIRST_SUCCESS | PRIORITY | MERGE_ALL",   # defaults to FIRST_SUCCESS
+            "priority": ["nexus", "artifactory", "aws"],          # defaults to order of providers in "systems.registry"
+            "provider_timeout_seconds": 30,
+            "slow_threshold_seconds": 10,
+            "max_failures": 2,
+            "demotion_seconds": 300,
+        }
+        ```
+        """
         params = cmd.context.input_param_get("systems.registry")
         provider = None
         if params:
-            configured_providers = [name for name in ArtifactFinderUtils.PROVIDERS_CONFIG if name in params]
+            configured_providers = [name for name in params if name in ArtifactFinderUtils.PROVIDERS_CONFIG]
             if not configured_providers:
                 raise Exception("Missing specific provider configuration in 'systems.artifact_finder' section")
-            if len(configured_providers) > 1:
-                raise Exception(f"Multiple Artifact providers configured: {configured_providers}. Only one is expected.")
 
-            provider_name = configured_providers[0]
-            provider_config = ArtifactFinderUtils.PROVIDERS_CONFIG.get(provider_name)
-            provider_params = params.get(provider_name)
             common_params = {"timeout": cmd.timeout_seconds, "verify": cmd.verify}
-            if missing := UtilsDictionary.check_required_fields(provider_params, provider_config.get("required_fields", [])):
-                raise Exception(f"Missing required fields for {provider_name}: {missing}")
-
-            provider = provider_config.get("init_method")(provider_params, common_params)
+            if len(configured_providers) == 1:
+                provider = ArtifactFinderUtils._create_provider(configured_providers[0], params, common_params)
+            else:
+                provider = ArtifactFinderUtils._create_composite_provider(configured_providers, params, common_params)
 
         from qubership_pipelines_common_library.v2.artifacts_finder.artifact_finder import ArtifactFinder
         return ArtifactFinder(artifact_provider=provider)
 
+    @staticmethod
+    def _create_provider(provider_name: str, params: dict, common_params: dict):
+        provider_config = ArtifactFinderUtils.PROVIDERS_CONFIG.get(provider_name)
+        provider_params = params.get(provider_name)
+        if missing := UtilsDictionary.check_required_fields(provider_params, provider_config.get("required_fields", [])):
+            raise Exception(f"Missing required fields for {provider_name}: {missing}")
+        return provider_config.get("init_method")(provider_params, common_params)
+
+    @staticmethod
+    def _create_composite_provider(configured_providers: list[str], params: dict, common_params: dict):
+        import logging
+        from qubership_pipelines_common_library.v2.artifacts_finder.providers.composite import CompositeArtifactProvider
+        fanout_params = params.get("fanout") or {}
+        priority = fanout_params.get("priority") or configured_providers
+        if unknown := [name for name in priority if name not in configured_providers]:
+            raise Exception(f"Providers in 'fanout.priority' are not configured: {unknown}")
+        ordered_names = priority + [name for name in configured_providers if name not in priority]
+
+        providers = []
+        for provider_name in ordered_names:
+            try:
+                providers.append(ArtifactFinderUtils._create_provider(provider_name, params, common_params))
+            except Exception as e:
+                # invalid configuration (missing fields, unsupported auth type, rejected credentials) is not skipped
+                if not ArtifactFinderUtils._is_transient_init_failure(e):
+                    raise
+                logging.warning(f"Skipping artifact provider '{provider_name}' - could not initialize it: {e}")
+        if not providers:
+            raise Exception(f"Could not initialize any of configured Artifact providers: {ordered_names}")
+
+        return CompositeArtifactProvider(
+            providers=providers,
+            strategy=fanout_params.get("strategy", CompositeArtifactProvider.Strategy.FIRST_SUCCESS),
+            provider_timeout_seconds=fanout_params.get("provider_timeout_seconds"),
+            slow_threshold_seconds=fanout_params.get("slow_threshold_seconds"),
+            max_failures=fanout_params.get("max_failures", CompositeArtifactProvider.DEFAULT_MAX_FAILURES),
+            demotion_seconds=fanout_params.get("demotion_seconds", CompositeArtifactProvider.DEFAULT_DEMOTION_SECONDS),
+            params=common_params,
+        )
+
+    @staticmethod
+    def _is_transient_init_failure(error: Exception) -> bool:
+        """Whether provider could not be initialized because its auth backend is unavailable (connection errors, timeouts, 5xx)"""
+        from qubership_pipelines_common_library.v2.utils.backend_guard import BackendGuard
+        if isinstance(error, (FileNotFoundError, PermissionError)):
+            return False
+        return BackendGuard.is_backend_failure(error)
+
     @staticmethod
     def resolve_snapshot_versions(artifact: Artifact, download_urls: list, provider) -> list[str]:
         groups = {}
@@ -242,6 +306,17 @@ def wildcard_to_regex(pattern: str):
         import re
         return re.compile(".*".join(re.escape(part) for part in pattern.split("*")))
 
+    @staticmethod
+    def run_concurrently(func, items: list, max_workers: int = 8) -> list:
+        # Applies 'func' to every item using a bounded thread pool, preserving the order of 'items' in results
+        if not items:
+            return []
+        if max_workers <= 1 or len(items) == 1:
+            return [func(item) for item in items]
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
     @staticmethod
     def select_latest(candidates: list[tuple], comparer=None):
         # candidates: (comparable_version_string, payload) pairs. Returns the payload whose version compares greatest
@@ -5,17 +5,22 @@
 
 class SafeGithubClient(GithubClient):
 
+    DEFAULT_API_URL = "https://api.github.com"
+
     def __init__(self, api_url: str, token: str):
         super().__init__(api_url=api_url, token=token)
+        self.api_url = api_url or self.DEFAULT_API_URL
 
     @classmethod
-    @RetryDecorator(condition_func=lambda result: result is not None)
+    @RetryDecorator.with_backoff(condition_func=lambda result: result is not None,
+                                 backend_func=lambda cls, api_url, *args, **kwargs: api_url or cls.DEFAULT_API_URL)
     def create_github_client(cls, api_url: str, token, retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1):
         return cls(api_url=api_url, token=token)
 
-    @RetryDecorator(
+    @RetryDecorator.with_backoff(
         condition_func=lambda result: result is not None and result.get_status() not in [
-            ExecutionInfo.STATUS_NOT_STARTED, ExecutionInfo.STATUS_UNKNOWN]
+            ExecutionInfo.STATUS_NOT_STARTED, ExecutionInfo.STATUS_UNKNOWN],
+        backend_func=lambda self, *args, **kwargs: self.api_url
     )
     def trigger_workflow(self, owner: str, repo_name: str, workflow_file_name: str, branch: str,
                          pipeline_params, retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1):
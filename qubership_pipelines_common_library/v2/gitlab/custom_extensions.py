@@ -2,6 +2,7 @@
 
 from qubership_pipelines_common_library.v1.execution.exec_command import ExecutionCommandExtension
 from qubership_pipelines_common_library.v1.execution.exec_info import ExecutionInfo
+from qubership_pipelines_common_library.v1.utils.utils_logging import LazyLog
 from qubership_pipelines_common_library.v2.extensions.pipeline_data_importer import PipelineDataImporter
 
 
@@ -46,12 +47,12 @@ def import_pipeline_data(self, execution: ExecutionInfo) -> None:
         if job := self.command.gl_client.get_latest_job(project_id, pipeline_id):
             self.context.logger.info(f"Latest job: {job.id}")
             local_dirpath = self.context.path_temp
-            self.context.logger.debug(f"Contents of folder {local_dirpath}: {os.listdir(local_dirpath)}")
+            self.context.logger.debug("Contents of folder %s: %s", local_dirpath, LazyLog(os.listdir, local_dirpath))
             if artifacts_file := self.command.gl_client.download_job_artifacts(job.pipeline.get('project_id'), job.id, local_dirpath):
                 with zipfile.ZipFile(artifacts_file) as zf:
-                    self.context.logger.debug(f"Zip contents: ${zf.namelist()}")
+                    self.context.logger.debug("Zip contents: $%s", zf.namelist())
                     zf.extractall(local_dirpath)
-            self.context.logger.debug(f"Contents of folder {local_dirpath} (after zip.extractall): {os.listdir(local_dirpath)}")
+            self.context.logger.debug("Contents of folder %s (after zip.extractall): %s", local_dirpath, LazyLog(os.listdir, local_dirpath))
             self._import_downloaded_data(local_dirpath / self.IMPORTED_CONTEXT_FILE)
         else:
             self.context.logger.warning("No jobs found")
@@ -20,7 +20,7 @@ def import_pipeline_data(self, execution: ExecutionInfo) -> None:
                 output_path = Path(self.context.input_param_get("paths.output.files"))
                 output_path.mkdir(parents=True, exist_ok=True)
                 with zipfile.ZipFile(artifacts_file) as zf:
-                    self.context.logger.debug(f"Zip contents: ${zf.namelist()}")
+                    self.context.logger.debug("Zip contents: $%s", zf.namelist())
                     zf.extractall(output_path)
         else:
             self.context.logger.warning(f"Job not found! project_id: {project_id}, pipeline_id: {pipeline_id}")
@@ -9,23 +9,26 @@ def __init__(self, host: str, username: str, password: str):
         super().__init__(host=host, username=username, password=password)
 
     @classmethod
-    @RetryDecorator(condition_func=lambda result: result is not None)
+    @RetryDecorator.with_backoff(condition_func=lambda result: result is not None,
+                                 backend_func=lambda cls, host, *args, **kwargs: host)
     def create_gitlab_client(cls, host: str, username: str, password: str,
                              retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1):
         return cls(host, username, password)
 
-    @RetryDecorator(
+    @RetryDecorator.with_backoff(
         condition_func=lambda result: result is not None and result.get_status() not in [
-            ExecutionInfo.STATUS_NOT_STARTED, ExecutionInfo.STATUS_UNKNOWN]
+            ExecutionInfo.STATUS_NOT_STARTED, ExecutionInfo.STATUS_UNKNOWN],
+        backend_func=lambda self, *args, **kwargs: self.host
     )
     def trigger_pipeline(self, project_id: str, ref: str, trigger_token: str = None, variables: dict = None,
                          use_ci_job_token: bool = False, retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1):
         return super().trigger_pipeline(project_id=project_id, ref=ref, trigger_token=trigger_token,
                                         variables=variables, use_ci_job_token=use_ci_job_token)
 
-    @RetryDecorator(
+    @RetryDecorator.with_backoff(
         condition_func=lambda result: result is not None and result.get_status() not in [
-            ExecutionInfo.STATUS_NOT_STARTED, ExecutionInfo.STATUS_UNKNOWN]
+            ExecutionInfo.STATUS_NOT_STARTED, ExecutionInfo.STATUS_UNKNOWN],
+        backend_func=lambda self, *args, **kwargs: self.host
     )
     def create_pipeline(self, project_id: str, ref: str, variables: dict = None,
                          retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1):
@@ -8,7 +8,8 @@ def __init__(self, host: str, user: str, password: str):
         super().__init__(host, user, password)
 
     @classmethod
-    @RetryDecorator(condition_func=lambda result: result is not None)
+    @RetryDecorator.with_backoff(condition_func=lambda result: result is not None,
+                                 backend_func=lambda cls, host, *args, **kwargs: host)
     def create_jenkins_client(cls, host: str, user: str, password: str,
                               retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1):
         return cls(host, user, password)
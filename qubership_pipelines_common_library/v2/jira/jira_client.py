@@ -7,7 +7,9 @@
 from typing import Any
 from requests import Response
 from requests.auth import HTTPBasicAuth
+from requests.exceptions import InvalidSchema, InvalidURL, MissingSchema
 from qubership_pipelines_common_library.v2.utils.retry_decorator import RetryDecorator
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
 
 
 class AuthType(StrEnum):
@@ -39,9 +41,11 @@ class JiraClient:
     ]
 
     API_VERSION = "2"
+    NON_RETRYABLE_EXCEPTIONS = (InvalidSchema, InvalidURL, MissingSchema)  # misconfiguration, retrying won't help
 
     @classmethod
-    @RetryDecorator(condition_func=lambda client: client is not None)
+    @RetryDecorator.with_backoff(condition_func=lambda client: client is not None,
+                                 backend_func=lambda cls, host, *args, **kwargs: host)
     def create_jira_client(cls, host: str, user: str, password: str, auth_type: str,
                            retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1):
         return cls(host, user, password, auth_type)
@@ -52,6 +56,7 @@ def __init__(self, host: str, user: str, password: str, auth_type: str = AuthTyp
         self.password = password
         self.session = requests.Session()
         self.session.verify = os.getenv("PYTHONHTTPSVERIFY", "1") != "0"
+        Instrumentation.instrument_session(self.session, "jira")
         if auth_type.lower() == AuthType.BEARER:
             self.session.headers.update({"Authorization": f"Bearer {password}"})
         else:
@@ -79,31 +84,33 @@ def get_server_info(self) -> dict[str, Any]:
             j = self._get_json("serverInfo")
         return j
 
-    @RetryDecorator(condition_func=lambda response: response is not None and (response.ok or response.status_code == 400)) # do not retry BadRequest
+    @RetryDecorator.with_backoff(condition_func=lambda response: response is not None and (response.ok or response.status_code == 400), # do not retry BadRequest
+                                 give_up_on=NON_RETRYABLE_EXCEPTIONS, backend_func=lambda self, *args, **kwargs: self.host)
     def add_ticket_comment(self, ticket_id: str, comment: str, retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1) -> Response:
         response = self.session.post(
             url=f"{self.host}/rest/api/{self.API_VERSION}/issue/{ticket_id}/comment",
             data=json.dumps({"body": comment})
         )
-        self.logger.debug(f"Add ticket (id={ticket_id}) comment response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Add ticket (id=%s) comment", ticket_id)
         return response
 
     def get_latest_ticket_comments(self, ticket_id: str, max_results: int = 50) -> list:
         response = self.session.get(f"{self.host}/rest/api/{self.API_VERSION}/issue/{ticket_id}/comment?maxResults={max_results}&orderBy=-created")
-        self.logger.debug(f"Get ticket (id={ticket_id}) comments response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Get ticket (id=%s) comments", ticket_id)
         response.raise_for_status()
         return response.json().get("comments", [])
 
-    @RetryDecorator(condition_func=lambda response: response is not None and (response.ok or response.status_code == 400))
+    @RetryDecorator.with_backoff(condition_func=lambda response: response is not None and (response.ok or response.status_code == 400),
+                                 give_up_on=NON_RETRYABLE_EXCEPTIONS, backend_func=lambda self, *args, **kwargs: self.host)
     def create_ticket(self, ticket_fields: dict, retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1) -> Response:
         body = {"fields": ticket_fields}
         response = self.session.post(f"{self.host}/rest/api/{self.API_VERSION}/issue", data=json.dumps(body))
-        self.logger.debug(f"Create ticket response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Create ticket")
         return response
 
     def get_createmeta_fields(self, project_key: str, issue_type_name: str) -> dict:
         response = self.session.get(f"{self.host}/rest/api/{self.API_VERSION}/issue/createmeta/{project_key}/issuetypes?maxResults=100")
-        self.logger.debug(f"Get createmeta for project (id={project_key}) response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Get createmeta for project (id=%s)", project_key)
         if not response.ok:
             self.logger.warning(f"Can't get issuetypes by projectKey = {project_key}. Response status = {response.status_code}")
             return {}
@@ -115,7 +122,7 @@ def get_createmeta_fields(self, project_key: str, issue_type_name: str) -> dict:
             return {}
 
         response = self.session.get(f"{self.host}/rest/api/{self.API_VERSION}/issue/createmeta/{project_key}/issuetypes/{issue_type_ids[0]}?maxResults=100")
-        self.logger.debug(f"Get createmeta for issuetype (id={issue_type_ids[0]}) response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Get createmeta for issuetype (id=%s)", issue_type_ids[0])
         if not response.ok:
             self.logger.warning(f"Can't get createmeta by projectKey = {project_key} and issue_type_id = {issue_type_ids[0]}. Response status = {response.status_code}")
             return {}
@@ -125,7 +132,7 @@ def get_createmeta_fields(self, project_key: str, issue_type_name: str) -> dict:
 
     def get_ticket_fields(self, ticket_id: str, field_names_filter: list) -> dict:
         response = self.session.get(f"{self.host}/rest/api/{self.API_VERSION}/issue/{ticket_id}?fields={','.join(field_names_filter)}")
-        self.logger.debug(f"Get ticket fields (id={ticket_id}) response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Get ticket fields (id=%s)", ticket_id)
         if not response.ok:
             self.logger.warning(f"Can't get ticket info by ticket_id = {ticket_id}. Response status = {response.status_code}")
             return {}
@@ -133,23 +140,24 @@ def get_ticket_fields(self, ticket_id: str, field_names_filter: list) -> dict:
 
     def get_editmeta_fields(self, ticket_id: str) -> dict:
         response = self.session.get(f"{self.host}/rest/api/{self.API_VERSION}/issue/{ticket_id}/editmeta")
-        self.logger.debug(f"Get editmeta for ticket (id={ticket_id}) response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Get editmeta for ticket (id=%s)", ticket_id)
         if not response.ok:
             self.logger.warning(f"Can't get ticket {ticket_id} editmeta. Response status = {response.status_code}")
             return {}
         return response.json().get("fields", {})
 
-    @RetryDecorator(condition_func=lambda response: response is not None and (response.ok or response.status_code == 400))
+    @RetryDecorator.with_backoff(condition_func=lambda response: response is not None and (response.ok or response.status_code == 400),
+                                 give_up_on=NON_RETRYABLE_EXCEPTIONS, backend_func=lambda self, *args, **kwargs: self.host)
     def update_ticket(self, ticket_id: str, ticket_fields: dict,
                       retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1) -> Response:
         body = {"fields": ticket_fields}
         response = self.session.put(f"{self.host}/rest/api/{self.API_VERSION}/issue/{ticket_id}", data=json.dumps(body))
-        self.logger.debug(f"Update ticket (id={ticket_id}) response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Update ticket (id=%s)", ticket_id)
         return response
 
     def get_ticket_transitions(self, ticket_id: str):
         response = self.session.get(f"{self.host}/rest/api/{self.API_VERSION}/issue/{ticket_id}/transitions?expand=transitions.fields")
-        self.logger.debug(f"Get ticket (id={ticket_id}) transitions response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Get ticket (id=%s) transitions", ticket_id)
         if not response.ok:
             self.logger.warning(f"Ticket {ticket_id} transitions are not found in response. Response status = {response.status_code}")
             return []
@@ -177,9 +185,14 @@ def perform_ticket_transition(self, ticket_id: str, transition_id: str, transiti
         if transition_fields:
             body["fields"] = transition_fields
         response = self.session.post(f"{self.host}/rest/api/{self.API_VERSION}/issue/{ticket_id}/transitions", data=json.dumps(body))
-        self.logger.debug(f"Perform transition for ticket (id={ticket_id}) response: status_code = {response.status_code}, body = {response.text}")
+        self._log_response(response, "Perform transition for ticket (id=%s)", ticket_id)
         return response
 
+    def _log_response(self, response: Response, description: str, *args):
+        """Logs response body (decoding it only when DEBUG level is enabled)"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(description + " response: status_code = %s, body = %s", *args, response.status_code, response.text)
+
     def _get_json(self, path: str, params: dict[str, Any] | None = None, use_post: bool = False) -> dict | list:
         url = f"{self.host}/rest/api/{self.API_VERSION}/{path}"
         response = (
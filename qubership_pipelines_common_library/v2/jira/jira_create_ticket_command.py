@@ -103,7 +103,7 @@ def _execute(self):
 
         createmeta_fields = self.jira_client.get_createmeta_fields(self.project_key, self.issue_type_name)
         self.filtered_ticket_fields = JiraClient.filter_ticket_fields(self.ticket_fields, createmeta_fields)
-        self.context.logger.debug(f"Filtered ticket fields: {self.filtered_ticket_fields}")
+        self.context.logger.debug("Filtered ticket fields: %s", self.filtered_ticket_fields)
 
         create_ticket_response = self.jira_client.create_ticket(self.filtered_ticket_fields,
                                                                 retry_timeout_seconds=self.retry_timeout_seconds,
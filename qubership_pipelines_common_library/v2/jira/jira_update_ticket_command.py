@@ -89,7 +89,7 @@ def _execute(self):
 
         editmeta_fields = self.jira_client.get_editmeta_fields(self.ticket_key)
         self.filtered_ticket_fields = JiraClient.filter_ticket_fields(self.ticket_fields, editmeta_fields)
-        self.context.logger.debug(f"Filtered ticket fields: {self.filtered_ticket_fields}")
+        self.context.logger.debug("Filtered ticket fields: %s", self.filtered_ticket_fields)
 
         update_ticket_response = self.jira_client.update_ticket(
             self.ticket_key, self.filtered_ticket_fields,
@@ -113,8 +113,8 @@ def _execute(self):
                     part.add_header('Content-Disposition', f'attachment; filename="{attachment["name"]}"')
                     msg.attach(part)
 
-            self.context.logger.debug(f"Connecting to SMTP server: {self.email_server}:{self.email_port}"
-                                      f", using SSL: {self.use_ssl}, TLS: {self.use_tls}, verify: {self.verify}")
+            self.context.logger.debug("Connecting to SMTP server: %s:%s, using SSL: %s, TLS: %s, verify: %s",
+                                      self.email_server, self.email_port, self.use_ssl, self.use_tls, self.verify)
             ssl_context = ssl.create_default_context() if self.verify else ssl._create_unverified_context()
             if self.use_ssl:
                 smtp = smtplib.SMTP_SSL(self.email_server, self.email_port, timeout=self.timeout_seconds, context=ssl_context)
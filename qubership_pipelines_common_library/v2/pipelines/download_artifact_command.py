@@ -1,5 +1,7 @@
+import json
 import os
 import shutil
+import sys
 import tempfile
 import zipfile
 import requests
@@ -55,8 +57,13 @@ class DownloadArtifact(ExecutionCommand):
             },
         },
         "registry": {                        # OPTIONAL: Auth settings for ArtifactFinder search/download,
-            "artifactory": {                                    only section required for your provider should be present
-                "registry_url": "artifactory_url",              Refer to ArtifactFinder docs and specific Cloud Providers for more information
+            "fanout": {                                         only sections required for your providers should be present
+                "strategy": "FIRST_SUCCESS | PRIORITY | MERGE_ALL",  Refer to ArtifactFinder docs and specific Cloud Providers for more information
+                "priority": ["nexus", "artifactory"],           When several providers are configured, they are queried concurrently,
+                "provider_timeout_seconds": 30,                 "fanout" section (OPTIONAL) configures how their results are combined
+            },
+            "artifactory": {
+                "registry_url": "artifactory_url",
                 "username": "user",
                 "password": "pass",
             },
@@ -153,11 +160,29 @@ def _execute(self):
 
         self._extract_to_path(downloaded_file_path, self.target_path)
         self.context.logger.info(f"{'Extracted' if self.need_to_extract else 'Moved'} to {self.target_path}")
+        if self.need_to_extract:
+            self._check_manifest()
 
         self.context.output_param_set("params.target_path", str(self.target_path))
         self.context.output_param_set("params.file_size", file_size)
         self.context.output_params_save()
 
+    def _check_manifest(self):
+        """Validates module built by `ZipappBuilder`: its precompiled bytecode is only usable with the same Python version"""
+        from qubership_pipelines_common_library.v2.utils.zipapp_builder import ZipappBuilder
+        manifest_path = self.target_path.joinpath(ZipappBuilder.MANIFEST_FILE_NAME)
+        if not manifest_path.is_file():
+            return
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            self.context.logger.warning(f"Could not read module manifest {manifest_path}: {e}")
+            return
+        current_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+        if manifest.get("bytecode") and manifest.get("python_version") != current_version:
+            self.context.logger.warning(f"Module was precompiled for Python {manifest.get('python_version')}, but current one is "
+                                        f"{current_version}: its modules will be compiled on import")
+
     def _prepare_target_path(self):
         if self.clear_target_path and self.target_path.exists():
             if self.target_path.is_dir():
@@ -1,5 +1,6 @@
-import os, subprocess, time, uuid
+import os, signal, subprocess, threading, time, uuid
 
+from collections import deque
 from pathlib import Path
 from qubership_pipelines_common_library.v1.execution.exec_command import ExecutionCommand
 from qubership_pipelines_common_library.v1.utils.utils_string import UtilsString
@@ -25,6 +26,14 @@ class PodmanRunImage(ExecutionCommand):
                 "save_stdout_to_logs": True,  # Save container stdout to execution logs
                 "save_stdout_to_files": True,  # Save container stdout to output files
                 "save_stdout_to_params": False,  # Save container stdout to output parameters
+                "stream_output": False,  # Read container output incrementally (line by line) instead of buffering all of it in memory
+                "stdout_tail_lines": "1000",  # With stream_output, how many last lines of stdout/stderr are kept for output parameters
+                "bulk_copy": False,  # Copy all after_script paths at once (one 'podman cp' per top-level folder) instead of one by one
+                "pre_pull": False,  # Pull image before running (once per process) and run it pinned to its digest, without pull checks
+                "pull_timeout": "300",  # Timeout for pulling image in seconds
+                "warm_container": "build_env",  # Name of long-lived container: started if missing, "command" is executed in it via "podman exec"
+                "stop_warm_container": False,  # Remove warm container after this command (e.g. in last step of the batch)
+                "warm_container_ttl": "3600",  # Warm container stops (and is removed) by itself this many seconds after start
                 "expected_return_codes": "0,125",  # Comma-separated list of acceptable exit codes
                 "additional_run_flags": "--cgroups=disabled",  # Optional string of flags that will be added to "podman run" command
             },
@@ -63,15 +72,30 @@ class PodmanRunImage(ExecutionCommand):
         Output Parameters:
             - params.execution_time: Total execution time in seconds
             - params.return_code: Container exit code
-            - params.stdout: Container stdout (if save_stdout_to_params enabled)
-            - params.stderr: Container stderr (if save_stdout_to_params enabled)
+            - params.stdout: Container stdout (if save_stdout_to_params enabled; only last `stdout_tail_lines` lines with stream_output)
+            - params.stderr: Container stderr (if save_stdout_to_params enabled; only last `stdout_tail_lines` lines with stream_output)
             - params.extracted_output.*: Extracted parameters from files (if extract_params_from_files configured)
+            - params.pinned_image: Digest-pinned image reference, that was run (if pre_pull enabled)
 
         Notes:
             - The command automatically handles container lifecycle including start, execution, and cleanup
+            - Warm container keeps mounts, run flags and image of the command that started it, and is not removed
+              (regardless of remove_container) until command with stop_warm_container is executed, any command in it fails,
+              or its warm_container_ttl expires. Running warm container started with different image, mounts, working_dir
+              or run flags is recreated
             - All host-paths (including mount paths) are resolved relative to context directory.
         """
 
+    STDOUT_TAIL_LINES = 1000
+    WARM_CONTAINER_TTL = 3600
+    WARM_CONFIG_LABEL = "qubership.pipelines.warm-config"
+    STREAM_READ_LIMIT = 64 * 1024  # longer lines are read (and logged) in chunks
+    BULK_COPY_MAX_WORKERS = 4
+
+    # image reference -> digest-pinned reference, shared by all commands executed in the same process
+    _pinned_images: dict[str, str] = {}
+    _pinned_images_lock = threading.Lock()
+
     def _validate(self):
         names = [
             "paths.input.params",
@@ -101,6 +125,14 @@ def _validate(self):
         self.save_stdout_to_logs = UtilsString.convert_to_bool(self.context.input_param_get("params.execution_config.save_stdout_to_logs", True))
         self.save_stdout_to_files = UtilsString.convert_to_bool(self.context.input_param_get("params.execution_config.save_stdout_to_files", True))
         self.save_stdout_to_params = UtilsString.convert_to_bool(self.context.input_param_get("params.execution_config.save_stdout_to_params", False))
+        self.stream_output = UtilsString.convert_to_bool(self.context.input_param_get("params.execution_config.stream_output", False))
+        self.stdout_tail_lines = int(self.context.input_param_get("params.execution_config.stdout_tail_lines", self.STDOUT_TAIL_LINES))
+        self.bulk_copy = UtilsString.convert_to_bool(self.context.input_param_get("params.execution_config.bulk_copy", False))
+        self.pre_pull = UtilsString.convert_to_bool(self.context.input_param_get("params.execution_config.pre_pull", False))
+        self.pull_timeout = float(self.context.input_param_get("params.execution_config.pull_timeout", 300))
+        self.warm_container = self.context.input_param_get("params.execution_config.warm_container")
+        self.stop_warm_container = UtilsString.convert_to_bool(self.context.input_param_get("params.execution_config.stop_warm_container", False))
+        self.warm_container_ttl = int(self.context.input_param_get("params.execution_config.warm_container_ttl", self.WARM_CONTAINER_TTL))
         self.expected_return_codes = [int(num) for num in self.context.input_param_get("params.execution_config.expected_return_codes", "0").split(',')]
         self.additional_run_flags = self.context.input_param_get("params.execution_config.additional_run_flags")
 
@@ -117,7 +149,11 @@ def _validate(self):
         self.input_params_path = Path(self.context.input_param_get("paths.input.params"))
         self.output_params_path = Path(self.context.input_param_get("paths.output.params"))
         self.output_files_path = Path(self.context.input_param_get("paths.output.files"))
-        self.container_name = f"podman_{str(uuid.uuid4())}"
+        self.container_name = self.warm_container if self.warm_container else f"podman_{str(uuid.uuid4())}"
+        self.output_params_key = "params"
+        if self.warm_container and not self.command:
+            self.context.logger.error("Parameter 'params.command' is mandatory with 'params.execution_config.warm_container'")
+            return False
         return True
 
     def _run_sp_command(self, command, timeout=None):
@@ -125,8 +161,67 @@ def _run_sp_command(self, command, timeout=None):
                               timeout=timeout if timeout else self.timeout,
                               cwd=self.context_dir_path)
 
-    def _build_podman_command(self) -> list[str]:
+    def _run_sp_command_streaming(self, command, output_dir: Path, log_prefix: str = "", timeout=None) -> subprocess.CompletedProcess:
+        """
+        Runs command reading its stdout/stderr incrementally on background threads: each line is written to output files
+        and to logs (if enabled) as soon as it's read, and only last `stdout_tail_lines` lines are kept in memory.
+        Returns `CompletedProcess` with these tails as `stdout` and `stderr`
+        """
+        timeout = timeout if timeout else self.timeout
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=self.context_dir_path,
+                                   start_new_session=True)
+        tails = {"stdout": deque(maxlen=self.stdout_tail_lines), "stderr": deque(maxlen=self.stdout_tail_lines)}
+        pumps = [threading.Thread(target=self._pump_stream, daemon=True,
+                                  args=(pipe, tails[name], output_dir / f"container_{name}.txt", f"{log_prefix}[{name}] "))
+                 for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr))]
+        for pump in pumps:
+            pump.start()
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._kill_process_group(process)
+            raise
+        finally:
+            for pump in pumps:
+                # output pipes may be held by processes spawned by command, so they are not waited forever
+                pump.join(timeout=self.operations_timeout)
+        return subprocess.CompletedProcess(command, returncode, "".join(tails["stdout"]), "".join(tails["stderr"]))
+
+    @staticmethod
+    def _kill_process_group(process: subprocess.Popen):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (AttributeError, ProcessLookupError, PermissionError):
+            process.kill()
+        process.wait()
+
+    def _pump_stream(self, pipe, tail: deque, file_path: Path, log_prefix: str):
+        output_file = None
+        try:
+            if self.save_stdout_to_files:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                output_file = open(file_path, 'w', encoding='utf-8')
+            for chunk in iter(lambda: pipe.readline(self.STREAM_READ_LIMIT), b""):
+                line = chunk.decode('utf-8', errors='replace')
+                if output_file:
+                    output_file.write(line)
+                if self.save_stdout_to_logs:
+                    self.context.logger.debug("%s%s", log_prefix, line.rstrip("\n"))
+                tail.append(line)
+        except Exception as e:
+            self.context.logger.warning(f"Failed to read container output: {e}")
+        finally:
+            pipe.close()
+            if output_file:
+                output_file.close()
+
+    def _build_podman_command(self, keep_alive: bool = False) -> list[str]:
+        """With `keep_alive`, builds command starting detached container that does nothing, so commands can be executed in it later"""
         cmd = ["podman", "run", "--name", self.container_name]
+        if keep_alive:
+            cmd.extend(["--detach", "--rm", "--entrypoint", "sleep", "--label", f"{self.WARM_CONFIG_LABEL}={self._warm_config_hash()}"])
+        if self.pre_pull:
+            cmd.append("--pull=never")
 
         if self.additional_run_flags:
             import shlex
@@ -143,12 +238,81 @@ def _build_podman_command(self) -> list[str]:
 
         cmd.append(self.image)
 
-        if self.command:
+        if keep_alive:
+            cmd.append(str(self.warm_container_ttl))
+        elif self.command:
             import shlex
             cmd.extend(shlex.split(self.command))
 
         return cmd
 
+    def _build_podman_exec_command(self) -> list[str]:
+        import shlex
+        cmd = ["podman", "exec"]
+        if self.working_dir:
+            cmd.extend(["--workdir", self.working_dir])
+        if self.env_vars_config:
+            cmd.extend(self._build_command_env_var_args())
+        cmd.append(self.container_name)
+        cmd.extend(shlex.split(self.command))
+        return cmd
+
+    def _pull_image(self, image: str) -> str:
+        """Pulls image (once per process) and returns its digest-pinned reference (`repository@sha256:...`)"""
+        with PodmanRunImage._pinned_images_lock:
+            if pinned_image := PodmanRunImage._pinned_images.get(image):
+                self.context.logger.info(f"Image \"{image}\" was already pulled, using \"{pinned_image}\"")
+                return pinned_image
+            self.context.logger.info(f"Pulling image \"{image}\"...")
+            pull_result = self._run_sp_command(["podman", "pull", image], self.pull_timeout)
+            if pull_result.returncode != 0:
+                raise PodmanException(f"Failed to pull image {image}: {pull_result.stderr}")
+            pinned_image = self._find_image_digest_reference(image)
+            if not pinned_image:
+                self.context.logger.warning(f"Could not find digest of image {image}, it will be used as is")
+                pinned_image = image
+            PodmanRunImage._pinned_images[image] = pinned_image
+            return pinned_image
+
+    def _find_image_digest_reference(self, image: str) -> str | None:
+        if "@sha256:" in image:
+            return image
+        inspect_result = self._run_sp_command(["podman", "image", "inspect", "--format", "{{range .RepoDigests}}{{println .}}{{end}}", image],
+                                              self.operations_timeout)
+        if inspect_result.returncode != 0:
+            return None
+        references = inspect_result.stdout.split()
+        # image can be tagged in several repositories, digest of requested one is preferred
+        repository = image.rsplit(":", 1)[0] if ":" in image.rsplit("/", 1)[-1] else image
+        return next((reference for reference in references
+                     if reference.split("@")[0] == repository or reference.split("@")[0].endswith("/" + repository)),
+                    references[0] if references else None)
+
+    def _warm_config_hash(self) -> str:
+        """Hash of configuration that can't be changed after container is started"""
+        import hashlib, json
+        config = [self.image, self.working_dir, self.mounts_config, self.additional_run_flags, self.pre_pull]
+        return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+    def _start_warm_container(self):
+        """Starts warm container, unless it's already running with the same configuration"""
+        inspect_format = "{{.State.Running}} {{index .Config.Labels \"" + self.WARM_CONFIG_LABEL + "\"}}"
+        inspect_result = self._run_sp_command(["podman", "container", "inspect", "--format", inspect_format, self.container_name],
+                                              self.operations_timeout)
+        if inspect_result.returncode == 0:
+            running, _, config_hash = inspect_result.stdout.strip().partition(" ")
+            if running == "true" and config_hash == self._warm_config_hash():
+                self.context.logger.info(f"Reusing running warm container \"{self.container_name}\"")
+                return
+            if running == "true":
+                self.context.logger.warning(f"Warm container \"{self.container_name}\" was started with different image, mounts, "
+                                            f"working_dir or run flags, it will be recreated")
+            self._remove_container()
+        self.context.logger.info(f"Starting warm container \"{self.container_name}\"...")
+        start_result = self._run_sp_command(self._build_podman_command(keep_alive=True), self.pull_timeout)
+        if start_result.returncode != 0:
+            raise PodmanException(f"Failed to start warm container {self.container_name}: {start_result.stderr}")
+
     def _build_command_env_var_args(self) -> list[str]:
         args = []
         for key, value in self.env_vars_config.get("explicit", {}).items():
@@ -161,7 +325,7 @@ def _build_command_env_var_args(self) -> list[str]:
             args.extend(["--env-file", f"{env_file}"])
 
         if self.env_vars_config.get("pass_via_file"):
-            env_file_path = self.context_dir_path.joinpath("temp").joinpath("temp.env")
+            env_file_path = self._pass_via_file_env_path()
             env_file_path.parent.mkdir(parents=True, exist_ok=True)
             with open(env_file_path, 'w') as f:
                 for key, value in self.env_vars_config["pass_via_file"].items():
@@ -170,6 +334,13 @@ def _build_command_env_var_args(self) -> list[str]:
 
         return args
 
+    def _pass_via_file_env_path(self) -> Path:
+        return self.context_dir_path.joinpath("temp").joinpath(f"{self.container_name}.env")
+
+    def _remove_pass_via_file_env(self):
+        """Sensitive vars are only needed by podman when it starts container (or exec), so their file is not kept afterwards"""
+        self._pass_via_file_env_path().unlink(missing_ok=True)
+
     def _copy_files_from_container(self):
         for host_path, container_path in self.copy_files_config.items():
             full_host_path = self.context_dir_path.joinpath(host_path)
@@ -181,7 +352,7 @@ def _copy_files_from_container(self):
                 if copy_result.returncode != 0:
                     self.context.logger.warning(f"Failed to copy {container_path} to {host_path}: {copy_result.stderr}")
                 else:
-                    self.context.logger.debug(f"Copied {container_path} to {host_path}")
+                    self.context.logger.debug("Copied %s to %s", container_path, host_path)
             except subprocess.TimeoutExpired:
                 self.context.logger.warning(f"Copy command timed out after {self.operations_timeout} seconds")
 
@@ -199,12 +370,177 @@ def _extract_params_from_container(self):
                     if not temp_file_path.exists():
                         self.context.logger.warning(f"File {container_file_path} for params-extraction not found after copy")
                         continue
-                    if file_content := self._parse_custom_file_params(temp_file_path):
-                        base_key = output_key_base if output_key_base else container_file_path.replace('/','_').replace('.', '_')
-                        self.context.output_param_set(f"params.extracted_output.{base_key}", file_content)
+                    self._store_extracted_params(container_file_path, output_key_base, temp_file_path)
                 except Exception as e:
                     self.context.logger.warning(f"Failed to extract params from file {container_file_path}: {e}")
 
+    def _store_extracted_params(self, container_file_path: str, output_key_base: str, file_path: Path):
+        if file_content := self._parse_custom_file_params(file_path):
+            base_key = output_key_base if output_key_base else container_file_path.replace('/','_').replace('.', '_')
+            self.context.output_param_set(f"{self.output_params_key}.extracted_output.{base_key}", file_content)
+
+    def _copy_and_extract_in_bulk(self):
+        """
+        Copies all `copy_files_to_host` and `extract_params_from_files` paths at once: paths sharing top-level folder
+        in container are copied with single `podman cp` of their common parent, streamed as tar archive and filtered
+        on the fly (so only requested files are written). Such groups are copied concurrently
+        """
+        import tempfile
+        with tempfile.TemporaryDirectory() as temp_dir:
+            params_files = {container_file_path: Path(temp_dir, str(i), Path(container_file_path).name)
+                            for i, container_file_path in enumerate(self.extract_params_config)}
+            copies = [(container_file_path, file_path) for container_file_path, file_path in params_files.items()]
+            copies += [(container_path, self.context_dir_path.joinpath(host_path))
+                       for host_path, container_path in self.copy_files_config.items()]
+            errors = self._copy_paths_from_container(copies)
+
+            for container_file_path, output_key_base in self.extract_params_config.items():
+                if container_file_path in errors:
+                    self.context.logger.warning(f"Failed to copy file {container_file_path} for params-extraction: {errors[container_file_path]}")
+                    continue
+                try:
+                    self._store_extracted_params(container_file_path, output_key_base, params_files[container_file_path])
+                except Exception as e:
+                    self.context.logger.warning(f"Failed to extract params from file {container_file_path}: {e}")
+            for host_path, container_path in self.copy_files_config.items():
+                if container_path in errors:
+                    self.context.logger.warning(f"Failed to copy {container_path} to {host_path}: {errors[container_path]}")
+                else:
+                    self.context.logger.debug("Copied %s to %s", container_path, host_path)
+
+    def _copy_paths_from_container(self, copies: list[tuple[str, Path]]) -> dict[str, str]:
+        """Copies `(container_path, host_path)` pairs with `podman cp` semantics, returns error messages of failed container paths"""
+        from concurrent.futures import ThreadPoolExecutor
+        groups = self._group_paths_for_bulk_copy([container_path for container_path, _ in copies])
+        errors = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.BULK_COPY_MAX_WORKERS, len(groups)))) as executor:
+            futures = [executor.submit(self._copy_group_from_container, root,
+                                       [(container_path, host_path) for container_path, host_path in copies if container_path in paths])
+                       for root, paths in groups]
+            for future in futures:
+                errors.update(future.result())
+        return errors
+
+    @staticmethod
+    def _group_paths_for_bulk_copy(container_paths: list[str]) -> list[tuple[str | None, list[str]]]:
+        """Groups paths by top-level folder into `(common_parent, paths)`, single paths have no common parent"""
+        import posixpath
+        by_top_level = {}
+        for container_path in dict.fromkeys(container_paths):
+            normalized = posixpath.normpath("/" + container_path.lstrip("/"))
+            by_top_level.setdefault(normalized.split("/")[1], []).append(container_path)
+        groups = []
+        for paths in by_top_level.values():
+            if len(paths) == 1:
+                groups.append((None, paths))
+            else:
+                groups.append((posixpath.commonpath([posixpath.normpath("/" + path.lstrip("/")) for path in paths]), paths))
+        return groups
+
+    def _copy_group_from_container(self, root: str | None, copies: list[tuple[str, Path]]) -> dict[str, str]:
+        if root is None:
+            errors = {}
+            for container_path, host_path in copies:
+                host_path.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    copy_result = self._run_sp_command(["podman", "cp", f"{self.container_name}:{container_path}", str(host_path)],
+                                                       self.operations_timeout)
+                    if copy_result.returncode != 0:
+                        errors[container_path] = copy_result.stderr
+                except subprocess.TimeoutExpired:
+                    errors[container_path] = f"Copy command timed out after {self.operations_timeout} seconds"
+            return errors
+        return self._stream_copy_from_container(root, copies)
+
+    def _stream_copy_from_container(self, root: str, copies: list[tuple[str, Path]]) -> dict[str, str]:
+        """
+        Runs `podman cp container:root -` and extracts only requested paths from resulting tar stream.
+        Timeout is `operations_timeout` per requested path, same as total of separate copies
+        """
+        import posixpath, shutil, tarfile, tempfile
+        targets = []
+        for container_path, host_path in copies:
+            host_path.parent.mkdir(parents=True, exist_ok=True)
+            normalized = posixpath.normpath("/" + container_path.lstrip("/"))
+            # same as 'podman cp': when host path is an existing folder, source is copied into it
+            target = host_path.joinpath(posixpath.basename(normalized)) if host_path.is_dir() else host_path
+            targets.append((normalized, container_path, target))
+        found = set()
+        extracted = {}  # container path of extracted file -> host path it was written to (hard links refer to them)
+        link_errors = {}
+        timeout = self.operations_timeout * len(copies)
+        timed_out = threading.Event()
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(["podman", "cp", f"{self.container_name}:{root}", "-"], stdout=subprocess.PIPE,
+                                       stderr=stderr_file, cwd=self.context_dir_path)
+
+            def kill():
+                timed_out.set()
+                process.kill()
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            error = None
+            try:
+                with tarfile.open(fileobj=process.stdout, mode="r|") as archive:
+                    for member in archive:
+                        member_path = posixpath.normpath(posixpath.join(posixpath.dirname(root), member.name))
+                        destinations = []
+                        matched = []
+                        for normalized, container_path, target in targets:
+                            if member_path == normalized or member_path.startswith(normalized.rstrip("/") + "/"):
+                                found.add(container_path)
+                                matched.append(container_path)
+                                destination = target.joinpath(posixpath.relpath(member_path, normalized))
+                                if self._is_within(destination, target):
+                                    destinations.append(destination)
+                        for destination in destinations:
+                            destination.parent.mkdir(parents=True, exist_ok=True)
+                            if member.isdir():
+                                destination.mkdir(exist_ok=True)
+                            elif member.issym():
+                                destination.unlink(missing_ok=True)
+                                destination.symlink_to(member.linkname)
+                        if not destinations:
+                            continue
+                        if member.isfile():
+                            # stream archive can be read only once, other destinations get a copy of the first one
+                            with archive.extractfile(member) as source, open(destinations[0], 'wb') as output_file:
+                                shutil.copyfileobj(source, output_file)
+                            copy_source = destinations[0]
+                        elif member.islnk():
+                            # hard link refers to earlier member of archive, which is written only if it was requested too
+                            link_path = posixpath.normpath(posixpath.join(posixpath.dirname(root), member.linkname))
+                            if link_path not in extracted:
+                                for container_path in matched:
+                                    link_errors[container_path] = f"{member_path} is a hard link to {link_path}, which is not copied"
+                                continue
+                            copy_source = extracted[link_path]
+                        else:
+                            continue
+                        extracted[member_path] = copy_source
+                        for destination in destinations:
+                            if destination != copy_source:
+                                shutil.copyfile(copy_source, destination)
+            except tarfile.TarError as e:
+                error = str(e)
+            finally:
+                timer.cancel()
+                process.stdout.close()
+                returncode = process.wait()
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode('utf-8', errors='replace')
+        if timed_out.is_set():
+            return {container_path: f"Copy command timed out after {timeout} seconds" for container_path, _ in copies}
+        if error or (returncode != 0 and not found):
+            return {container_path: stderr or error or f"'podman cp' exited with code {returncode}" for container_path, _ in copies}
+        return {container_path: link_errors.get(container_path, f"{container_path} is not found in container")
+                for container_path, _ in copies if container_path not in found or container_path in link_errors}
+
+    @staticmethod
+    def _is_within(path: Path, parent: Path) -> bool:
+        return os.path.realpath(path) == os.path.realpath(parent) or \
+            os.path.realpath(path).startswith(os.path.realpath(parent) + os.sep)
+
     def _parse_custom_file_params(self, file_path: Path):
         try:
             try:
@@ -245,41 +581,58 @@ def _write_stdout_files(self, stdout: str, stderr: str):
         (self.output_files_path / "container_stderr.txt").write_text(stderr, encoding='utf-8')
 
     def _process_output(self, output: subprocess.CompletedProcess):
-        self.context.output_param_set("params.execution_time", f"{self.execution_time:0.3f}s")
-        self.context.output_param_set("params.return_code", output.returncode)
+        self.context.output_param_set(f"{self.output_params_key}.execution_time", f"{self.execution_time:0.3f}s")
+        self.context.output_param_set(f"{self.output_params_key}.return_code", output.returncode)
 
         if output.stdout and isinstance(output.stdout, bytes):
             output.stdout = output.stdout.decode('utf-8', errors='replace')
         if output.stderr and isinstance(output.stderr, bytes):
             output.stderr = output.stderr.decode('utf-8', errors='replace')
 
-        if self.save_stdout_to_logs:
+        if self.save_stdout_to_logs and not self.stream_output:
             if output.stdout:
-                self.context.logger.debug(f"Container stdout:\n{output.stdout}")
+                self.context.logger.debug("Container stdout:\n%s", output.stdout)
             if output.stderr:
-                self.context.logger.debug(f"Container stderr:\n{output.stderr}")
+                self.context.logger.debug("Container stderr:\n%s", output.stderr)
 
-        if self.save_stdout_to_files:
+        if self.save_stdout_to_files and not self.stream_output:
             self._write_stdout_files(output.stdout, output.stderr)
 
-        if self.save_stdout_to_params:
-            self.context.output_param_set("params.stdout", output.stdout)
-            self.context.output_param_set("params.stderr", output.stderr)
+        if self.pre_pull:
+            self.context.output_param_set(f"{self.output_params_key}.pinned_image", self.image)
 
-        if self.extract_params_config:
-            self._extract_params_from_container()
+        if self.save_stdout_to_params:
+            self.context.output_param_set(f"{self.output_params_key}.stdout", output.stdout)
+            self.context.output_param_set(f"{self.output_params_key}.stderr", output.stderr)
 
-        if self.copy_files_config:
-            self._copy_files_from_container()
+        if self.bulk_copy and (self.extract_params_config or self.copy_files_config):
+            self._copy_and_extract_in_bulk()
+        else:
+            if self.extract_params_config:
+                self._extract_params_from_container()
+            if self.copy_files_config:
+                self._copy_files_from_container()
 
         if output.returncode not in self.expected_return_codes:
             raise PodmanException(output.stderr)
 
     def _execute(self):
-        self.context.logger.info(f"Running podman image \"{self.image}\"...")
-        start = time.perf_counter()
+        if self.pre_pull:
+            self.image = self._pull_image(self.image)
+        keep_container = self.warm_container and not self.stop_warm_container
         try:
-            output = self._run_sp_command(self._build_podman_command())
+            if self.warm_container:
+                self._start_warm_container()
+                self.context.logger.info(f"Running command in warm container \"{self.container_name}\"...")
+                podman_command = self._build_podman_exec_command()
+            else:
+                self.context.logger.info(f"Running podman image \"{self.image}\"...")
+                podman_command = self._build_podman_command()
+            start = time.perf_counter()
+            if self.stream_output:
+                output = self._run_sp_command_streaming(podman_command, self.output_files_path)
+            else:
+                output = self._run_sp_command(podman_command)
             self.execution_time = time.perf_counter() - start
             self.context.logger.info(
                 f"Container finished with code: {output.returncode}"
@@ -289,23 +642,32 @@ def _execute(self):
 
         except subprocess.TimeoutExpired:
             self.context.logger.error(f"Container execution timed out after {self.timeout} seconds")
+            if keep_container:
+                self.context.logger.warning(f"Warm container {self.container_name} will be removed, as timed out command may still run in it")
+            keep_container = False
             raise
 
         except PodmanException:
             self.context.logger.error("Container exited with unexpected exitcode")
+            keep_container = False  # failed batch won't reach its last step, so warm container is not left behind
             raise
 
         except Exception as e:
             self.context.logger.error(f"Container execution failed: {e}")
+            keep_container = False
             raise
 
         finally:
-            if self.remove_container:
-                remove_output = subprocess.run(["podman", "rm", "-f", self.container_name], capture_output=True)
-                if remove_output.returncode != 0:
-                    self.context.logger.warning(f"Failed to remove container {self.container_name}:\n{remove_output.stdout}\n{remove_output.stderr}")
+            self._remove_pass_via_file_env()
+            if (self.warm_container and not keep_container) or (not self.warm_container and self.remove_container):
+                self._remove_container()
             self.context.output_params_save()
 
+    def _remove_container(self):
+        remove_output = subprocess.run(["podman", "rm", "-f", self.container_name], capture_output=True)
+        if remove_output.returncode != 0:
+            self.context.logger.warning(f"Failed to remove container {self.container_name}:\n{remove_output.stdout}\n{remove_output.stderr}")
+
 
 class PodmanException(Exception):
     pass
@@ -0,0 +1,222 @@
+import copy, re, subprocess, threading, time, uuid
+
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from qubership_pipelines_common_library.v1.utils.utils_string import UtilsString
+from qubership_pipelines_common_library.v2.podman.podman_command import PodmanRunImage, PodmanException
+
+
+class PodmanRunMatrix(PodmanRunImage):
+    """
+        Executes multiple containers concurrently (e.g. same image with different parameter sets), using "podman run" command.
+
+        Accepts all parameters of `PodmanRunImage` as common configuration of matrix entries,
+        each entry can override image, command, working_dir, and extend `before_script`/`after_script` sections.
+
+        Input Parameters Structure (this structure is expected inside "input_params.params" block):
+        ```
+        {
+            "image": "docker.io/library/python:3.11",  # REQUIRED: Container image to run (can be overridden by entry)
+            "command": "python -m pytest",  # OPTIONAL: Command to execute in container (can be overridden by entry)
+            "execution_config": {  # Same as in PodmanRunImage, applied to each container
+                "timeout": "600",  # Maximum execution time of each container in seconds
+                "max_parallel": "4",  # How many containers can run at the same time
+                "fail_fast": False,  # Do not start pending entries after first failed one
+            },
+            "before_script": {  # Same as in PodmanRunImage, common for all entries
+                "mounts": {
+                    "output_files/{name}": "/WORK"  # "{name}" in host paths is replaced with entry name
+                },
+            },
+            "after_script": {  # Same as in PodmanRunImage, common for all entries
+                "copy_files_to_host": {
+                    "output_files/{name}/report.json": "/WORK/report.json"
+                },
+            },
+            "matrix": [  # REQUIRED: List of entries, each one is executed in its own container
+                {
+                    "name": "py311",  # OPTIONAL: Entry name (letters, digits, "_" and "-"), index of entry is used by default
+                    "image": "docker.io/library/python:3.11",  # OPTIONAL: Overrides common image
+                    "command": "python -m pytest tests/unit",  # OPTIONAL: Overrides common command
+                    "working_dir": "/WORK",  # OPTIONAL: Overrides common working_dir
+                    "before_script": {  # OPTIONAL: Merged into common before_script
+                        "mounts": {"prepared_data/py311": "/CONFIGS"},
+                        "env_vars": {"explicit": {"TEST_SUITE": "unit"}}
+                    },
+                    "after_script": {  # OPTIONAL: Merged into common after_script
+                        "extract_params_from_files": {"/WORK/result.json": "result"}
+                    }
+                }
+            ]
+        }
+        ```
+
+        Output Parameters:
+            - params.execution_time: Total execution time in seconds
+            - params.return_codes: Exit codes of containers by entry name (`None` if container did not finish)
+            - params.failed_entries: Names of entries that did not succeed
+            - params.matrix.<name>.status: One of SUCCESS, FAILED, TIMEOUT, ERROR, SKIPPED
+            - params.matrix.<name>.*: Output params of entry, same as params of PodmanRunImage (return_code, execution_time, stdout, stderr, extracted_output)
+
+        Notes:
+            - Output of containers is always streamed: lines are logged with "[<name>]" prefix, and written to "<name>" subfolder of output files
+            - Command fails after all entries are finished, if any of them did not succeed
+            - With pre_pull, each distinct image is pulled once before entries are started
+            - Missing host folders of mounts with "{name}" placeholder are created before entries are started
+        """
+
+    MAX_PARALLEL = 4
+    ENTRY_NAME_PATTERN = re.compile(r"[\w-]+")
+
+    class EntryStatus(StrEnum):
+        SUCCESS = "SUCCESS"
+        FAILED = "FAILED"
+        TIMEOUT = "TIMEOUT"
+        ERROR = "ERROR"
+        SKIPPED = "SKIPPED"
+
+    def _validate(self):
+        if not self.context.validate(["params.matrix"]):
+            return False
+        if not super()._validate():
+            return False
+
+        self.max_parallel = int(self.context.input_param_get("params.execution_config.max_parallel", self.MAX_PARALLEL))
+        self.fail_fast = UtilsString.convert_to_bool(self.context.input_param_get("params.execution_config.fail_fast", False))
+        matrix = self.context.input_param_get("params.matrix")
+        if not isinstance(matrix, list) or not matrix:
+            self.context.logger.error("Parameter 'params.matrix' should be a non-empty list of entries")
+            return False
+        if self.warm_container:
+            self.context.logger.error("Parameter 'params.execution_config.warm_container' is not supported by matrix, as entries run concurrently")
+            return False
+        if self.max_parallel < 1:
+            self.context.logger.error("Parameter 'params.execution_config.max_parallel' should be positive")
+            return False
+
+        self.entries = {}
+        for index, entry in enumerate(matrix):
+            name = str(entry.get("name", index))
+            if not self.ENTRY_NAME_PATTERN.fullmatch(name):
+                self.context.logger.error(f"Invalid matrix entry name '{name}': only letters, digits, '_' and '-' are allowed")
+                return False
+            if name in self.entries:
+                self.context.logger.error(f"Duplicate matrix entry name '{name}'")
+                return False
+            self.entries[name] = self._create_entry_runner(name, entry)
+        return True
+
+    def _create_entry_runner(self, name: str, entry: dict) -> PodmanRunImage:
+        """Returns copy of this command configured to run single entry, its output params are stored under `params.matrix.<name>`"""
+        before_script = entry.get("before_script", {})
+        after_script = entry.get("after_script", {})
+        runner = copy.copy(self)
+        runner.image = entry.get("image", self.image)
+        runner.command = entry.get("command", self.command)
+        runner.working_dir = entry.get("working_dir", self.working_dir)
+        mounts_config = {**self.mounts_config, **before_script.get("mounts", {})}
+        runner.mounts_config = self._with_entry_name(name, mounts_config)
+        runner.entry_mount_paths = [host_path.replace("{name}", name) for host_path in mounts_config if "{name}" in host_path]
+        runner.env_vars_config = self._merge_env_vars_config(self.env_vars_config, before_script.get("env_vars", {}))
+        runner.copy_files_config = self._with_entry_name(name, {**self.copy_files_config, **after_script.get("copy_files_to_host", {})})
+        runner.extract_params_config = {**self.extract_params_config, **after_script.get("extract_params_from_files", {})}
+        runner.stream_output = True
+        runner.output_files_path = self.output_files_path.joinpath(name)
+        runner.output_params_key = f"params.matrix.{name}"
+        runner.container_name = f"podman_{str(uuid.uuid4())}"
+        return runner
+
+    @staticmethod
+    def _with_entry_name(name: str, host_paths_config: dict) -> dict:
+        """Replaces "{name}" placeholder in host paths (keys of config)"""
+        return {host_path.replace("{name}", name): container_path for host_path, container_path in host_paths_config.items()}
+
+    @staticmethod
+    def _merge_env_vars_config(common: dict, entry: dict) -> dict:
+        return {
+            "explicit": {**common.get("explicit", {}), **entry.get("explicit", {})},
+            "env_files": [*common.get("env_files", []), *entry.get("env_files", [])],
+            "pass_via_file": {**common.get("pass_via_file", {}), **entry.get("pass_via_file", {})},
+            "host_prefixes": [*common.get("host_prefixes", []), *entry.get("host_prefixes", [])],
+        }
+
+    def _execute(self):
+        self.context.logger.info(f"Running {len(self.entries)} matrix entries (at most {self.max_parallel} at the same time)...")
+        start = time.perf_counter()
+        if self.pre_pull:
+            for runner in self.entries.values():
+                runner.image = self._pull_image(runner.image)
+        # per-entry host folders (e.g. "output_files/{name}") do not exist yet, and podman fails to bind missing sources
+        for runner in self.entries.values():
+            for host_path in runner.entry_mount_paths:
+                full_host_path = self.context_dir_path.joinpath(host_path)
+                if not full_host_path.exists():
+                    full_host_path.mkdir(parents=True)
+        # nested dicts of all entries are created before threads start, so each thread only writes into its own one
+        for name in self.entries:
+            self.context.output_param_set(f"params.matrix.{name}", {})
+        stop_event = threading.Event()
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(self.entries))) as executor:
+                futures = {name: executor.submit(self._run_entry, name, runner, stop_event)
+                           for name, runner in self.entries.items()}
+            statuses = {name: future.result() for name, future in futures.items()}
+            self.execution_time = time.perf_counter() - start
+
+            return_codes = {name: self.context.output_params.get(f"params.matrix.{name}.return_code")
+                            for name in self.entries}
+            failed_entries = [name for name, status in statuses.items() if status != self.EntryStatus.SUCCESS]
+            self.context.output_param_set("params.execution_time", f"{self.execution_time:0.3f}s")
+            self.context.output_param_set("params.return_codes", return_codes)
+            self.context.output_param_set("params.failed_entries", failed_entries)
+            self.context.logger.info(
+                "Matrix finished: " + ", ".join(f"{name}: {status}" for name, status in statuses.items())
+                + f"\nExecution time: {self.execution_time:0.3f}s"
+            )
+            if failed_entries:
+                raise PodmanException(f"Matrix entries did not succeed: {', '.join(failed_entries)}")
+
+        except PodmanException:
+            self.context.logger.error("Some of matrix containers exited with unexpected exitcode")
+            raise
+
+        finally:
+            self.context.output_params_save()
+
+    def _run_entry(self, name: str, runner: PodmanRunImage, stop_event: threading.Event) -> str:
+        status = self._run_entry_container(name, runner, stop_event)
+        runner.context.output_param_set(f"{runner.output_params_key}.status", str(status))
+        if self.fail_fast and status != self.EntryStatus.SUCCESS:
+            stop_event.set()
+        return status
+
+    def _run_entry_container(self, name: str, runner: PodmanRunImage, stop_event: threading.Event) -> str:
+        if stop_event.is_set():
+            self.context.logger.warning(f"[{name}] Skipped, as one of previous entries did not succeed")
+            return self.EntryStatus.SKIPPED
+        self.context.logger.info(f"[{name}] Running podman image \"{runner.image}\"...")
+        start = time.perf_counter()
+        try:
+            output = runner._run_sp_command_streaming(runner._build_podman_command(), runner.output_files_path, f"[{name}] ")
+            runner.execution_time = time.perf_counter() - start
+            self.context.logger.info(f"[{name}] Container finished with code: {output.returncode}"
+                                     f"\nExecution time: {runner.execution_time:0.3f}s")
+            runner._process_output(output)
+            return self.EntryStatus.SUCCESS
+
+        except subprocess.TimeoutExpired:
+            self.context.logger.error(f"[{name}] Container execution timed out after {runner.timeout} seconds")
+            return self.EntryStatus.TIMEOUT
+
+        except PodmanException:
+            self.context.logger.error(f"[{name}] Container exited with unexpected exitcode")
+            return self.EntryStatus.FAILED
+
+        except Exception as e:
+            self.context.logger.error(f"[{name}] Container execution failed: {e}")
+            return self.EntryStatus.ERROR
+
+        finally:
+            runner._remove_pass_via_file_env()
+            if runner.remove_container:
+                runner._remove_container()
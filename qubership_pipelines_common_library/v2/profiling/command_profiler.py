@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from enum import StrEnum
+from pathlib import Path
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
+from qubership_pipelines_common_library.v2.telemetry.tracing import Tracer
+
+
+class CommandProfiler:
+    """
+    Measures wall time of `ExecutionCommand` lifecycle phases (and any nested phases, e.g. extensions or output saving).
+    When profiling or tracing is enabled, they are written into `command_timings.json` in logs folder.
+    When tracing is enabled, phases are also reported as spans under the command span (see `Tracer`).
+    Collected `Metrics` are exported when profiler is stopped.
+
+    Profiling is enabled via `--profiler` CLI option or `PIPELINES_COMMAND_PROFILER` environment variable:
+    `TIMINGS` only saves phase timings, `CPROFILE` and `PYINSTRUMENT` also capture full profile of command run
+    with `cProfile` or `pyinstrument` (if installed)
+    """
+
+    class ProfilerMode(StrEnum):
+        OFF = 'OFF'
+        TIMINGS = 'TIMINGS'
+        CPROFILE = 'CPROFILE'
+        PYINSTRUMENT = 'PYINSTRUMENT'
+
+    PROFILER_MODE_ENV = "PIPELINES_COMMAND_PROFILER"
+    PROFILER_MODE = None  # when not configured explicitly, value from environment is used
+    FILE_NAME_TIMINGS = "command_timings.json"
+    FILE_NAME_CPROFILE = "command_profile.prof"
+    FILE_NAME_PYINSTRUMENT = "command_profile.html"
+
+    _active = ContextVar("active_command_profiler", default=None)
+
+    @staticmethod
+    def configure(profiler_mode: ProfilerMode):
+        CommandProfiler.PROFILER_MODE = CommandProfiler.ProfilerMode(profiler_mode)
+
+    @staticmethod
+    def get_profiler_mode() -> ProfilerMode:
+        if CommandProfiler.PROFILER_MODE:
+            return CommandProfiler.PROFILER_MODE
+        env_value = os.getenv(CommandProfiler.PROFILER_MODE_ENV, CommandProfiler.ProfilerMode.OFF).strip().upper()
+        try:
+            return CommandProfiler.ProfilerMode(env_value)
+        except ValueError:
+            logging.warning(f"Unsupported {CommandProfiler.PROFILER_MODE_ENV} value: '{env_value}', profiling is disabled")
+            return CommandProfiler.ProfilerMode.OFF
+
+    @staticmethod
+    @contextmanager
+    def measure(name: str):
+        """Records phase into profiler of currently running command (does nothing outside of command run)"""
+        profiler = CommandProfiler._active.get()
+        if profiler is None:
+            yield
+            return
+        with profiler.phase(name):
+            yield
+
+    def __init__(self, command_name: str):
+        self.command_name = command_name
+        self.phases = []
+        self.success = None  # outcome of command, when it's known (otherwise derived from statuses of phases)
+        self._stack = []
+        self._created_at = time.perf_counter()
+        self._started_at_utc = datetime.now(timezone.utc)
+        self._profiler = None
+        self._profiler_mode = CommandProfiler.ProfilerMode.OFF
+        self._token = None
+        self._root_span = Tracer.start_span(f"command {command_name}", attributes={"pipelines.command": command_name})
+
+    @contextmanager
+    def phase(self, name: str):
+        """Measures wall time of enclosed block. Phases started inside other phases are named `parent/child`"""
+        full_name = "/".join(self._stack + [name])
+        parent_span = None if self._stack else self._root_span
+        self._stack.append(name)
+        status = "success"
+        started_at = time.perf_counter()
+        try:
+            with Tracer.span(f"phase {name}", attributes={"pipelines.phase": full_name}, parent=parent_span):
+                yield
+        except SystemExit as e:
+            status = "success" if not e.code else "failure"
+            raise
+        except BaseException:
+            status = "failure"
+            raise
+        finally:
+            finished_at = time.perf_counter()
+            self._stack.pop()
+            self.phases.append({
+                "name": full_name,
+                "start_offset_seconds": round(started_at - self._created_at, 6),
+                "duration_seconds": round(finished_at - started_at, 6),
+                "status": status,
+            })
+
+    def start(self):
+        """Makes this profiler active for `measure` calls and starts full profiling, if it's enabled"""
+        self._token = CommandProfiler._active.set(self)
+        self._profiler_mode = CommandProfiler.get_profiler_mode()
+        if self._profiler_mode == CommandProfiler.ProfilerMode.CPROFILE:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self._profiler_mode == CommandProfiler.ProfilerMode.PYINSTRUMENT:
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                logging.warning("pyinstrument is not installed, full profiling is disabled")
+                return
+            self._profiler = Profiler()
+            self._profiler.start()
+
+    def stop(self, path_logs: str | Path = None):
+        """Stops profiling and saves its results (and enabled tracing/metrics exports) into `path_logs` (if provided)"""
+        if self._token is not None:
+            CommandProfiler._active.reset(self._token)
+            self._token = None
+        profile_file = None
+        if self._profiler is not None:
+            if self._profiler_mode == CommandProfiler.ProfilerMode.CPROFILE:
+                self._profiler.disable()
+                if path_logs:
+                    profile_file = Path(path_logs).joinpath(CommandProfiler.FILE_NAME_CPROFILE)
+                    self._profiler.dump_stats(profile_file)
+            else:
+                self._profiler.stop()
+                if path_logs:
+                    profile_file = Path(path_logs).joinpath(CommandProfiler.FILE_NAME_PYINSTRUMENT)
+                    profile_file.write_text(self._profiler.output_html(), encoding="utf-8")
+            self._profiler = None
+        if path_logs and (self._profiler_mode != CommandProfiler.ProfilerMode.OFF or Tracer.is_enabled()):
+            self.save(Path(path_logs).joinpath(CommandProfiler.FILE_NAME_TIMINGS), profile_file)
+        self._root_span.end()
+        Tracer.flush(path_logs)
+        Metrics.command_duration.set(round(time.perf_counter() - self._created_at, 6), command=self.command_name)
+        success = self.success if self.success is not None else all(phase["status"] == "success" for phase in self.phases)
+        Metrics.command_success.set(int(success), command=self.command_name)
+        Metrics.export(path_logs)
+
+    def to_dict(self, profile_file: Path = None) -> dict:
+        return {
+            "command": self.command_name,
+            "started_at": self._started_at_utc.isoformat(),
+            "total_seconds": round(time.perf_counter() - self._created_at, 6),
+            "profiler": str(self._profiler_mode),
+            "profile_file": profile_file.name if profile_file else None,
+            "phases": sorted(self.phases, key=lambda phase: phase["start_offset_seconds"]),
+        }
+
+    def save(self, file_path: Path, profile_file: Path = None):
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(file_path, mode="w", encoding="utf-8") as file:
+                json.dump(self.to_dict(profile_file), file, indent=2)
+        except Exception as e:
+            logging.warning(f"Could not save command timings into '{file_path}': {e}")
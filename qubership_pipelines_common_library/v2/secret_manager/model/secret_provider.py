@@ -33,6 +33,14 @@ def get_provider_name(self) -> str:
     def secret_exists(self, path: str) -> bool:
         pass
 
+    def resolve_provider(self, path: str) -> "SecretProvider":
+        """Returns provider that actually serves given path (differs from `self` only in composite providers)"""
+        return self
+
+    def warm_up(self, paths: list[str], **kwargs) -> None:
+        """Prepares provider(s) serving given paths in advance (no-op for providers that are ready after construction)"""
+        pass
+
     def parse_vals_path(self, vals_path: str) -> tuple[str, Optional[str]]:
         provider = None
         secret_path = vals_path
@@ -56,6 +64,29 @@ def parse_vals_path(self, vals_path: str) -> tuple[str, Optional[str]]:
             raise Exception(f"Path implies provider {provider}, but is passed into {self.get_provider_name()}")
         return secret_path, fragment
 
+    @staticmethod
+    def split_fragment(path: str) -> tuple[str, Optional[str]]:
+        """Splits path into part addressing the whole secret, and its fragment (if any). Keeps provider scheme and query."""
+        if "#" not in path:
+            return path, None
+        secret_path, frag = path.split("#", 1)
+        return secret_path, frag.lstrip("#").lstrip("/")
+
+    @staticmethod
+    def get_frag_value_from_payload(payload: str, frag: str) -> str | None:
+        """Gets nested value from raw (JSON/YAML) secret payload, stringified the same way providers do it."""
+        import yaml
+        try:
+            data = yaml.safe_load(payload)
+        except yaml.YAMLError:
+            raise ValueError("Secret payload could not be unmarshalled as YAML/JSON")
+        if not isinstance(data, dict):
+            raise ValueError("Secret payload is not a mapping; cannot apply fragment")
+        secret_value = SecretProvider.get_frag_value(data, frag)
+        if secret_value is not None and not isinstance(secret_value, str):
+            secret_value = str(secret_value)
+        return secret_value
+
     @staticmethod
     def get_frag_value(data: dict, frag: str) -> Any:
         """Gets nested value."""
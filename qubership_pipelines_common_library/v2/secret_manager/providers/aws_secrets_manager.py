@@ -1,11 +1,10 @@
 import json
-import boto3
 import yaml
 
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing import Any
 from qubership_pipelines_common_library.v1.utils.utils import recursive_merge
+from qubership_pipelines_common_library.v2.artifacts_finder.auth.aws_credentials import AwsCredentialsProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
 from qubership_pipelines_common_library.v2.secret_manager.model.secret_provider import SecretProvider
 
@@ -19,13 +18,7 @@ def __init__(self, credentials: Credentials, **kwargs):
         """
         super().__init__(**kwargs)
         self._credentials = credentials
-        self._aws_client = boto3.client(
-            service_name='secretsmanager',
-            config=Config(region_name=credentials.region_name),
-            aws_access_key_id=credentials.access_key,
-            aws_secret_access_key=credentials.secret_key,
-            aws_session_token=credentials.session_token,
-        )
+        self._aws_client = AwsCredentialsProvider.create_client('secretsmanager', credentials)
 
     def read_secret(self, path: str) -> str | None:
         secret_path, frag = self.parse_vals_path(path)
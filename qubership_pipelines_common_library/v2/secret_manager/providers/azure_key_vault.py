@@ -8,6 +8,7 @@
 from qubership_pipelines_common_library.v1.utils.utils_string import UtilsString
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
 from qubership_pipelines_common_library.v2.secret_manager.model.secret_provider import SecretProvider
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
 
 
 class AzureKeyVaultProvider(SecretProvider):
@@ -25,9 +26,9 @@ def __init__(self, credentials: Credentials, **kwargs):
         self._credentials = credentials
         self._session = requests.Session()
         self._session.headers.update({
-            "Authorization": f"Bearer {credentials.access_token}",
             "Content-Type": "application/json",
         })
+        Instrumentation.instrument_session(self._session, "azure_key_vault")
 
     def read_secret(self, path: str) -> str | None:
         secret_path, frag = self.parse_vals_path(path)
@@ -125,7 +126,9 @@ def secret_exists(self, path: str) -> bool:
 
     def _request(self, method: str, vault_url: str, api_path: str, json_data: dict = None) -> dict:
         url = f"{vault_url}/{api_path}?api-version={self.API_VERSION}"
-        response = self._session.request(method, url, json=json_data)
+        # Token is read per request, so refreshed credentials are picked up by this session
+        response = self._session.request(method, url, json=json_data,
+                                         headers={"Authorization": f"Bearer {self._credentials.access_token}"})
         response.raise_for_status()
         if response.content:
             return response.json()
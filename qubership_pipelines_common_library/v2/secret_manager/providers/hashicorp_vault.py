@@ -1,5 +1,7 @@
 import json
+import logging
 import os
+import threading
 import hvac
 
 from typing import Any
@@ -7,18 +9,68 @@
 from qubership_pipelines_common_library.v1.utils.utils import recursive_merge
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
 from qubership_pipelines_common_library.v2.secret_manager.model.secret_provider import SecretProvider
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
+
+
+class VaultMountCache:
+    """
+    Thread-safe cache of discovered KV mounts (mount point -> KV version) of a single Vault/OpenBao server/namespace.
+    Secrets are matched to the longest known mount point prefix, so sibling secrets don't require extra lookups.
+    Can be shared between provider instances working with the same server.
+    """
+
+    def __init__(self):
+        self._mounts = {}
+        self._lock = threading.Lock()
+
+    def find(self, path: str) -> tuple[str, int] | None:
+        """Returns (mount_point, kv_version) of the longest known mount containing given path"""
+        with self._lock:
+            matching = [mount_point for mount_point in self._mounts if path.startswith(mount_point)]
+            if not matching:
+                return None
+            mount_point = max(matching, key=len)
+            return mount_point, self._mounts[mount_point]
+
+    def add(self, mount_point: str, kv_version: int):
+        if not mount_point.endswith("/"):
+            mount_point += "/"
+        with self._lock:
+            self._mounts[mount_point] = kv_version
+
+    def warm_up(self, vault_client: hvac.Client) -> bool:
+        """Lists all KV mounts once via 'sys/mounts' (requires corresponding permission). Returns whether it succeeded."""
+        try:
+            response = vault_client.sys.list_mounted_secrets_engines()
+        except Exception as e:
+            logging.debug("Could not list mounts for warm-up, will detect them per secret path: %s", e)
+            return False
+        mounts = response.get("data", response) if isinstance(response, dict) else {}
+        for mount_point, mount_info in mounts.items():
+            if isinstance(mount_info, dict) and mount_info.get("type") in ("kv", "generic"):
+                options = mount_info.get("options") or {}
+                self.add(mount_point, 2 if options.get("version") == "2" else 1)
+        return True
+
+    def __len__(self):
+        with self._lock:
+            return len(self._mounts)
 
 
 class HashicorpVaultProvider(SecretProvider):
 
     def __init__(self, url: str = None, namespace: str = None, verify: bool = True, credentials: Credentials = None,
-                 vault_client: hvac.Client = None, **kwargs):
+                 vault_client: hvac.Client = None, mount_cache: VaultMountCache = None, warm_up_mounts: bool = False,
+                 **kwargs):
         """
         Initializes this client to work with **Hashicorp Vault**.
         Requires URL, and Credentials object (from HashicorpVaultCredentialsProvider), or preconfigured hvac.Client
+
+        Discovered KV mounts are kept in `mount_cache` (pass the same `VaultMountCache` to share it between providers).
+        With `warm_up_mounts=True`, all mounts are listed once via 'sys/mounts' (if permitted).
         """
         super().__init__(**kwargs)
-        self.mount_versions = {}
+        self.mount_cache = mount_cache if mount_cache is not None else VaultMountCache()
 
         if not vault_client:
             vault_addr = url or os.environ.get("VAULT_ADDR")
@@ -36,8 +88,11 @@ def __init__(self, url: str = None, namespace: str = None, verify: bool = True,
         else:
             self._vault_client = vault_client
 
+        Instrumentation.instrument_session(getattr(self._vault_client.adapter, "session", None), "vault")
         if not self._vault_client.is_authenticated():
             raise Exception("Vault Client is not authenticated")
+        if warm_up_mounts:
+            self.mount_cache.warm_up(self._vault_client)
 
     def read_secret(self, path: str) -> str | None:
         secret_path_with_mount, frag = self.parse_vals_path(path)
@@ -137,8 +192,9 @@ def _get_raw_secret_data(self, secret_path: str, mount_point: str, kv_version: i
             return None
 
     def _detect_kv_version_and_mount_point(self, path: str) -> tuple[int, str, str]:
-        if path in self.mount_versions:
-            return self.mount_versions[path]
+        if cached_mount := self.mount_cache.find(path):
+            mount_point, version = cached_mount
+            return version, path[len(mount_point):], mount_point
 
         version = 1
         secret_path = path
@@ -156,5 +212,6 @@ def _detect_kv_version_and_mount_point(self, path: str) -> tuple[int, str, str]:
         except Exception as exc:
             raise Exception(f"Unable to detect mount point and version for '{path}'") from exc
 
-        self.mount_versions[path] = (version, secret_path, mount_point)
+        if mount_point:
+            self.mount_cache.add(mount_point, version)
         return version, secret_path, mount_point
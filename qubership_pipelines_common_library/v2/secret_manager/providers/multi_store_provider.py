@@ -1,43 +1,65 @@
+import logging
 import os
+import threading
+
 from typing import Any
 from urllib.parse import urlparse, unquote
 
-from qubership_pipelines_common_library.v2.artifacts_finder.auth.aws_credentials import AwsCredentialsProvider
-from qubership_pipelines_common_library.v2.artifacts_finder.auth.azure_credentials import AzureCredentialsProvider
-from qubership_pipelines_common_library.v2.artifacts_finder.auth.gcp_credentials import GcpCredentialsProvider
-from qubership_pipelines_common_library.v2.artifacts_finder.auth.hashicorp_vault_credentials import HashicorpVaultCredentialsProvider
-from qubership_pipelines_common_library.v2.artifacts_finder.auth.openbao_credentials import OpenBaoCredentialsProvider
 from qubership_pipelines_common_library.v2.secret_manager.model.secret_provider import SecretProvider
-from qubership_pipelines_common_library.v2.secret_manager.providers.aws_secrets_manager import AwsSecretsManagerProvider
-from qubership_pipelines_common_library.v2.secret_manager.providers.azure_key_vault import AzureKeyVaultProvider
-from qubership_pipelines_common_library.v2.secret_manager.providers.gcp_secret_manager import GcpSecretManagerProvider
-from qubership_pipelines_common_library.v2.secret_manager.providers.hashicorp_vault import HashicorpVaultProvider
-from qubership_pipelines_common_library.v2.secret_manager.providers.openbao import OpenBaoProvider
+from qubership_pipelines_common_library.v2.utils.extension_utils import ExtensionLoader, LazyClassMap
 
 
 class MultiStoreProvider(SecretProvider):
 
     STORE_ID_PARAM_NAME = "secret_store_id"
 
-    PROVIDER_MAP = {
-        "awssecrets": AwsSecretsManagerProvider,
-        "azurekeyvault": AzureKeyVaultProvider,
-        "gcpsecrets": GcpSecretManagerProvider,
-        "openbao": OpenBaoProvider,
-        "vault": HashicorpVaultProvider,
-    }
-
-    CREDENTIALS_MAP = {
-        "awssecrets": AwsCredentialsProvider,
-        "azurekeyvault": AzureCredentialsProvider,
-        "gcpsecrets": GcpCredentialsProvider,
-        "openbao": OpenBaoCredentialsProvider,
-        "vault": HashicorpVaultCredentialsProvider,
-    }
-
-    def __init__(self, **kwargs):
+    # Classes are referenced by classpath and imported on first read, so SDKs of unused stores (boto3, hvac, google-cloud)
+    # are not imported, readers of the maps still get classes. Class objects are accepted as values as well
+    PROVIDER_MAP = LazyClassMap({
+        "awssecrets": "qubership_pipelines_common_library.v2.secret_manager.providers.aws_secrets_manager.AwsSecretsManagerProvider",
+        "azurekeyvault": "qubership_pipelines_common_library.v2.secret_manager.providers.azure_key_vault.AzureKeyVaultProvider",
+        "gcpsecrets": "qubership_pipelines_common_library.v2.secret_manager.providers.gcp_secret_manager.GcpSecretManagerProvider",
+        "openbao": "qubership_pipelines_common_library.v2.secret_manager.providers.openbao.OpenBaoProvider",
+        "vault": "qubership_pipelines_common_library.v2.secret_manager.providers.hashicorp_vault.HashicorpVaultProvider",
+    })
+
+    CREDENTIALS_MAP = LazyClassMap({
+        "awssecrets": "qubership_pipelines_common_library.v2.artifacts_finder.auth.aws_credentials.AwsCredentialsProvider",
+        "azurekeyvault": "qubership_pipelines_common_library.v2.artifacts_finder.auth.azure_credentials.AzureCredentialsProvider",
+        "gcpsecrets": "qubership_pipelines_common_library.v2.artifacts_finder.auth.gcp_credentials.GcpCredentialsProvider",
+        "openbao": "qubership_pipelines_common_library.v2.artifacts_finder.auth.openbao_credentials.OpenBaoCredentialsProvider",
+        "vault": "qubership_pipelines_common_library.v2.artifacts_finder.auth.hashicorp_vault_credentials.HashicorpVaultCredentialsProvider",
+    })
+
+    DEFAULT_MAX_WORKERS = 8
+
+    # Process-wide state, used by instances created with `shared=True`
+    _shared_state = {"providers": {}, "mount_caches": {}, "build_locks": {}, "lock": threading.Lock()}
+
+    def __init__(self, warm_up_vault_mounts: bool = False, shared: bool = False, **kwargs):
+        """
+        Vault/OpenBao providers for stores pointing to the same server (address + namespace) share one `VaultMountCache`.
+        With `warm_up_vault_mounts=True`, their mounts are listed once via 'sys/mounts' (if permitted).
+
+        With `shared=True`, built providers (and their credentials) are reused by all shared `MultiStoreProvider`
+        instances in the process, e.g. by different `SecretManager` instances.
+
+        Use `warm_up(paths)` to build all providers required for given paths in parallel, instead of lazily one by one.
+        """
         super().__init__(**kwargs)
-        self._cache = {}
+        state = self._shared_state if shared else {"providers": {}, "mount_caches": {}, "build_locks": {}, "lock": threading.Lock()}
+        self._cache = state["providers"]
+        self._mount_caches = state["mount_caches"]
+        self._build_locks = state["build_locks"]
+        self._lock = state["lock"]
+        self._warm_up_vault_mounts = warm_up_vault_mounts
+
+    @classmethod
+    def clear_shared_providers(cls):
+        with cls._shared_state["lock"]:
+            cls._shared_state["providers"].clear()
+            cls._shared_state["mount_caches"].clear()
+            cls._shared_state["build_locks"].clear()
 
     def read_secret(self, path: str) -> str | None:
         return self.with_provider(path).read_secret(path)
@@ -57,12 +79,57 @@ def secret_exists(self, path: str) -> bool:
     def get_provider_name(self) -> str:
         return "multistore"
 
+    def resolve_provider(self, path: str) -> SecretProvider:
+        return self.with_provider(path)
+
+    def warm_up(self, paths: list[str], max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """
+        Builds providers for all stores referenced by given paths concurrently (including credential exchange).
+        Stores that fail to initialize (e.g. due to transient network error) are logged and skipped -
+        they are built again when used, raising the error if it persists.
+        """
+        store_keys = list(dict.fromkeys(self.parse_provider_type(path) for path in paths))
+        store_keys = [key for key in store_keys if self._cache_key(*key) not in self._cache]
+        if not store_keys:
+            return
+
+        def build(store_key):
+            try:
+                self._get_or_build(*store_key)
+            except Exception as e:
+                logging.warning(f"Could not initialize '{store_key[0]}' secret store '{store_key[1] or 'default'}': {e}")
+
+        if max_workers <= 1 or len(store_keys) == 1:
+            for store_key in store_keys:
+                build(store_key)
+            return
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(store_keys))) as executor:
+            list(executor.map(build, store_keys))
+
     def with_provider(self, path: str) -> SecretProvider:
         provider_type, store_id = self.parse_provider_type(path)
-        cache_key = (provider_type, store_id or "default")
-        if cache_key not in self._cache:
-            self._cache[cache_key] = self._build_provider(provider_type, store_id)
-        return self._cache[cache_key]
+        return self._get_or_build(provider_type, store_id)
+
+    @staticmethod
+    def _cache_key(provider_type: str, store_id: str | None) -> tuple:
+        return provider_type, store_id or "default"
+
+    def _get_or_build(self, provider_type: str, store_id: str | None) -> SecretProvider:
+        cache_key = self._cache_key(provider_type, store_id)
+        with self._lock:
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+            build_lock = self._build_locks.setdefault(cache_key, threading.Lock())
+        # Different stores are built concurrently, while the same store is built only once
+        with build_lock:
+            with self._lock:
+                if cache_key in self._cache:
+                    return self._cache[cache_key]
+            provider = self._build_provider(provider_type, store_id)
+            with self._lock:
+                self._cache[cache_key] = provider
+            return provider
 
     @classmethod
     def parse_provider_type(cls, path: str) -> tuple[str, str | None]:
@@ -82,22 +149,62 @@ def parse_provider_type(cls, path: str) -> tuple[str, str | None]:
 
     def _build_provider(self, provider_type: str, store_id: str | None) -> SecretProvider:
         prefix = f"{store_id}_" if store_id else ""
-        creds_provider = self.CREDENTIALS_MAP[provider_type]
+        creds_provider = self.get_credentials_provider_class(provider_type)
         creds = creds_provider().with_env_vars(prefix=prefix).get_credentials()
-        provider_cls = self.PROVIDER_MAP[provider_type]
+        provider_cls = self.get_provider_class(provider_type)
 
         if provider_type == "vault":
             url = os.getenv(f"{prefix}VAULT_ADDR")
             namespace = os.getenv(f"{prefix}VAULT_NAMESPACE")
             if not url:
                 raise ValueError(f"Vault address not found: set {prefix}VAULT_ADDR")
-            return provider_cls(url=url, namespace=namespace, credentials=creds)
+            return provider_cls(url=url, namespace=namespace, credentials=creds,
+                                **self._mount_cache_params(provider_type, url, namespace))
 
         if provider_type == "openbao":
             url = os.getenv(f"{prefix}BAO_ADDR")
             namespace = os.getenv(f"{prefix}BAO_NAMESPACE")
             if not url:
                 raise ValueError(f"OpenBao address not found: set {prefix}BAO_ADDR")
-            return provider_cls(url=url, namespace=namespace, credentials=creds)
+            return provider_cls(url=url, namespace=namespace, credentials=creds,
+                                **self._mount_cache_params(provider_type, url, namespace))
 
         return provider_cls(credentials=creds)
+
+    @classmethod
+    def get_provider_class(cls, provider_type: str) -> type:
+        """Class of secret provider registered for `provider_type` in `PROVIDER_MAP`"""
+        return cls._load_class(cls.PROVIDER_MAP[provider_type])
+
+    @classmethod
+    def get_credentials_provider_class(cls, provider_type: str) -> type:
+        """Class of credentials provider registered for `provider_type` in `CREDENTIALS_MAP`"""
+        return cls._load_class(cls.CREDENTIALS_MAP[provider_type])
+
+    @staticmethod
+    def _load_class(class_or_path: type | str) -> type:
+        return ExtensionLoader.load_class(class_or_path) if isinstance(class_or_path, str) else class_or_path
+
+    def _mount_cache_params(self, provider_type: str, url: str, namespace: str | None) -> dict:
+        from qubership_pipelines_common_library.v2.secret_manager.providers.hashicorp_vault import VaultMountCache
+        cache_key = (provider_type, url.rstrip("/"), namespace or "")
+        with self._lock:
+            is_new = cache_key not in self._mount_caches
+            if is_new:
+                self._mount_caches[cache_key] = VaultMountCache()
+            mount_cache = self._mount_caches[cache_key]
+        return {"mount_cache": mount_cache, "warm_up_mounts": is_new and self._warm_up_vault_mounts}
+
+
+# Provider classes used to be imported into this module, they are still importable from it (loaded on first access)
+_CLASS_PATHS = {class_path.rsplit(".", 1)[1]: class_path for class_path in [
+    *dict.values(MultiStoreProvider.PROVIDER_MAP),
+    *dict.values(MultiStoreProvider.CREDENTIALS_MAP),
+    "qubership_pipelines_common_library.v2.secret_manager.providers.hashicorp_vault.VaultMountCache",
+]}
+
+
+def __getattr__(name: str):
+    if name in _CLASS_PATHS:
+        return ExtensionLoader.load_class(_CLASS_PATHS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,20 +2,22 @@
 import hvac
 
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
-from qubership_pipelines_common_library.v2.secret_manager.providers.hashicorp_vault import HashicorpVaultProvider
+from qubership_pipelines_common_library.v2.secret_manager.providers.hashicorp_vault import HashicorpVaultProvider, VaultMountCache
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
 
 
 class OpenBaoProvider(HashicorpVaultProvider):
 
     # noinspection PyMissingConstructor
     def __init__(self, url: str = None, namespace: str = None, verify: bool = True, credentials: Credentials = None,
-                 vault_client: hvac.Client = None, **kwargs):
+                 vault_client: hvac.Client = None, mount_cache: VaultMountCache = None, warm_up_mounts: bool = False,
+                 **kwargs):
         """
         Initializes this client to work with **OpenBao**.
         Requires URL, and Credentials object (from OpenBaoCredentialsProvider), or preconfigured hvac.Client
         Currently is API-compatible with Vault
         """
-        self.mount_versions = {}
+        self.mount_cache = mount_cache if mount_cache is not None else VaultMountCache()
 
         if not vault_client:
             openbao_addr = url or os.environ.get("BAO_ADDR")
@@ -33,8 +35,11 @@ def __init__(self, url: str = None, namespace: str = None, verify: bool = True,
         else:
             self._vault_client = vault_client
 
+        Instrumentation.instrument_session(getattr(self._vault_client.adapter, "session", None), "openbao")
         if not self._vault_client.is_authenticated():
             raise Exception("OpenBao Client is not authenticated")
+        if warm_up_mounts:
+            self.mount_cache.warm_up(self._vault_client)
 
     def get_provider_name(self) -> str:
         return "openbao"
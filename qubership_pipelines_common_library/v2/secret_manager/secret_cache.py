@@ -0,0 +1,61 @@
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
+
+
+class SecretCache:
+    """
+    Thread-safe in-memory cache for raw secret payloads, bounded by TTL and number of entries
+    (least recently used entries are evicted first).
+
+    Payloads are kept only in process memory and are never persisted. Lookups are counted in `Metrics` under `name`.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256, name: str = "secrets"):
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> tuple[bool, Any]:
+        """Returns (hit, value) pair"""
+        hit, value = self._get(key)
+        Metrics.record_cache_lookup(self.name, hit)
+        return hit, value
+
+    def _get(self, key: tuple) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key, self._MISSING)
+            if entry is self._MISSING:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def put(self, key: tuple, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: tuple):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
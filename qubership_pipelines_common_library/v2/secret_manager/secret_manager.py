@@ -2,6 +2,7 @@
 
 from typing import Any
 from qubership_pipelines_common_library.v2.secret_manager.model.secret_provider import SecretProvider
+from qubership_pipelines_common_library.v2.secret_manager.secret_cache import SecretCache
 
 
 class SecretManager:
@@ -36,6 +37,13 @@ class SecretManager:
 
     Without a fragment, the whole secret is returned or operated on as a single unit.
 
+    **Bulk reads**
+
+    ``read_secrets([...paths...])`` resolves many paths at once: each underlying secret is fetched only once
+    (all requested fragments are sliced from it locally), and different secrets are fetched concurrently::
+
+        values = secret_manager.read_secrets(["ref+vault://app/db#/user", "ref+vault://app/db#/password"])
+
     **Smart MultiStore Provider**
 
     You can use special `MultiStoreProvider` to resolve secrets without explicitly providing credentials/configuring secret stores.
@@ -44,6 +52,19 @@ class SecretManager:
 
         SecretManager(secret_provider=MultiStoreProvider())
 
+    Use ``MultiStoreProvider(shared=True)`` to reuse already initialized stores across ``SecretManager`` instances,
+    and ``MultiStoreProvider.warm_up(paths)`` to initialize all required stores in parallel.
+
+    **Caching**
+
+    With ``cache_ttl_seconds > 0``, raw secret payloads are cached in memory (never on disk) per provider/store
+    and secret path, for up to ``cache_ttl_seconds`` and ``cache_max_entries`` secrets. Fragments are then
+    extracted from cached payloads locally. Creating, updating or deleting a secret through this manager
+    invalidates its entry; changes made by other clients are visible only after the entry expires.
+    Pass ``no_cache=True`` to ``read_secret``/``read_secrets``/``secret_exists`` to bypass the cache::
+
+        secret_manager = SecretManager(secret_provider=MultiStoreProvider(), cache_ttl_seconds=300)
+
     **Concurrency / thread-safety note**
 
     Update and delete operations that rely on a read-modify-write cycle
@@ -54,12 +75,17 @@ class SecretManager:
     processes) may lead to lost updates or unexpected results.
     """
 
-    def __init__(self, secret_provider: SecretProvider, **kwargs):
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_CACHE_MAX_ENTRIES = 256
+
+    def __init__(self, secret_provider: SecretProvider, cache_ttl_seconds: float = 0,
+                 cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES, **kwargs):
         if not secret_provider:
             raise Exception("Initialize SecretManager with one of secret providers first!")
         self.provider = secret_provider
+        self.cache = SecretCache(ttl_seconds=cache_ttl_seconds, max_entries=cache_max_entries) if cache_ttl_seconds > 0 else None
 
-    def read_secret(self, path: str, fail_on_missing: bool = False, default_value = None) -> str | None:
+    def read_secret(self, path: str, fail_on_missing: bool = False, default_value = None, no_cache: bool = False) -> str | None:
         """
         Read a secret.
 
@@ -67,8 +93,13 @@ def read_secret(self, path: str, fail_on_missing: bool = False, default_value =
           is returned (stringified for non-string types).
         - Without a fragment, the raw secret payload is returned.
         """
-        logging.debug(f"Reading secret '{path}' in '{self.provider.get_provider_name()}'...")
-        secret = self.provider.read_secret(path=path)
+        logging.debug("Reading secret '%s' in '%s'...", path, self.provider.get_provider_name())
+        if self.cache is None or no_cache:
+            secret = self.provider.read_secret(path=path)
+        else:
+            secret_path, frag = SecretProvider.split_fragment(path)
+            payload = self._read_payload(self.provider.resolve_provider(path), secret_path, no_cache=False)
+            secret = payload if frag is None or payload is None else SecretProvider.get_frag_value_from_payload(payload, frag)
         if secret is None:
             if fail_on_missing:
                 raise Exception(f"No secret found for path {path}")
@@ -76,9 +107,58 @@ def read_secret(self, path: str, fail_on_missing: bool = False, default_value =
             return default_value
         return secret
 
-    def secret_exists(self, path: str) -> bool:
+    def read_secrets(self, paths: list[str], fail_on_missing: bool = False, default_value = None,
+                     max_workers: int = DEFAULT_MAX_WORKERS, no_cache: bool = False) -> dict[str, str | None]:
+        """
+        Read multiple secrets, returning a ``path -> value`` map.
+
+        Paths are grouped by provider/store and underlying secret: each secret is read once, and all requested
+        fragments are extracted from it locally. Different secrets are read concurrently (up to ``max_workers``),
+        and providers of all referenced stores are initialized concurrently beforehand.
+        Values follow the same rules as in ``read_secret``.
+        """
+        self.provider.warm_up(paths, max_workers=max_workers)
+        groups = {}  # (provider, secret path without fragment) -> requested (path, fragment) pairs
+        for path in dict.fromkeys(paths):
+            provider = self.provider.resolve_provider(path)
+            secret_path, frag = SecretProvider.split_fragment(path)
+            groups.setdefault((provider, secret_path), []).append((path, frag))
+        logging.debug("Reading %s secret paths (%s distinct secrets) in '%s'...", len(paths), len(groups), self.provider.get_provider_name())
+
+        def read_group(group_key) -> dict:
+            provider, secret_path = group_key
+            payload = self._read_payload(provider, secret_path, no_cache)
+            return {path: payload if frag is None or payload is None else SecretProvider.get_frag_value_from_payload(payload, frag)
+                    for path, frag in groups[group_key]}
+
+        group_keys = list(groups)
+        if max_workers <= 1 or len(group_keys) <= 1:
+            group_results = [read_group(group_key) for group_key in group_keys]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(group_keys))) as executor:
+                group_results = list(executor.map(read_group, group_keys))
+
+        result = {}
+        for group_result in group_results:
+            result.update(group_result)
+        missing = [path for path, value in result.items() if value is None]
+        if missing:
+            if fail_on_missing:
+                raise Exception(f"No secrets found for paths {missing}")
+            logging.warning(f"No secrets found for paths {missing} (returning default value)")
+            for path in missing:
+                result[path] = default_value
+        return result
+
+    def secret_exists(self, path: str, no_cache: bool = False) -> bool:
         """Check whether a secret exists at the given path. Implementation might differ in providers, but generally - by attempting to read its value."""
-        logging.debug(f"Checking existence of secret '{path}' in '{self.provider.get_provider_name()}'...")
+        logging.debug("Checking existence of secret '%s' in '%s'...", path, self.provider.get_provider_name())
+        if self.cache is not None and not no_cache:
+            provider = self.provider.resolve_provider(path)
+            hit, _ = self.cache.get(self._cache_key(provider, SecretProvider.split_fragment(path)[0]))
+            if hit:
+                return True
         return self.provider.secret_exists(path)
 
     def create_secret(self, path: str, data: Any) -> Any:
@@ -89,8 +169,11 @@ def create_secret(self, path: str, data: Any) -> Any:
         - ``data`` can be a ``dict`` (JSON-serialized) or a plain ``str`` (if provider supports plain strings).
         - Raises an exception if the secret already exists.
         """
-        logging.debug(f"Creating secret '{path}' in '{self.provider.get_provider_name()}'...")
-        return self.provider.create_secret(path=path, data=data)
+        logging.debug("Creating secret '%s' in '%s'...", path, self.provider.get_provider_name())
+        try:
+            return self.provider.create_secret(path=path, data=data)
+        finally:
+            self.invalidate_cache(path)
 
     def update_secret(self, path: str, data: Any) -> Any:
         """
@@ -108,8 +191,11 @@ def update_secret(self, path: str, data: Any) -> Any:
 
         The secret must already exist.
         """
-        logging.debug(f"Updating secret '{path}' in '{self.provider.get_provider_name()}'...")
-        return self.provider.update_secret(path=path, data=data)
+        logging.debug("Updating secret '%s' in '%s'...", path, self.provider.get_provider_name())
+        try:
+            return self.provider.update_secret(path=path, data=data)
+        finally:
+            self.invalidate_cache(path)
 
     def delete_secret(self, path) -> Any:
         """
@@ -118,5 +204,35 @@ def delete_secret(self, path) -> Any:
         - **Without fragment**: permanently deletes the whole secret.
         - **With fragment** (``#/key``): removes only that nested key from a dict secret, leaving the rest intact.
         """
-        logging.debug(f"Deleting secret '{path}' in '{self.provider.get_provider_name()}'...")
-        return self.provider.delete_secret(path=path)
+        logging.debug("Deleting secret '%s' in '%s'...", path, self.provider.get_provider_name())
+        try:
+            return self.provider.delete_secret(path=path)
+        finally:
+            self.invalidate_cache(path)
+
+    def invalidate_cache(self, path: str = None):
+        """Drops cached payload of the secret at given path (fragment is ignored), or the whole cache if path is not given"""
+        if self.cache is None:
+            return
+        if path is None:
+            self.cache.clear()
+        else:
+            provider = self.provider.resolve_provider(path)
+            self.cache.invalidate(self._cache_key(provider, SecretProvider.split_fragment(path)[0]))
+
+    def _read_payload(self, provider: SecretProvider, secret_path: str, no_cache: bool) -> str | None:
+        if self.cache is None or no_cache:
+            return provider.read_secret(path=secret_path)
+        cache_key = self._cache_key(provider, secret_path)
+        hit, payload = self.cache.get(cache_key)
+        if hit:
+            return payload
+        payload = provider.read_secret(path=secret_path)
+        if payload is not None:
+            self.cache.put(cache_key, payload)
+        return payload
+
+    @staticmethod
+    def _cache_key(provider: SecretProvider, secret_path: str) -> tuple:
+        # Vals-like secret paths carry store id in their query, so (provider, path) also identifies the store
+        return provider.get_provider_name(), secret_path
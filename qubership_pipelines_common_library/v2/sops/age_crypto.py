@@ -0,0 +1,261 @@
+import base64
+import hashlib
+import hmac
+import os
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+
+class AgeCrypto:
+    """
+    In-process implementation of age (https://age-encryption.org/v1) file encryption with X25519 recipients,
+    producing the same armored format as `age -a` (and as stored by SOPS in `sops.age[].enc`)
+    """
+
+    INTRO = b"age-encryption.org/v1"
+    X25519_LABEL = b"age-encryption.org/v1/X25519"
+    ARMOR_BEGIN = "-----BEGIN AGE ENCRYPTED FILE-----"
+    ARMOR_END = "-----END AGE ENCRYPTED FILE-----"
+    RECIPIENT_HRP = "age"
+    IDENTITY_HRP = "age-secret-key-"
+    CHUNK_SIZE = 64 * 1024
+    COLUMNS = 64
+
+    @staticmethod
+    def generate_identity() -> tuple[str, str]:
+        """Returns new (identity, recipient) pair, i.e. `AGE-SECRET-KEY-1...` and `age1...` strings"""
+        private_key = X25519PrivateKey.generate()
+        identity = _Bech32.encode(AgeCrypto.IDENTITY_HRP, _raw_private_bytes(private_key)).upper()
+        return identity, AgeCrypto.recipient_from_identity(identity)
+
+    @staticmethod
+    def recipient_from_identity(identity: str) -> str:
+        private_key = AgeCrypto._parse_identity(identity)
+        return _Bech32.encode(AgeCrypto.RECIPIENT_HRP, private_key.public_key().public_bytes_raw())
+
+    @staticmethod
+    def parse_identities(identities: str) -> list[str]:
+        """Extracts identities from `SOPS_AGE_KEY`-like text (one per line, `#` comments allowed)"""
+        return [line.strip() for line in identities.splitlines()
+                if line.strip() and not line.strip().startswith("#")]
+
+    @staticmethod
+    def encrypt(data: bytes, recipients: list[str]) -> str:
+        """Encrypts `data` for all `recipients` (`age1...` public keys) and returns ASCII-armored result"""
+        if not recipients:
+            raise ValueError("At least one age recipient is required")
+        file_key = os.urandom(16)
+        header = AgeCrypto.INTRO + b"\n"
+        for recipient in recipients:
+            header += AgeCrypto._wrap_file_key(file_key, recipient)
+        header += b"---"
+        header_mac = hmac.new(_hkdf(file_key, b"", b"header"), header, hashlib.sha256).digest()
+        header += b" " + _b64encode(header_mac) + b"\n"
+
+        nonce = os.urandom(16)
+        payload = nonce + AgeCrypto._stream(ChaCha20Poly1305(_hkdf(file_key, nonce, b"payload")), data, encrypt=True)
+        return AgeCrypto._armor(header + payload)
+
+    @staticmethod
+    def decrypt(armored: str, identities: list[str]) -> bytes:
+        """Decrypts ASCII-armored age file with the first of `identities` (`AGE-SECRET-KEY-1...`) that matches"""
+        content = AgeCrypto._dearmor(armored)
+        header, stanzas, header_mac, payload = AgeCrypto._parse(content)
+        file_key = None
+        for identity in identities:
+            private_key = AgeCrypto._parse_identity(identity)
+            for stanza_type, args, body in stanzas:
+                if stanza_type != b"X25519":
+                    continue
+                if file_key := AgeCrypto._unwrap_file_key(private_key, args, body):
+                    break
+            if file_key:
+                break
+        if not file_key:
+            raise ValueError("None of provided age identities matches file recipients")
+        expected_mac = hmac.new(_hkdf(file_key, b"", b"header"), header, hashlib.sha256).digest()
+        if not hmac.compare_digest(expected_mac, header_mac):
+            raise ValueError("Age header MAC mismatch")
+        nonce, ciphertext = payload[:16], payload[16:]
+        if len(nonce) != 16:
+            raise ValueError("Age payload is truncated")
+        return AgeCrypto._stream(ChaCha20Poly1305(_hkdf(file_key, nonce, b"payload")), ciphertext, encrypt=False)
+
+    @staticmethod
+    def _wrap_file_key(file_key: bytes, recipient: str) -> bytes:
+        hrp, recipient_bytes = _Bech32.decode(recipient.strip())
+        if hrp != AgeCrypto.RECIPIENT_HRP or len(recipient_bytes) != 32:
+            raise ValueError(f"Invalid age recipient: '{recipient}'")
+        ephemeral_key = X25519PrivateKey.generate()
+        ephemeral_share = ephemeral_key.public_key().public_bytes_raw()
+        shared_secret = ephemeral_key.exchange(X25519PublicKey.from_public_bytes(recipient_bytes))
+        wrap_key = _hkdf(shared_secret, ephemeral_share + recipient_bytes, AgeCrypto.X25519_LABEL)
+        body = ChaCha20Poly1305(wrap_key).encrypt(bytes(12), file_key, None)
+        return b"-> X25519 " + _b64encode(ephemeral_share) + b"\n" + AgeCrypto._wrap_lines(_b64encode(body))
+
+    @staticmethod
+    def _unwrap_file_key(private_key: X25519PrivateKey, args: list[bytes], body: bytes) -> bytes | None:
+        if len(args) != 1:
+            return None
+        ephemeral_share = _b64decode(args[0])
+        if len(ephemeral_share) != 32 or len(body) != 32:
+            return None
+        try:
+            shared_secret = private_key.exchange(X25519PublicKey.from_public_bytes(ephemeral_share))
+            recipient_bytes = private_key.public_key().public_bytes_raw()
+            wrap_key = _hkdf(shared_secret, ephemeral_share + recipient_bytes, AgeCrypto.X25519_LABEL)
+            return ChaCha20Poly1305(wrap_key).decrypt(bytes(12), body, None)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _stream(aead: ChaCha20Poly1305, data: bytes, encrypt: bool) -> bytes:
+        chunk_size = AgeCrypto.CHUNK_SIZE if encrypt else AgeCrypto.CHUNK_SIZE + 16
+        chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)] or [b""]
+        result = bytearray()
+        for counter, chunk in enumerate(chunks):
+            nonce = counter.to_bytes(11, "big") + (b"\x01" if counter == len(chunks) - 1 else b"\x00")
+            result += aead.encrypt(nonce, chunk, None) if encrypt else aead.decrypt(nonce, chunk, None)
+        return bytes(result)
+
+    @staticmethod
+    def _parse(content: bytes) -> tuple[bytes, list, bytes, bytes]:
+        """Splits binary age file into (MACed header part, stanzas, header MAC, payload)"""
+        lines = content.split(b"\n")
+        if lines[0] != AgeCrypto.INTRO:
+            raise ValueError("Unsupported age file version")
+        stanzas = []
+        position = len(lines[0]) + 1
+        index = 1
+        while index < len(lines):
+            line = lines[index]
+            if line.startswith(b"--- "):
+                header = content[:position + 3]
+                payload = content[position + len(line) + 1:]
+                return header, stanzas, _b64decode(line[4:]), payload
+            if not line.startswith(b"-> "):
+                raise ValueError("Malformed age header")
+            stanza_type, *args = line[3:].split(b" ")
+            position += len(line) + 1
+            index += 1
+            body = b""
+            while index < len(lines):
+                body_line = lines[index]
+                position += len(body_line) + 1
+                index += 1
+                body += body_line
+                if len(body_line) < AgeCrypto.COLUMNS:
+                    break
+            stanzas.append((stanza_type, args, _b64decode(body)))
+        raise ValueError("Age header is not terminated")
+
+    @staticmethod
+    def _armor(content: bytes) -> str:
+        encoded = base64.b64encode(content).decode()
+        lines = [encoded[i:i + AgeCrypto.COLUMNS] for i in range(0, len(encoded), AgeCrypto.COLUMNS)]
+        return "\n".join([AgeCrypto.ARMOR_BEGIN, *lines, AgeCrypto.ARMOR_END]) + "\n"
+
+    @staticmethod
+    def _dearmor(armored: str) -> bytes:
+        text = armored.strip()
+        if not text.startswith(AgeCrypto.ARMOR_BEGIN) or not text.endswith(AgeCrypto.ARMOR_END):
+            raise ValueError("Age file is not ASCII-armored")
+        body = text[len(AgeCrypto.ARMOR_BEGIN):-len(AgeCrypto.ARMOR_END)]
+        return base64.b64decode("".join(body.split()), validate=True)
+
+    @staticmethod
+    def _wrap_lines(encoded: bytes) -> bytes:
+        # last line of stanza body is always shorter than COLUMNS (possibly empty)
+        lines = [encoded[i:i + AgeCrypto.COLUMNS] for i in range(0, len(encoded) + 1, AgeCrypto.COLUMNS)]
+        return b"\n".join(lines) + b"\n"
+
+    @staticmethod
+    def _parse_identity(identity: str) -> X25519PrivateKey:
+        hrp, key_bytes = _Bech32.decode(identity.strip())
+        if hrp != AgeCrypto.IDENTITY_HRP or len(key_bytes) != 32:
+            raise ValueError("Invalid age identity")
+        return X25519PrivateKey.from_private_bytes(key_bytes)
+
+
+def _hkdf(key_material: bytes, salt: bytes, info: bytes) -> bytes:
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=salt, info=info).derive(key_material)
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    if data.endswith(b"="):
+        raise ValueError("Age uses unpadded base64")
+    return base64.b64decode(data + b"=" * (-len(data) % 4), validate=True)
+
+
+def _raw_private_bytes(private_key: X25519PrivateKey) -> bytes:
+    return private_key.private_bytes(serialization.Encoding.Raw, serialization.PrivateFormat.Raw,
+                                     serialization.NoEncryption())
+
+
+class _Bech32:
+    """BIP-173 Bech32, without the 90 characters length limit (as used by age for keys)"""
+
+    CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+    GENERATORS = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+
+    @staticmethod
+    def encode(hrp: str, data: bytes) -> str:
+        values = _Bech32._convert_bits(data, 8, 5, pad=True)
+        polymod = _Bech32._polymod(_Bech32._hrp_expand(hrp) + values + [0] * 6) ^ 1
+        checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+        return hrp + "1" + "".join(_Bech32.CHARSET[v] for v in values + checksum)
+
+    @staticmethod
+    def decode(text: str) -> tuple[str, bytes]:
+        if text.lower() != text and text.upper() != text:
+            raise ValueError("Mixed case in bech32 string")
+        text = text.lower()
+        separator = text.rfind("1")
+        if separator < 1 or separator + 7 > len(text):
+            raise ValueError("Invalid bech32 string")
+        hrp = text[:separator]
+        try:
+            values = [_Bech32.CHARSET.index(c) for c in text[separator + 1:]]
+        except ValueError:
+            raise ValueError("Invalid character in bech32 string")
+        if _Bech32._polymod(_Bech32._hrp_expand(hrp) + values) != 1:
+            raise ValueError("Invalid bech32 checksum")
+        return hrp, bytes(_Bech32._convert_bits(values[:-6], 5, 8, pad=False))
+
+    @staticmethod
+    def _polymod(values: list[int]) -> int:
+        checksum = 1
+        for value in values:
+            top = checksum >> 25
+            checksum = (checksum & 0x1ffffff) << 5 ^ value
+            for i, generator in enumerate(_Bech32.GENERATORS):
+                if (top >> i) & 1:
+                    checksum ^= generator
+        return checksum
+
+    @staticmethod
+    def _hrp_expand(hrp: str) -> list[int]:
+        return [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+
+    @staticmethod
+    def _convert_bits(data, from_bits: int, to_bits: int, pad: bool) -> list[int]:
+        accumulator, bits, result = 0, 0, []
+        max_value = (1 << to_bits) - 1
+        for value in data:
+            accumulator = (accumulator << from_bits) | value
+            bits += from_bits
+            while bits >= to_bits:
+                bits -= to_bits
+                result.append((accumulator >> bits) & max_value)
+        if pad and bits:
+            result.append((accumulator << (to_bits - bits)) & max_value)
+        elif not pad and (bits >= from_bits or (accumulator << (to_bits - bits)) & max_value):
+            raise ValueError("Invalid bech32 padding")
+        return result
@@ -5,11 +5,14 @@
 import uuid
 import yaml
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 class SopsClient:
 
+    DEFAULT_MAX_WORKERS = 4
+
     def __init__(self, sops_artifact_configs_folder_path: Path):
         self.sops_artifact_configs_folder_path = sops_artifact_configs_folder_path
         sops_from_env = os.environ.get("SOPS_EXECUTABLE")
@@ -52,8 +55,7 @@ def encrypt_content_by_path(
 
         with open(encrypted_file_path, 'w') as encrypted_file:
             encrypted_file.write(sops_encrypt_result.stdout)
-        self.logger.debug(f"Content {source_file_path_to_encrypt} was encrypted by sops. "
-                          f"Result saved into {encrypted_file_path}")
+        self.logger.debug("Content %s was encrypted by sops. Result saved into %s", source_file_path_to_encrypt, encrypted_file_path)
         self._remove_sops_config(sops_config_path.parent)
 
     def get_decrypted_content_by_path(self, age_private_key: str, source_file_path_to_decrypt: Path) -> str:
@@ -79,9 +81,108 @@ def get_decrypted_content_by_path(self, age_private_key: str, source_file_path_t
         if sops_decrypt_result.stderr:
             self.logger.error(f"Error during {source_file_path_to_decrypt} decrypt. Error: {sops_decrypt_result.stderr}")
             return ""
-        self.logger.debug(f"Content {source_file_path_to_decrypt} was decrypted by sops")
+        self.logger.debug("Content %s was decrypted by sops", source_file_path_to_decrypt)
         return sops_decrypt_result.stdout
 
+    def encrypt_files(self, age_public_key: str, files: dict[Path, Path | None],
+                      max_workers: int = DEFAULT_MAX_WORKERS) -> dict[Path, bool]:
+        """
+        Encrypts several files with the same key.
+        One `.sops.yaml` is generated for the whole batch, and up to `max_workers` `sops` processes run at once.
+        Output of `sops` is streamed directly into target files
+        Args:
+            age_public_key: age public key
+            files: mapping of source file path to target file path. If target is None then source file is overwritten
+            max_workers: maximum number of concurrent `sops` processes
+
+        Returns:
+            mapping of source file path to encryption success. Target of failed encryption gets empty content
+        """
+        if not self.sops_executable.exists():
+            self.logger.error(f"Sops executable doesn't exist. Can't encrypt {len(files)} files")
+            return {source: False for source in files}
+        if not files:
+            return {}
+
+        sops_config_path = self._get_prepared_sops_config_path(age_public_key)
+        try:
+            def encrypt(source: Path) -> bool:
+                target = files[source] or source
+                args = (self.sops_executable, "--config", sops_config_path, "encrypt", source)
+                if error := self._run_sops_into_file(args, target):
+                    self.logger.error(f"Error during encryption of {source}. Saving empty content into {target}. "
+                                      f"Error: {error}")
+                    Path(target).write_text("")
+                    return False
+                self.logger.debug("Content %s was encrypted by sops. Result saved into %s", source, target)
+                return True
+
+            return self._run_batch(encrypt, list(files), max_workers)
+        finally:
+            self._remove_sops_config(sops_config_path.parent)
+
+    def decrypt_files(self, age_private_key: str, files: dict[Path, Path],
+                      max_workers: int = DEFAULT_MAX_WORKERS) -> dict[Path, bool]:
+        """
+        Decrypts several files with the same key, running up to `max_workers` `sops` processes at once.
+        Decrypted content is streamed directly into target files instead of being returned
+        Args:
+            age_private_key: age private key
+            files: mapping of encrypted file path to path where decrypted content is saved (may be the same path)
+            max_workers: maximum number of concurrent `sops` processes
+
+        Returns:
+            mapping of source file path to decryption success. Targets of failed decryption are left untouched
+        """
+        if not self.sops_executable.exists():
+            self.logger.error(f"Sops executable doesn't exist. Can't decrypt {len(files)} files")
+            return {source: False for source in files}
+        if not age_private_key:
+            self.logger.warning("sops_private_key is not defined, skipping decryption")
+            return {source: False for source in files}
+
+        environment_variables = os.environ.copy()
+        environment_variables["SOPS_AGE_KEY"] = age_private_key.strip()
+
+        def decrypt(source: Path) -> bool:
+            args = (self.sops_executable, "-d", source)
+            if error := self._run_sops_into_file(args, files[source], env=environment_variables):
+                self.logger.error(f"Error during {source} decrypt. Error: {error}")
+                return False
+            self.logger.debug("Content %s was decrypted by sops", source)
+            return True
+
+        return self._run_batch(decrypt, list(files), max_workers)
+
+    @staticmethod
+    def _run_batch(func, sources: list[Path], max_workers: int) -> dict[Path, bool]:
+        if max_workers <= 1 or len(sources) <= 1:
+            return {source: func(source) for source in sources}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as executor:
+            return dict(zip(sources, executor.map(func, sources)))
+
+    @staticmethod
+    def _run_sops_into_file(args: tuple, target_file_path: Path, env: dict = None) -> str | None:
+        """
+        Runs `sops` with stdout redirected into temporary file next to `target_file_path`,
+        which replaces target only on success (so target may be the same file `sops` reads)
+
+        Returns:
+            error message, or None on success
+        """
+        target_file_path = Path(target_file_path)
+        target_file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file_path = target_file_path.with_name(f".{target_file_path.name}.{uuid.uuid4()}.tmp")
+        try:
+            with open(temp_file_path, mode="wb") as temp_file:
+                result = subprocess.run(args, env=env, stdout=temp_file, stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                return result.stderr.decode(errors="replace") or f"sops exited with code {result.returncode}"
+            os.replace(temp_file_path, target_file_path)
+            return None
+        finally:
+            temp_file_path.unlink(missing_ok=True)
+
     @staticmethod
     def is_encrypted(yaml_dict: dict) -> bool:
         return yaml_dict.get('sops', {}).get('age') is not None
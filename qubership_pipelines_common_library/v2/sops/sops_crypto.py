@@ -0,0 +1,221 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import re
+import yaml
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from qubership_pipelines_common_library.v2.sops.age_crypto import AgeCrypto
+
+
+class SopsCrypto:
+    """
+    In-process SOPS-compatible encryption of YAML/JSON params with age keys.
+
+    Produces the same structure as `sops encrypt` (values encrypted with AES256_GCM under a random data key,
+    data key encrypted for age recipients and MAC of all values stored in `sops` metadata),
+    so results can be decrypted by `sops` CLI and vice versa, without spawning any processes.
+    Keys ending with `unencrypted_suffix` are left as plain text.
+    """
+
+    SOPS_VERSION = "3.10.2"
+    METADATA_KEY = "sops"
+    DEFAULT_UNENCRYPTED_SUFFIX = "_unencrypted"
+    ENC_VALUE_PATTERN = re.compile(r"^ENC\[AES256_GCM,data:(.*),iv:(.*),tag:(.*),type:(.*)\]$")
+
+    def __init__(self, unencrypted_suffix: str = DEFAULT_UNENCRYPTED_SUFFIX):
+        self.unencrypted_suffix = unencrypted_suffix
+        self.logger = logging.getLogger()
+
+    def encrypt_content(self, content: dict, age_public_key: str) -> dict:
+        """
+        Returns encrypted copy of `content`
+        Args:
+            age_public_key: age public key, or several comma-separated keys
+        """
+        if self.METADATA_KEY in content:
+            raise ValueError("Content is already encrypted with SOPS")
+        recipients = [key.strip() for key in age_public_key.split(",") if key.strip()]
+        data_key = os.urandom(32)
+        mac = hashlib.sha512()
+        encrypted = self._walk(content, [], lambda value, path: self._encrypt_leaf(value, path, data_key, mac))
+        last_modified = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        encrypted[self.METADATA_KEY] = {
+            "age": [{"recipient": recipient, "enc": AgeCrypto.encrypt(data_key, [recipient])}
+                    for recipient in recipients],
+            "lastmodified": last_modified,
+            "mac": self._encrypt_value(mac.hexdigest().upper(), data_key, last_modified),
+            "unencrypted_suffix": self.unencrypted_suffix,
+            "version": self.SOPS_VERSION,
+        }
+        return encrypted
+
+    def decrypt_content(self, content: dict, age_private_key: str) -> dict:
+        """
+        Returns decrypted copy of `content`, verifying its MAC
+        Args:
+            age_private_key: age private key, or several keys on separate lines (same as `SOPS_AGE_KEY`)
+        """
+        metadata = content.get(self.METADATA_KEY)
+        if not isinstance(metadata, dict):
+            raise ValueError("Content is not encrypted with SOPS")
+        data_key = self._decrypt_data_key(metadata, AgeCrypto.parse_identities(age_private_key))
+        unencrypted_suffix = metadata.get("unencrypted_suffix", self.DEFAULT_UNENCRYPTED_SUFFIX)
+        mac = hashlib.sha512()
+        data = {key: value for key, value in content.items() if key != self.METADATA_KEY}
+        decrypted = self._walk(data, [], lambda value, path: self._decrypt_leaf(
+            value, path, data_key, mac, unencrypted_suffix))
+        last_modified = metadata.get("lastmodified")
+        if isinstance(last_modified, datetime):
+            last_modified = last_modified.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        expected_mac = self._decrypt_value(metadata.get("mac", ""), data_key, str(last_modified))
+        if not hmac.compare_digest(str(expected_mac), mac.hexdigest().upper()):
+            raise ValueError("SOPS MAC mismatch: content was modified or corrupted")
+        return decrypted
+
+    def encrypt_content_by_path(self, age_public_key: str, source_file_path_to_encrypt: Path,
+                                target_file_path: Path = None):
+        """
+        Encrypts YAML or JSON file (by extension) and saves result into file by path, same as `SopsClient`
+        Args:
+            age_public_key: age public key
+            source_file_path_to_encrypt: file to encrypt
+            target_file_path: file to save result of encryption. If None then `source_file_path_to_encrypt` will be used
+        """
+        source_file_path_to_encrypt = Path(source_file_path_to_encrypt)
+        target_file_path = Path(target_file_path or source_file_path_to_encrypt)
+        content = self._load(source_file_path_to_encrypt)
+        self._dump(self.encrypt_content(content or {}, age_public_key), target_file_path)
+        self.logger.debug("Content %s was encrypted. Result saved into %s", source_file_path_to_encrypt, target_file_path)
+
+    def get_decrypted_content_by_path(self, age_private_key: str, source_file_path_to_decrypt: Path) -> str:
+        """
+        Decrypts YAML or JSON file by path, same as `SopsClient`
+        Returns:
+            decrypted file content or empty string if error occurs
+        """
+        if not age_private_key:
+            self.logger.warning("sops_private_key is not defined, skipping decryption")
+            return ""
+        source_file_path_to_decrypt = Path(source_file_path_to_decrypt)
+        try:
+            decrypted = self.decrypt_content(self._load(source_file_path_to_decrypt) or {}, age_private_key)
+        except Exception as e:
+            self.logger.error(f"Error during {source_file_path_to_decrypt} decrypt. Error: {e}")
+            return ""
+        self.logger.debug("Content %s was decrypted", source_file_path_to_decrypt)
+        return self._serialize(decrypted, source_file_path_to_decrypt)
+
+    def _walk(self, value, path: list[str], on_leaf):
+        if isinstance(value, dict):
+            return {key: self._walk(item, path + [str(key)], on_leaf) for key, item in value.items()}
+        if isinstance(value, list):
+            # list items share path of the list itself, same as in SOPS
+            return [self._walk(item, path, on_leaf) for item in value]
+        if value is None:
+            return None
+        return on_leaf(value, path)
+
+    def _encrypt_leaf(self, value, path: list[str], data_key: bytes, mac):
+        plaintext, value_type = self._to_plaintext(value)
+        mac.update(plaintext.encode("utf-8"))
+        if self._is_unencrypted(path, self.unencrypted_suffix):
+            return value
+        return self._encrypt_value(plaintext, data_key, self._additional_data(path), value_type)
+
+    def _decrypt_leaf(self, value, path: list[str], data_key: bytes, mac, unencrypted_suffix: str):
+        if self._is_unencrypted(path, unencrypted_suffix):
+            decrypted = value
+        else:
+            decrypted = self._decrypt_value(value, data_key, self._additional_data(path))
+        mac.update(self._to_plaintext(decrypted)[0].encode("utf-8"))
+        return decrypted
+
+    @staticmethod
+    def _encrypt_value(plaintext: str, data_key: bytes, additional_data: str, value_type: str = "str") -> str:
+        if plaintext == "":
+            return ""
+        iv = os.urandom(32)
+        encrypted = AESGCM(data_key).encrypt(iv, plaintext.encode("utf-8"), additional_data.encode("utf-8"))
+        data, tag = encrypted[:-16], encrypted[-16:]
+        return (f"ENC[AES256_GCM,data:{base64.b64encode(data).decode()},iv:{base64.b64encode(iv).decode()},"
+                f"tag:{base64.b64encode(tag).decode()},type:{value_type}]")
+
+    @staticmethod
+    def _decrypt_value(value, data_key: bytes, additional_data: str):
+        if value == "":
+            return ""
+        match = SopsCrypto.ENC_VALUE_PATTERN.match(value) if isinstance(value, str) else None
+        if not match:
+            raise ValueError(f"Value is not encrypted with SOPS: '{additional_data}'")
+        data, iv, tag, value_type = match.groups()
+        plaintext = AESGCM(data_key).decrypt(base64.b64decode(iv), base64.b64decode(data) + base64.b64decode(tag),
+                                             additional_data.encode("utf-8"))
+        if value_type == "str":
+            return plaintext.decode("utf-8")
+        if value_type == "int":
+            return int(plaintext)
+        if value_type == "float":
+            return float(plaintext)
+        if value_type == "bool":
+            return plaintext.decode("utf-8").lower() == "true"
+        if value_type == "bytes":
+            return plaintext
+        raise ValueError(f"Unknown SOPS value type: '{value_type}'")
+
+    @staticmethod
+    def _to_plaintext(value) -> tuple[str, str]:
+        """Converts leaf value to (text, SOPS type), formatting values the same way SOPS does for encryption and MAC"""
+        if isinstance(value, bool):
+            return str(value), "bool"
+        if isinstance(value, int):
+            return str(value), "int"
+        if isinstance(value, float):
+            text = format(Decimal(repr(value)), "f")
+            return (text.rstrip("0").rstrip(".") if "." in text else text), "float"
+        if isinstance(value, bytes):
+            return value.decode("utf-8"), "bytes"
+        return str(value), "str"
+
+    @staticmethod
+    def _is_unencrypted(path: list[str], unencrypted_suffix: str) -> bool:
+        return bool(unencrypted_suffix) and any(key.endswith(unencrypted_suffix) for key in path)
+
+    @staticmethod
+    def _additional_data(path: list[str]) -> str:
+        return ":".join(path) + ":"
+
+    @staticmethod
+    def _decrypt_data_key(metadata: dict, identities: list[str]) -> bytes:
+        for age_entry in metadata.get("age") or []:
+            try:
+                return AgeCrypto.decrypt(age_entry.get("enc", ""), identities)
+            except ValueError:
+                continue
+        raise ValueError("Could not decrypt SOPS data key with provided age keys")
+
+    @staticmethod
+    def _is_json(file_path: Path) -> bool:
+        return file_path.suffix.lower() == ".json"
+
+    @staticmethod
+    def _load(file_path: Path):
+        with open(file_path, mode="r", encoding="utf-8") as file:
+            return json.load(file) if SopsCrypto._is_json(file_path) else yaml.safe_load(file)
+
+    @staticmethod
+    def _serialize(content: dict, file_path: Path) -> str:
+        if SopsCrypto._is_json(file_path):
+            return json.dumps(content, indent=4)
+        return yaml.safe_dump(content, default_flow_style=False, sort_keys=False)
+
+    @staticmethod
+    def _dump(content: dict, file_path: Path):
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(SopsCrypto._serialize(content, file_path), encoding="utf-8")
@@ -0,0 +1,77 @@
+import re
+import time
+
+from urllib.parse import urlsplit
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
+from qubership_pipelines_common_library.v2.telemetry.tracing import Tracer
+
+
+class Instrumentation:
+    """Hooks telemetry into outbound calls of clients, without changing their behavior"""
+
+    INSTRUMENTED_ATTR = "_pipelines_instrumented_system"
+    _ID_SEGMENT_PATTERN = re.compile(
+        r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{16,}"
+        r"|\d+(\.\d+)+([-.][\w.]+)?)$")
+
+    @staticmethod
+    def instrument_session(session, system: str):
+        """
+        Wraps `send` of `requests.Session` (or compatible), so each request is counted in `Metrics`
+        (by status, with latency) and, when tracing is enabled, reported as CLIENT span
+        with method, endpoint template, status and latency. Repeated calls for the same session are ignored
+        """
+        if session is None or getattr(session, Instrumentation.INSTRUMENTED_ATTR, None):
+            return session
+        original_send = session.send
+
+        def send(request, **kwargs):
+            started_at = time.perf_counter()
+            status = "error"
+            try:
+                response = traced_send(request, **kwargs)
+                status = str(response.status_code)
+                return response
+            finally:
+                Metrics.http_requests.inc(system=system, method=request.method, status=status)
+                Metrics.http_request_duration.observe(time.perf_counter() - started_at, system=system, method=request.method)
+
+        def traced_send(request, **kwargs):
+            if not Tracer.is_enabled():
+                return original_send(request, **kwargs)
+            method = request.method
+            url_parts = urlsplit(request.url)
+            template = Instrumentation.url_template(url_parts.path)
+            with Tracer.span(f"{method} {template}", kind=Tracer.SpanKind.CLIENT, attributes={
+                "pipelines.system": system,
+                "http.request.method": method,
+                "url.template": template,
+                "server.address": url_parts.hostname,
+            }) as span:
+                response = original_send(request, **kwargs)
+                span.set_attribute("http.response.status_code", response.status_code)
+                if retries := Instrumentation._get_transport_retries(response):
+                    span.set_attribute("http.request.resend_count", retries)
+                if response.status_code >= 400:
+                    span.set_attribute("error.type", str(response.status_code))
+                    span.set_status(Tracer.StatusCode.ERROR)
+                return response
+
+        session.send = send
+        setattr(session, Instrumentation.INSTRUMENTED_ATTR, system)
+        return session
+
+    @staticmethod
+    def url_template(path: str) -> str:
+        """Replaces path segments that look like ids, hashes or versions with placeholders to keep span names low-cardinality"""
+        if not path:
+            return "/"
+        return "/".join("{id}" if Instrumentation._ID_SEGMENT_PATTERN.match(segment) else segment
+                        for segment in path.split("/"))
+
+    @staticmethod
+    def _get_transport_retries(response) -> int:
+        try:
+            return len(response.raw.retries.history)
+        except Exception:
+            return 0
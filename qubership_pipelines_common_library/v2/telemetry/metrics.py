@@ -0,0 +1,361 @@
+import json
+import logging
+import math
+import os
+import threading
+
+from enum import StrEnum
+from pathlib import Path
+
+
+class _Metric:
+    """Base class for metric families: values are kept per label set, labels are passed as keyword arguments"""
+
+    TYPE = None
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"Metric '{self.name}' expects labels {list(self.label_names)}, got {list(labels)}")
+        return tuple(str(labels[label_name]) for label_name in self.label_names)
+
+    def _labels(self, key: tuple) -> dict:
+        return dict(zip(self.label_names, key))
+
+    def get(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        """Returns (sample_name, labels, value) triples in Prometheus exposition order"""
+        with self._lock:
+            return [(self.name, self._labels(key), value) for key, value in sorted(self._values.items())]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            values = [{"labels": self._labels(key), "value": value} for key, value in sorted(self._values.items())]
+        return {"type": self.TYPE, "description": self.description, "values": values}
+
+
+class Counter(_Metric):
+    """Monotonically increasing value (e.g. number of requests)"""
+
+    TYPE = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError(f"Counter '{self.name}' can only be increased")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (e.g. size of cache, duration of last run)"""
+
+    TYPE = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values (e.g. latencies) in cumulative buckets, compatible with Prometheus histograms.
+    Percentiles are estimated from buckets with linear interpolation (same as PromQL `histogram_quantile`)
+    """
+
+    TYPE = "histogram"
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    PERCENTILES = (0.5, 0.9, 0.99)
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+            state["counts"][index] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def get(self, **labels) -> dict:
+        """Returns count, sum and estimated percentiles of observations for given labels"""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return self._summary(state) if state else {"count": 0, "sum": 0.0}
+
+    def percentile(self, quantile: float, **labels) -> float | None:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return self._percentile(state, quantile) if state else None
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        result = []
+        with self._lock:
+            for key, state in sorted(self._values.items()):
+                labels = self._labels(key)
+                cumulative = 0
+                for bound, count in zip(self.buckets + (math.inf,), state["counts"]):
+                    cumulative += count
+                    result.append((f"{self.name}_bucket", {**labels, "le": self._format_bound(bound)}, cumulative))
+                result.append((f"{self.name}_sum", labels, state["sum"]))
+                result.append((f"{self.name}_count", labels, state["count"]))
+        return result
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            values = [{"labels": self._labels(key), **self._summary(state)} for key, state in sorted(self._values.items())]
+        return {"type": self.TYPE, "description": self.description, "values": values}
+
+    def _summary(self, state: dict) -> dict:
+        summary = {"count": state["count"], "sum": round(state["sum"], 6)}
+        for quantile in self.PERCENTILES:
+            summary[f"p{round(quantile * 100)}"] = self._percentile(state, quantile)
+        return summary
+
+    def _percentile(self, state: dict, quantile: float) -> float | None:
+        total = state["count"]
+        if not total:
+            return None
+        rank = quantile * total
+        cumulative = 0
+        for index, count in enumerate(state["counts"]):
+            if count and cumulative + count >= rank:
+                if index == len(self.buckets):
+                    # can't interpolate inside +Inf bucket, the highest finite bound is the best estimate
+                    return self.buckets[-1] if self.buckets else None
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index]
+                return round(lower + (upper - lower) * (rank - cumulative) / count, 6)
+            cumulative += count
+        return None
+
+    @staticmethod
+    def _format_bound(bound: float) -> str:
+        return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+class MetricsRegistry:
+    """Thread-safe set of metric families, that can be rendered in Prometheus text exposition format or as JSON"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, description, label_names)
+
+    def gauge(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, description, label_names)
+
+    def histogram(self, name: str, description: str, label_names: tuple[str, ...] = (),
+                  buckets: tuple[float, ...] = Histogram.DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, description, label_names, buckets=buckets)
+
+    def get_metric(self, name: str) -> _Metric | None:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def clear(self):
+        """Drops all recorded values (metric families stay registered)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def to_prometheus_text(self) -> str:
+        lines = []
+        for metric in self._sorted_metrics():
+            samples = metric.samples()
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {self._escape_help(metric.description)}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{self._format_labels(labels)} {self._format_value(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def to_dict(self) -> dict:
+        return {metric.name: metric.to_dict() for metric in self._sorted_metrics() if metric.samples()}
+
+    def write_textfile(self, file_path: str | Path):
+        """
+        Writes metrics in Prometheus text format. File is written under temporary name and then renamed,
+        so node-exporter textfile collector never reads partially written file
+        """
+        self._write_atomically(Path(file_path), self.to_prometheus_text())
+
+    def write_json(self, file_path: str | Path):
+        self._write_atomically(Path(file_path), json.dumps(self.to_dict(), indent=2))
+
+    def _get_or_create(self, metric_class, name: str, description: str, label_names: tuple[str, ...], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, description, label_names, **kwargs)
+            elif type(metric) is not metric_class or metric.label_names != tuple(label_names):
+                raise ValueError(f"Metric '{name}' is already registered as {metric.TYPE} with labels {list(metric.label_names)}")
+            return metric
+
+    def _sorted_metrics(self) -> list[_Metric]:
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    @staticmethod
+    def _write_atomically(file_path: Path, content: str):
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+        try:
+            temp_path.write_text(content, encoding="utf-8")
+            os.replace(temp_path, file_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _format_labels(labels: dict) -> str:
+        if not labels:
+            return ""
+        escaped = (f'{name}="{MetricsRegistry._escape_label_value(value)}"' for name, value in labels.items())
+        return "{" + ",".join(escaped) + "}"
+
+    @staticmethod
+    def _escape_label_value(value) -> str:
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    @staticmethod
+    def _escape_help(text: str) -> str:
+        return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        if isinstance(value, int):
+            return str(value)
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(float(value))
+
+
+class Metrics:
+    """
+    Process-wide metrics of library clients: outbound API calls (count and latency per backend), retries,
+    downloaded bytes, poll ticks of waiting loops and cache hits/misses.
+
+    Values are always collected in memory (recording is cheap), and are exported at the end of `ExecutionCommand.run`
+    only when enabled - with `Metrics.configure(...)`, `PIPELINES_METRICS_EXPORT` environment variable
+    (comma-separated `PROMETHEUS`, `JSON`) writing `metrics.prom`/`metrics.json` into command logs folder,
+    and/or `PIPELINES_METRICS_TEXTFILE_DIR` - folder watched by node-exporter textfile collector
+    """
+
+    class ExportFormat(StrEnum):
+        PROMETHEUS = 'PROMETHEUS'
+        JSON = 'JSON'
+
+    METRICS_EXPORT_ENV = "PIPELINES_METRICS_EXPORT"
+    METRICS_TEXTFILE_DIR_ENV = "PIPELINES_METRICS_TEXTFILE_DIR"
+    FILE_NAME_PROMETHEUS = "metrics.prom"
+    FILE_NAME_JSON = "metrics.json"
+    TEXTFILE_NAME = "qubership_pipelines.prom"
+
+    EXPORT_FORMATS = None  # when not configured explicitly, values from environment are used
+    TEXTFILE_DIR = None
+
+    REGISTRY = MetricsRegistry()
+
+    http_requests = REGISTRY.counter(
+        "pipelines_http_requests_total", "Outbound HTTP requests by backend system, method and response status",
+        ("system", "method", "status"))
+    http_request_duration = REGISTRY.histogram(
+        "pipelines_http_request_duration_seconds", "Latency of outbound HTTP requests by backend system and method",
+        ("system", "method"))
+    retries = REGISTRY.counter(
+        "pipelines_retries_total", "Repeated attempts made by RetryDecorator", ("function",))
+    downloaded_bytes = REGISTRY.counter(
+        "pipelines_downloaded_bytes_total", "Bytes of artifacts downloaded by backend system", ("system",))
+    poll_ticks = REGISTRY.counter(
+        "pipelines_poll_ticks_total", "Iterations of status-polling loops by backend system", ("system",))
+    cache_requests = REGISTRY.counter(
+        "pipelines_cache_requests_total", "Cache lookups by cache name and result (hit/miss)", ("cache", "result"))
+    command_duration = REGISTRY.gauge(
+        "pipelines_command_last_duration_seconds", "Wall time of the last run of command", ("command",))
+    command_success = REGISTRY.gauge(
+        "pipelines_command_last_success", "Whether the last run of command succeeded (1) or failed (0)", ("command",))
+
+    @staticmethod
+    def configure(export_formats: list[ExportFormat] = None, textfile_dir: str | Path = None):
+        Metrics.EXPORT_FORMATS = [Metrics.ExportFormat(export_format) for export_format in (export_formats or [])]
+        Metrics.TEXTFILE_DIR = Path(textfile_dir) if textfile_dir else None
+
+    @staticmethod
+    def reset():
+        """Drops explicit configuration (so it's resolved from environment again) and all recorded values"""
+        Metrics.EXPORT_FORMATS = None
+        Metrics.TEXTFILE_DIR = None
+        Metrics.REGISTRY.clear()
+
+    @staticmethod
+    def get_export_formats() -> list[ExportFormat]:
+        if Metrics.EXPORT_FORMATS is not None:
+            return Metrics.EXPORT_FORMATS
+        result = []
+        for value in os.getenv(Metrics.METRICS_EXPORT_ENV, "").split(","):
+            value = value.strip().upper()
+            if not value or value == "NONE":
+                continue
+            try:
+                result.append(Metrics.ExportFormat(value))
+            except ValueError:
+                logging.warning(f"Unsupported {Metrics.METRICS_EXPORT_ENV} value: '{value}', it is ignored")
+        return result
+
+    @staticmethod
+    def get_textfile_dir() -> Path | None:
+        if Metrics.EXPORT_FORMATS is not None:
+            return Metrics.TEXTFILE_DIR
+        textfile_dir = os.getenv(Metrics.METRICS_TEXTFILE_DIR_ENV)
+        return Path(textfile_dir) if textfile_dir else None
+
+    @staticmethod
+    def record_cache_lookup(cache: str, hit: bool):
+        Metrics.cache_requests.inc(cache=cache, result="hit" if hit else "miss")
+
+    @staticmethod
+    def export(path_logs: str | Path = None):
+        """Writes collected metrics in enabled formats. Failures are only logged, so they never fail the command"""
+        try:
+            export_formats = Metrics.get_export_formats()
+            if path_logs and Metrics.ExportFormat.PROMETHEUS in export_formats:
+                Metrics.REGISTRY.write_textfile(Path(path_logs).joinpath(Metrics.FILE_NAME_PROMETHEUS))
+            if path_logs and Metrics.ExportFormat.JSON in export_formats:
+                Metrics.REGISTRY.write_json(Path(path_logs).joinpath(Metrics.FILE_NAME_JSON))
+            if textfile_dir := Metrics.get_textfile_dir():
+                Metrics.REGISTRY.write_textfile(textfile_dir.joinpath(Metrics.TEXTFILE_NAME))
+        except Exception as e:
+            logging.warning(f"Could not export metrics: {e}")
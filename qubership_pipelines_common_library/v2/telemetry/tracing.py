@@ -0,0 +1,277 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from pathlib import Path
+
+
+class Span:
+    """Single timed operation. Created via `Tracer.span` or `Tracer.start_span`"""
+
+    def __init__(self, name: str, kind: str, trace_id: str, parent_span_id: str | None, attributes: dict = None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.attributes = dict(attributes) if attributes else {}
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns = None
+        self.status_code = Tracer.StatusCode.UNSET
+        self.status_message = None
+        self._ended = False
+
+    def set_attribute(self, key: str, value):
+        if value is not None:
+            self.attributes[key] = value
+        return self
+
+    def set_status(self, status_code: str, message: str = None):
+        self.status_code = Tracer.StatusCode(status_code)
+        self.status_message = message
+        return self
+
+    def record_exception(self, exception: BaseException):
+        self.set_attribute("error.type", type(exception).__qualname__)
+        self.set_status(Tracer.StatusCode.ERROR, str(exception))
+        return self
+
+    def end(self):
+        if self._ended:
+            return
+        self._ended = True
+        self.end_time_ns = time.time_ns()
+        if exporter := Tracer.get_exporter():
+            exporter.export(self)
+
+
+class _NoopSpan:
+    """Returned when tracing is disabled, so instrumented code doesn't need to check it"""
+    span_id = None
+    trace_id = None
+
+    def set_attribute(self, key: str, value):
+        return self
+
+    def set_status(self, status_code: str, message: str = None):
+        return self
+
+    def record_exception(self, exception: BaseException):
+        return self
+
+    def end(self):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    Optional tracing facade, emitting OpenTelemetry-style spans for outbound calls and command phases.
+
+    Tracing is disabled (no-op) by default. It's enabled either explicitly with `Tracer.configure(exporter)`,
+    or with `PIPELINES_TRACING_EXPORTER=OTLP_JSON` environment variable - then spans of each command run
+    are written into `otlp_traces.json` (OTLP/JSON, one export request per line) in command logs folder
+    """
+
+    class SpanKind(StrEnum):
+        INTERNAL = 'INTERNAL'
+        SERVER = 'SERVER'
+        CLIENT = 'CLIENT'
+
+    class StatusCode(StrEnum):
+        UNSET = 'UNSET'
+        OK = 'OK'
+        ERROR = 'ERROR'
+
+    class ExporterType(StrEnum):
+        NONE = 'NONE'
+        OTLP_JSON = 'OTLP_JSON'
+
+    TRACING_EXPORTER_ENV = "PIPELINES_TRACING_EXPORTER"
+
+    _exporter = None
+    _configured = False
+    _lock = threading.Lock()
+    _current_span = ContextVar("current_span", default=None)
+
+    @staticmethod
+    def configure(exporter: 'SpanExporter | None'):
+        """Sets exporter for all spans (None disables tracing)"""
+        with Tracer._lock:
+            Tracer._exporter = exporter
+            Tracer._configured = True
+
+    @staticmethod
+    def reset():
+        """Drops configured exporter, so it's resolved from environment again"""
+        with Tracer._lock:
+            Tracer._exporter = None
+            Tracer._configured = False
+
+    @staticmethod
+    def get_exporter() -> 'SpanExporter | None':
+        if not Tracer._configured:
+            with Tracer._lock:
+                if not Tracer._configured:
+                    Tracer._exporter = Tracer._create_exporter_from_env()
+                    Tracer._configured = True
+        return Tracer._exporter
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return Tracer.get_exporter() is not None
+
+    @staticmethod
+    def get_current_span() -> Span | None:
+        return Tracer._current_span.get()
+
+    @staticmethod
+    def start_span(name: str, kind: str = SpanKind.INTERNAL, attributes: dict = None,
+                   parent: Span = None) -> Span | _NoopSpan:
+        """Starts span that has to be ended explicitly. Parent defaults to current span (see `span`)"""
+        if not Tracer.is_enabled():
+            return NOOP_SPAN
+        parent = parent if parent is not None else Tracer.get_current_span()
+        if isinstance(parent, Span):
+            return Span(name, Tracer.SpanKind(kind), parent.trace_id, parent.span_id, attributes)
+        return Span(name, Tracer.SpanKind(kind), os.urandom(16).hex(), None, attributes)
+
+    @staticmethod
+    @contextmanager
+    def span(name: str, kind: str = SpanKind.INTERNAL, attributes: dict = None, parent: Span = None):
+        """Measures enclosed block as span, which becomes parent of spans started inside it. Exceptions mark span as failed"""
+        span = Tracer.start_span(name, kind, attributes, parent)
+        if span is NOOP_SPAN:
+            yield span
+            return
+        token = Tracer._current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            if not (isinstance(e, SystemExit) and not e.code):
+                span.record_exception(e)
+            raise
+        finally:
+            Tracer._current_span.reset(token)
+            span.end()
+
+    @staticmethod
+    def flush(path_logs: str | Path = None):
+        """Writes buffered spans (if tracing is enabled)"""
+        if exporter := Tracer.get_exporter():
+            try:
+                exporter.flush(path_logs)
+            except Exception as e:
+                logging.warning(f"Could not export tracing spans: {e}")
+
+    @staticmethod
+    def _create_exporter_from_env() -> 'SpanExporter | None':
+        value = os.getenv(Tracer.TRACING_EXPORTER_ENV, Tracer.ExporterType.NONE).strip().upper()
+        if value == Tracer.ExporterType.OTLP_JSON:
+            return OtlpJsonFileExporter()
+        if value and value != Tracer.ExporterType.NONE:
+            logging.warning(f"Unsupported {Tracer.TRACING_EXPORTER_ENV} value: '{value}', tracing is disabled")
+        return None
+
+
+class SpanExporter:
+    """Base class for span exporters: receives each ended span, and writes them out on `flush`"""
+
+    def export(self, span: Span):
+        pass
+
+    def flush(self, path_logs: str | Path = None):
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps ended spans in memory (e.g. for tests or custom processing)"""
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+
+class OtlpJsonFileExporter(InMemorySpanExporter):
+    """
+    Writes buffered spans as OTLP/JSON `ExportTraceServiceRequest` line into `file_path`,
+    or into `otlp_traces.json` in logs folder passed to `flush` (file format of OpenTelemetry Collector file exporter)
+    """
+
+    FILE_NAME = "otlp_traces.json"
+    SCOPE_NAME = "qubership_pipelines_common_library"
+    DEFAULT_SERVICE_NAME = "qubership-pipelines"
+    SPAN_KINDS = {Tracer.SpanKind.INTERNAL: 1, Tracer.SpanKind.SERVER: 2, Tracer.SpanKind.CLIENT: 3}
+    STATUS_CODES = {Tracer.StatusCode.UNSET: 0, Tracer.StatusCode.OK: 1, Tracer.StatusCode.ERROR: 2}
+
+    def __init__(self, file_path: str | Path = None, service_name: str = None):
+        super().__init__()
+        self.file_path = Path(file_path) if file_path else None
+        self.service_name = service_name or os.getenv("OTEL_SERVICE_NAME") or self.DEFAULT_SERVICE_NAME
+
+    def flush(self, path_logs: str | Path = None):
+        file_path = self.file_path or (Path(path_logs).joinpath(self.FILE_NAME) if path_logs else None)
+        if not file_path:
+            return
+        with self._lock:
+            spans, self.spans = self.spans, []
+        if not spans:
+            return
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, mode="a", encoding="utf-8") as file:
+            file.write(json.dumps(self.to_otlp(spans), separators=(",", ":")) + "\n")
+
+    def to_otlp(self, spans: list[Span]) -> dict:
+        return {"resourceSpans": [{
+            "resource": {"attributes": self._attributes({"service.name": self.service_name})},
+            "scopeSpans": [{
+                "scope": {"name": self.SCOPE_NAME},
+                "spans": [self._span(span) for span in spans],
+            }],
+        }]}
+
+    def _span(self, span: Span) -> dict:
+        result = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": self.SPAN_KINDS[span.kind],
+            "startTimeUnixNano": str(span.start_time_ns),
+            "endTimeUnixNano": str(span.end_time_ns),
+            "attributes": self._attributes(span.attributes),
+            "status": {"code": self.STATUS_CODES[span.status_code]},
+        }
+        if span.parent_span_id:
+            result["parentSpanId"] = span.parent_span_id
+        if span.status_message:
+            result["status"]["message"] = span.status_message
+        return result
+
+    @staticmethod
+    def _attributes(attributes: dict) -> list[dict]:
+        return [{"key": key, "value": OtlpJsonFileExporter._value(value)} for key, value in attributes.items()]
+
+    @staticmethod
+    def _value(value) -> dict:
+        if isinstance(value, bool):
+            return {"boolValue": value}
+        if isinstance(value, int):
+            return {"intValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        return {"stringValue": str(value)}
@@ -0,0 +1,144 @@
+import logging
+import os
+import threading
+
+from urllib.parse import urlsplit
+from qubership_pipelines_common_library.v2.utils.circuit_breaker import CircuitBreaker
+from qubership_pipelines_common_library.v2.utils.rate_limiter import RateLimiter
+from qubership_pipelines_common_library.v2.utils.state_store import StateStore, InMemoryStateStore, FileStateStore
+
+
+class BackendGuard:
+    """
+    Rate limiter and circuit breaker of a single backend host, shared by all clients calling it
+    (`RetryDecorator` consults it before each attempt, when decorated function declares its backend).
+
+    Defaults can be changed with `BackendGuard.configure(...)` or environment variables:
+    `PIPELINES_BACKEND_RATE_LIMIT` (calls per second per host, 0 disables limiting),
+    `PIPELINES_BACKEND_FAILURE_THRESHOLD` (consecutive failures to open circuit, 0 disables breaker),
+    `PIPELINES_BACKEND_RECOVERY_SECONDS` (how long circuit stays open) and
+    `PIPELINES_BACKEND_STATE_DIR` (folder to share state between processes on one host, in-process by default)
+    """
+
+    RATE_LIMIT_ENV = "PIPELINES_BACKEND_RATE_LIMIT"
+    FAILURE_THRESHOLD_ENV = "PIPELINES_BACKEND_FAILURE_THRESHOLD"
+    RECOVERY_SECONDS_ENV = "PIPELINES_BACKEND_RECOVERY_SECONDS"
+    STATE_DIR_ENV = "PIPELINES_BACKEND_STATE_DIR"
+
+    DEFAULT_RATE_LIMIT = 10.0
+    DEFAULT_FAILURE_THRESHOLD = 5
+    DEFAULT_RECOVERY_SECONDS = 30.0
+
+    _settings = None
+    _guards = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(rate_per_second: float = DEFAULT_RATE_LIMIT, burst: int = None,
+                  failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, recovery_timeout_seconds: float = DEFAULT_RECOVERY_SECONDS,
+                  store: StateStore = None):
+        with BackendGuard._lock:
+            BackendGuard._settings = {
+                "rate_per_second": rate_per_second, "burst": burst, "failure_threshold": failure_threshold,
+                "recovery_timeout_seconds": recovery_timeout_seconds, "store": store or InMemoryStateStore(),
+            }
+            BackendGuard._guards.clear()
+
+    @staticmethod
+    def reset():
+        """Drops all guards and explicit configuration (so it's resolved from environment again)"""
+        with BackendGuard._lock:
+            BackendGuard._settings = None
+            BackendGuard._guards.clear()
+
+    @staticmethod
+    def host_key(url: str) -> str | None:
+        """Normalizes backend URL (or bare host) to `host[:port]`, used as key of its guard"""
+        if not url:
+            return None
+        url = str(url).strip()
+        parts = urlsplit(url if "://" in url else f"//{url}")
+        return parts.netloc.rsplit("@", 1)[-1].lower() or None
+
+    @staticmethod
+    def for_host(url: str) -> 'BackendGuard | None':
+        """Returns guard shared by all calls to given host (or None, if host is unknown)"""
+        host = BackendGuard.host_key(url)
+        if not host:
+            return None
+        with BackendGuard._lock:
+            if BackendGuard._settings is None:
+                BackendGuard._settings = BackendGuard._settings_from_env()
+            if host not in BackendGuard._guards:
+                BackendGuard._guards[host] = BackendGuard(host, **BackendGuard._settings)
+            return BackendGuard._guards[host]
+
+    def __init__(self, host: str, rate_per_second: float = DEFAULT_RATE_LIMIT, burst: int = None,
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, recovery_timeout_seconds: float = DEFAULT_RECOVERY_SECONDS,
+                 store: StateStore = None):
+        store = store if store is not None else InMemoryStateStore()
+        self.host = host
+        self.rate_limiter = RateLimiter(host, rate_per_second, burst, store) if rate_per_second > 0 else None
+        self.circuit_breaker = CircuitBreaker(host, failure_threshold, recovery_timeout_seconds, store) if failure_threshold > 0 else None
+
+    def before_call(self) -> float:
+        """Raises `CircuitOpenError` if backend is considered unavailable, otherwise returns seconds to wait for rate limit"""
+        if self.circuit_breaker:
+            self.circuit_breaker.before_call()
+        return self.rate_limiter.reserve() if self.rate_limiter else 0.0
+
+    def record_success(self):
+        if self.circuit_breaker:
+            self.circuit_breaker.record_success()
+
+    def record_failure(self):
+        if self.circuit_breaker:
+            self.circuit_breaker.record_failure()
+
+    @staticmethod
+    def is_backend_failure(value) -> bool:
+        """
+        Whether failed result or exception means that backend is unavailable: connection errors, timeouts,
+        5xx and 429 responses. Client errors (e.g. 400, 403, 404) mean that backend is up, they don't count as its failures
+        """
+        status = BackendGuard._status_code(value)
+        if status is not None:
+            return status >= 500 or status == 429
+        return isinstance(value, OSError)  # includes ConnectionError, TimeoutError and connection errors of `requests`
+
+    @staticmethod
+    def _status_code(value) -> int | None:
+        """HTTP status of response, or of exception carrying it (`requests`, `python-gitlab`, `urllib` conventions)"""
+        for candidate in (value, getattr(value, "response", None)):
+            for attribute in ("status_code", "response_code", "status"):
+                status = getattr(candidate, attribute, None)
+                if isinstance(status, int) and not isinstance(status, bool):
+                    return status
+        return None
+
+    @staticmethod
+    def _settings_from_env() -> dict:
+        settings = {
+            "rate_per_second": BackendGuard._number_from_env(BackendGuard.RATE_LIMIT_ENV, BackendGuard.DEFAULT_RATE_LIMIT),
+            "burst": None,
+            "failure_threshold": int(BackendGuard._number_from_env(BackendGuard.FAILURE_THRESHOLD_ENV, BackendGuard.DEFAULT_FAILURE_THRESHOLD)),
+            "recovery_timeout_seconds": BackendGuard._number_from_env(BackendGuard.RECOVERY_SECONDS_ENV, BackendGuard.DEFAULT_RECOVERY_SECONDS),
+            "store": InMemoryStateStore(),
+        }
+        if state_dir := os.getenv(BackendGuard.STATE_DIR_ENV):
+            try:
+                settings["store"] = FileStateStore(state_dir)
+            except Exception as e:
+                logging.warning(f"Could not use '{state_dir}' to share backends state, it will be kept in-process: {e}")
+        return settings
+
+    @staticmethod
+    def _number_from_env(name: str, default: float) -> float:
+        value = os.getenv(name)
+        if not value:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            logging.warning(f"Unsupported {name} value: '{value}', using default {default}")
+            return default
@@ -0,0 +1,74 @@
+import logging
+import time
+
+from enum import StrEnum
+from qubership_pipelines_common_library.v2.utils.state_store import StateStore, InMemoryStateStore
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a backend whose circuit is open. `retry_after_seconds` tells when it may be probed again"""
+
+    def __init__(self, key: str, retry_after_seconds: float):
+        super().__init__(f"Circuit for '{key}' is open after repeated failures, next attempt is allowed in {retry_after_seconds:.1f} seconds")
+        self.key = key
+        self.retry_after_seconds = retry_after_seconds
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing backend: after `failure_threshold` consecutive failures circuit opens and calls are rejected
+    with `CircuitOpenError` for `recovery_timeout_seconds`. Then single probe call is let through (half-open state):
+    its success closes circuit, its failure opens it again.
+    State is kept in `store` under `key`, so breakers with the same key (and shared store) see the same circuit
+    """
+
+    class State(StrEnum):
+        CLOSED = 'CLOSED'
+        OPEN = 'OPEN'
+        HALF_OPEN = 'HALF_OPEN'
+
+    def __init__(self, key: str, failure_threshold: int = 5, recovery_timeout_seconds: float = 30,
+                 store: StateStore = None):
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout_seconds = recovery_timeout_seconds
+        self.store = store if store is not None else InMemoryStateStore()
+        self._store_key = f"circuit_breaker:{key}"
+
+    def get_state(self) -> State:
+        return CircuitBreaker.State(self.store.get(self._store_key).get("state", CircuitBreaker.State.CLOSED))
+
+    def before_call(self):
+        """Raises `CircuitOpenError` if call is not allowed now"""
+        def check(state: dict) -> tuple[dict, float | None]:
+            now = time.time()
+            circuit_state = state.get("state", CircuitBreaker.State.CLOSED)
+            if circuit_state == CircuitBreaker.State.CLOSED:
+                return state, None
+            # in OPEN state, time of opening; in HALF_OPEN state, time when probe was let through
+            retry_at = state.get("changed_at", 0.0) + self.recovery_timeout_seconds
+            if now < retry_at:
+                return state, retry_at - now
+            return {**state, "state": CircuitBreaker.State.HALF_OPEN, "changed_at": now}, None
+        if (retry_after_seconds := self.store.update(self._store_key, check)) is not None:
+            raise CircuitOpenError(self.key, retry_after_seconds)
+
+    def record_success(self):
+        def close(state: dict) -> tuple[dict, str]:
+            return {"state": CircuitBreaker.State.CLOSED, "failures": 0, "changed_at": time.time()}, state.get("state")
+        if self.store.update(self._store_key, close) not in (None, CircuitBreaker.State.CLOSED):
+            logging.info(f"Circuit for '{self.key}' is closed, backend is available again")
+
+    def record_failure(self):
+        def fail(state: dict) -> tuple[dict, bool]:
+            now = time.time()
+            failures = state.get("failures", 0) + 1
+            circuit_state = state.get("state", CircuitBreaker.State.CLOSED)
+            if circuit_state == CircuitBreaker.State.OPEN:
+                return {**state, "failures": failures}, False  # late failures of calls started before opening
+            if circuit_state == CircuitBreaker.State.HALF_OPEN or failures >= self.failure_threshold:
+                return {"state": CircuitBreaker.State.OPEN, "failures": failures, "changed_at": now}, True
+            return {**state, "failures": failures}, False
+        if self.store.update(self._store_key, fail):
+            logging.warning(f"Circuit for '{self.key}' is opened after {self.failure_threshold} consecutive failures, "
+                            f"calls are suspended for {self.recovery_timeout_seconds} seconds")
@@ -1,3 +1,6 @@
+import yaml
+
+
 class CryptoUtils:
     EXCLUDE_KEYS = {"kind", "apiVersion"}
 
@@ -43,8 +46,56 @@ def mask_values(data, path=None):
 
     @staticmethod
     def get_parameters_for_print(content: dict, need_mask: bool):
-        import yaml
-        if need_mask:
-            return yaml.dump(CryptoUtils.mask_values(content), default_flow_style=False)
-        else:
-            return yaml.dump(content, default_flow_style=False)
+        return str(MaskedParamsView(content, need_mask))
+
+
+class MaskedParamsView:
+    """
+    Lazy printable view of params content, rendered to YAML only when converted to string (e.g. by logging, when record is emitted).
+
+    Masking (same as `CryptoUtils.mask_values`) is applied while serializing, without copying content.
+    Rendered text is memoized, so several log handlers format it only once
+    """
+
+    def __init__(self, content: dict, need_mask: bool):
+        self.content = content
+        self.need_mask = need_mask
+        self._rendered = None
+
+    def __str__(self):
+        if self._rendered is None:
+            if self.need_mask:
+                self._rendered = yaml.dump(self.content, Dumper=_MaskingDumper, default_flow_style=False)
+            else:
+                self._rendered = yaml.dump(self.content, default_flow_style=False)
+        return self._rendered
+
+
+class _MaskingDumper(yaml.Dumper):
+    """Represents leaf values as masked placeholders (keeping root-level `CryptoUtils.EXCLUDE_KEYS` as is)"""
+
+    def represent(self, data):
+        self.serialize(self._represent_masked(data, is_root=True))
+        self.represented_objects = {}
+        self.object_keeper = []
+        self.alias_key = None
+
+    def _represent_masked(self, data, is_root: bool = False) -> yaml.Node:
+        if isinstance(data, dict):
+            items = list(data.items())
+            if self.sort_keys:
+                try:
+                    items = sorted(items)
+                except TypeError:
+                    pass
+            value = [(self.represent_data(key),
+                      self.represent_data(item) if is_root and key in CryptoUtils.EXCLUDE_KEYS
+                      else self._represent_masked(item))
+                     for key, item in items]
+            return yaml.MappingNode("tag:yaml.org,2002:map", value, flow_style=self.default_flow_style)
+        if isinstance(data, list):
+            return yaml.SequenceNode("tag:yaml.org,2002:seq", [self._represent_masked(item) for item in data],
+                                     flow_style=self.default_flow_style)
+        if data is None or data == '':
+            return self.represent_str("")
+        return self.represent_str("[MASKED]")
@@ -20,3 +20,23 @@ def create_instance(class_path: str, expected_base_class: Optional[Type] = None,
         if expected_base_class and not issubclass(klass, expected_base_class):
             raise TypeError(f"Class {class_path} must inherit from {expected_base_class.__name__}")
         return klass(**kwargs)
+
+
+class LazyClassMap(dict):
+    """Dict of classes, values given as classpaths are imported on first read (readers always get class objects)"""
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, str):
+            value = ExtensionLoader.load_class(value)
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
@@ -0,0 +1,33 @@
+import time
+
+from qubership_pipelines_common_library.v2.utils.state_store import StateStore, InMemoryStateStore
+
+
+class RateLimiter:
+    """
+    Token bucket: allows bursts of up to `burst` calls, refilled at `rate_per_second`.
+    State is kept in `store` under `key`, so limiters with the same key (and shared store) share the budget
+    """
+
+    def __init__(self, key: str, rate_per_second: float, burst: int = None, store: StateStore = None):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.key = f"rate_limiter:{key}"
+        self.rate_per_second = rate_per_second
+        self.burst = burst if burst else max(int(rate_per_second), 1)
+        self.store = store if store is not None else InMemoryStateStore()
+
+    def reserve(self) -> float:
+        """Takes one token and returns number of seconds caller has to wait before making the call (0 if none)"""
+        def take(state: dict) -> tuple[dict, float]:
+            now = time.time()
+            tokens = state.get("tokens", self.burst)
+            elapsed = max(now - state.get("updated_at", now), 0.0)
+            tokens = min(self.burst, tokens + elapsed * self.rate_per_second) - 1
+            return {"tokens": tokens, "updated_at": now}, (-tokens / self.rate_per_second if tokens < 0 else 0.0)
+        return self.store.update(self.key, take)
+
+    def acquire(self):
+        """Blocks until call is allowed"""
+        if wait_seconds := self.reserve():
+            time.sleep(wait_seconds)
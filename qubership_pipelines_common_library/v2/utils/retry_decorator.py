@@ -1,93 +1,243 @@
+import asyncio
+import inspect
 import logging
+import random
 import sys
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
 from typing import Callable
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics
+from qubership_pipelines_common_library.v2.telemetry.tracing import Tracer
+from qubership_pipelines_common_library.v2.utils.backend_guard import BackendGuard
+from qubership_pipelines_common_library.v2.utils.circuit_breaker import CircuitOpenError
 
 
-class RetryDecorator:
+class RetryError(Exception):
+    """Raised by `RetryDecorator(raise_on_failure=True)` when function didn't succeed within retry timeout"""
+
+    def __init__(self, message: str, last_result=None, attempts: int = 0):
+        super().__init__(message)
+        self.last_result = last_result
+        self.attempts = attempts
 
-    def __init__(self, condition_func, retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1):
-        self.condition_func = condition_func
+
+class RetryDecorator:
+    """
+    Retries decorated function (sync or async) until `condition_func(result)` is true, or until retry timeout expires.
+
+    Timeout is a deadline on monotonic clock, so time spent inside calls counts too.
+    Wait between attempts starts at `retry_wait_seconds` and is multiplied by `backoff_multiplier` after each attempt
+    (up to `max_wait_seconds`); with `jitter` each wait is random in [0, wait] ("full jitter"), so concurrent clients
+    don't retry in lockstep. When result (or exception) carries HTTP response with `Retry-After` header,
+    wait is extended to it; if it's beyond the deadline, retrying stops right away.
+
+    When `backend_func` is set, it receives call arguments of decorated function and returns URL of called backend:
+    each attempt then passes through rate limiter and circuit breaker of that host (see `BackendGuard`),
+    and its outcome is reported to the breaker. Only failed results and exceptions accepted by `failure_classifier`
+    (by default `BackendGuard.is_backend_failure`: connection errors, timeouts, 5xx and 429 responses) count as backend failures;
+    other failed results (e.g. 404 response) still mean that backend is available.
+
+    Exceptions of `retry_on` types are retried, exceptions of `give_up_on` types (and any others) are raised immediately.
+    On exhaustion process exits with code 1, or `RetryError` is raised when `raise_on_failure` is set.
+
+    `retry_timeout_seconds` and `retry_wait_seconds` arguments of decorated function call override defaults
+    for that call only, so one decorated method can be safely used from several threads.
+    """
+
+    LOG_INTERVAL_SECONDS = 10
+
+    def __init__(self, condition_func: Callable = None, retry_timeout_seconds: float = 180, retry_wait_seconds: float = 1,
+                 backoff_multiplier: float = 1.0, max_wait_seconds: float = None, jitter: bool = False,
+                 retry_on: tuple[type[BaseException], ...] = (Exception,), give_up_on: tuple[type[BaseException], ...] = (),
+                 respect_retry_after: bool = True, raise_on_failure: bool = False, backend_func: Callable = None,
+                 failure_classifier: Callable = None):
+        self.condition_func = condition_func if condition_func is not None else (lambda result: True)
         self.retry_timeout_seconds = retry_timeout_seconds
         self.retry_wait_seconds = retry_wait_seconds
+        self.backoff_multiplier = backoff_multiplier
+        self.max_wait_seconds = max_wait_seconds
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+        self.give_up_on = tuple(give_up_on)
+        self.respect_retry_after = respect_retry_after
+        self.raise_on_failure = raise_on_failure
+        self.backend_func = backend_func
+        self.failure_classifier = failure_classifier if failure_classifier is not None else BackendGuard.is_backend_failure
         self.logger = logging.getLogger()
 
+    @classmethod
+    def with_backoff(cls, condition_func: Callable = None, **kwargs) -> 'RetryDecorator':
+        """Policy for calls of remote APIs: exponential backoff (x2, up to 30 seconds) with full jitter"""
+        return cls(condition_func, **{"backoff_multiplier": 2.0, "max_wait_seconds": 30, "jitter": True, **kwargs})
+
     def __call__(self, func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with Tracer.span(f"retry {func.__qualname__}", attributes={"code.function": func.__qualname__}) as span:
+                    attempts = _RetryAttempts(self, func, span, signature, args, kwargs)
+                    while True:
+                        try:
+                            if wait_seconds := attempts.before_attempt():
+                                await asyncio.sleep(wait_seconds)
+                            result = await func(*args, **kwargs)
+                        except Exception as e:
+                            delay = attempts.on_exception(e)
+                        else:
+                            delay = attempts.on_result(result)
+                            if delay is None:
+                                return result
+                        await asyncio.sleep(delay)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            self._update_retry_timeout_seconds_from_kwargs(kwargs, func)
-            self._update_retry_wait_seconds_from_kwargs(kwargs, func)
-
-            count_seconds = 0
-            retries = 0
-            last_log_time = time.perf_counter()
-            last_result = None
-            estimated_max_attempts = self.retry_timeout_seconds // self.retry_wait_seconds
-
-
-            while count_seconds < self.retry_timeout_seconds and not self.condition_func(last_result):
-                try:
-                    last_result = func(*args, **kwargs)
-                    if self.condition_func(last_result):
-                        self.logger.debug(f"Function {func.__name__} successfully executed after {retries} attempts in {count_seconds}s")
-                        return last_result
-                    retries += 1
-
-                    now = time.perf_counter()
-                    if now - last_log_time >= 10:
-                        self._sleep_with_warning_log(
-                            f"Made [{retries} of {estimated_max_attempts}] retries with {self.retry_wait_seconds} seconds between attempts. Trying to execute func: {self.condition_func.__name__}. {count_seconds} of {self.retry_timeout_seconds} seconds left")
-                        last_log_time = now
-                    else:
-                        time.sleep(self.retry_wait_seconds)
-
-                except Exception as e:
-                    retries += 1
-                    now = time.perf_counter()
-                    if now - last_log_time >= 10:
-                        self._process_exception_during_func_execution(e, count_seconds, func.__name__, retries, estimated_max_attempts)
-                        last_log_time = now
-                    else:
-                        time.sleep(self.retry_wait_seconds)
-
-                finally:
-                    count_seconds += self.retry_wait_seconds
-
-            if self.condition_func(last_result):
-                self.logger.debug(f"Function {func.__name__} successfully executed after {retries} attempts in {count_seconds}s")
-                return last_result
-
-            self._exit_with_error_message(func.__name__)
+            with Tracer.span(f"retry {func.__qualname__}", attributes={"code.function": func.__qualname__}) as span:
+                return self._call_with_retries(func, _RetryAttempts(self, func, span, signature, args, kwargs), *args, **kwargs)
         return wrapper
 
-    def _sleep_with_warning_log(self, message):
-        self.logger.warning(message)
-        time.sleep(self.retry_wait_seconds)
-
-    def _update_retry_timeout_seconds_from_kwargs(self, kwargs, func):
-        kwargs_retry_timeout_seconds = kwargs.get('retry_timeout_seconds')
-        if kwargs_retry_timeout_seconds:
-            self.retry_timeout_seconds = kwargs_retry_timeout_seconds
-        else:
-            self.logger.debug(
-                f"`retry_timeout_seconds` is not found in func {func.__name__} arguments. Using default value = {self.retry_timeout_seconds}")
-
-    def _update_retry_wait_seconds_from_kwargs(self, kwargs, func):
-        kwargs_retry_wait_seconds = kwargs.get('retry_wait_seconds')
-        if kwargs_retry_wait_seconds:
-            self.retry_wait_seconds = kwargs_retry_wait_seconds
-        else:
-            self.logger.debug(
-                f"`retry_wait_seconds` is not found in func {func.__name__} arguments. Using default value = {self.retry_wait_seconds}")
-
-    def _process_exception_during_func_execution(self, exception, count_seconds, func_name, retries, estimated_max_attempts):
-        if count_seconds < self.retry_timeout_seconds:
-            self._sleep_with_warning_log(
-                f"Made [{retries} of {estimated_max_attempts}] retries. Exception happened during function {func_name} execution,  waiting {count_seconds} of {self.retry_timeout_seconds}. Exception: {exception}")
-        else:
-            self._exit_with_error_message(func_name)
-
-    def _exit_with_error_message(self, func_name):
-        self.logger.error(f"Can't execute function {func_name} in {self.retry_timeout_seconds} seconds")
+    def _call_with_retries(self, func: Callable, attempts: '_RetryAttempts', *args, **kwargs):
+        while True:
+            try:
+                if wait_seconds := attempts.before_attempt():
+                    time.sleep(wait_seconds)
+                result = func(*args, **kwargs)
+            except Exception as e:
+                delay = attempts.on_exception(e)
+            else:
+                delay = attempts.on_result(result)
+                if delay is None:
+                    return result
+            time.sleep(delay)
+
+    def compute_wait_seconds(self, base_wait_seconds: float, retries: int) -> float:
+        """Wait before next attempt, after `retries` failed attempts (without `Retry-After` and deadline adjustments)"""
+        wait = base_wait_seconds * (self.backoff_multiplier ** max(retries - 1, 0))
+        if self.max_wait_seconds is not None:
+            wait = min(wait, self.max_wait_seconds)
+        return random.uniform(0, wait) if self.jitter else wait
+
+    @staticmethod
+    def get_retry_after_seconds(value) -> float | None:
+        """Extracts `Retry-After` delay from HTTP response (or exception with `response` attribute), if present"""
+        if isinstance(value, CircuitOpenError):
+            return value.retry_after_seconds
+        response = value if hasattr(value, "headers") else getattr(value, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers or not hasattr(headers, "get"):
+            return None
+        retry_after = headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            pass
+        try:
+            return max((parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def _exit_with_error_message(self, func_name: str, retry_timeout_seconds: float, last_result=None, attempts: int = 0,
+                                 last_exception: Exception = None):
+        message = f"Can't execute function {func_name} in {retry_timeout_seconds} seconds"
+        if self.raise_on_failure:
+            raise RetryError(message, last_result=last_result, attempts=attempts) from last_exception
+        self.logger.error(message)
         sys.exit(1)
+
+
+class _RetryAttempts:
+    """State of retries of a single call of decorated function (decorator itself stays immutable)"""
+
+    def __init__(self, decorator: RetryDecorator, func: Callable, span, signature: inspect.Signature, args: tuple, kwargs: dict):
+        self.decorator = decorator
+        self.func_name = func.__name__
+        self.qualname = func.__qualname__
+        self.span = span
+        try:
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+        except TypeError:
+            arguments = kwargs
+        self.timeout_seconds = arguments.get("retry_timeout_seconds") or decorator.retry_timeout_seconds
+        self.wait_seconds = arguments.get("retry_wait_seconds") or decorator.retry_wait_seconds
+        self.guard = self._get_backend_guard(args, kwargs)
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + self.timeout_seconds
+        self.last_log_time = self.started_at
+        self.retries = 0
+        self.last_result = None
+        self.last_exception = None
+
+    def before_attempt(self) -> float:
+        """Returns wait required by rate limit of backend, raises `CircuitOpenError` if backend is unavailable"""
+        return self.guard.before_call() if self.guard else 0.0
+
+    def on_result(self, result) -> float | None:
+        """Returns None if result is successful, otherwise wait before next attempt"""
+        success = self.decorator.condition_func(result)
+        if self.guard:
+            if not success and self.decorator.failure_classifier(result):
+                self.guard.record_failure()
+            else:
+                self.guard.record_success()
+        if success:
+            self.span.set_attribute("pipelines.retry.count", self.retries)
+            if self.retries:
+                self.decorator.logger.debug("Function %s successfully executed after %s retries in %.1fs",
+                                            self.func_name, self.retries, time.monotonic() - self.started_at)
+            return None
+        self.last_result = result
+        self.last_exception = None
+        return self._next_delay(result, lambda: f"Trying to execute func: {self.func_name}.")
+
+    def on_exception(self, exception: Exception) -> float:
+        """Re-raises non-retryable exceptions, otherwise returns wait before next attempt"""
+        if not isinstance(exception, CircuitOpenError) and (
+                isinstance(exception, self.decorator.give_up_on) or not isinstance(exception, self.decorator.retry_on)):
+            self.span.set_attribute("pipelines.retry.count", self.retries)
+            raise exception
+        if self.guard and not isinstance(exception, CircuitOpenError) and self.decorator.failure_classifier(exception):
+            self.guard.record_failure()
+        self.last_exception = exception
+        return self._next_delay(exception, lambda: f"Exception happened during function {self.func_name} execution: {exception}.")
+
+    def _next_delay(self, value, describe: Callable[[], str]) -> float:
+        """`describe` builds attempt description, only called when it's going to be logged"""
+        self.retries += 1
+        Metrics.retries.inc(function=self.qualname)
+        self.span.set_attribute("pipelines.retry.count", self.retries)
+        now = time.monotonic()
+        remaining = self.deadline - now
+        if remaining <= 0:
+            self.decorator._exit_with_error_message(self.func_name, self.timeout_seconds, self.last_result, self.retries,
+                                                    self.last_exception)
+        delay = self.decorator.compute_wait_seconds(self.wait_seconds, self.retries)
+        if self.decorator.respect_retry_after or isinstance(value, CircuitOpenError):
+            retry_after = RetryDecorator.get_retry_after_seconds(value)
+            if retry_after is not None and retry_after > remaining:
+                self.decorator.logger.warning("%s Next attempt is not allowed for %.1f seconds, which is beyond retry timeout",
+                                              describe(), retry_after)
+                self.decorator._exit_with_error_message(self.func_name, self.timeout_seconds, self.last_result,
+                                                        self.retries, self.last_exception)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+        delay = min(delay, remaining)
+        if now - self.last_log_time >= RetryDecorator.LOG_INTERVAL_SECONDS:
+            self.decorator.logger.warning("Made %s retries, waiting %.1f seconds before next attempt. %s %.0f of %s seconds passed",
+                                          self.retries, delay, describe(), now - self.started_at, self.timeout_seconds)
+            self.last_log_time = now
+        return delay
+
+    def _get_backend_guard(self, args: tuple, kwargs: dict) -> BackendGuard | None:
+        if not self.decorator.backend_func:
+            return None
+        try:
+            return BackendGuard.for_host(self.decorator.backend_func(*args, **kwargs))
+        except Exception as e:
+            self.decorator.logger.debug("Could not determine backend of %s call: %s", self.func_name, e)
+            return None
@@ -0,0 +1,75 @@
+import json
+import re
+import threading
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable
+
+
+class StateStore(ABC):
+    """
+    Small key-value store for state that has to be updated atomically (e.g. rate limiter or circuit breaker of a backend).
+    `update` applies `func(state) -> (new_state, result)` under a lock and returns `result`
+    """
+
+    @abstractmethod
+    def update(self, key: str, func: Callable[[dict], tuple[dict, Any]]) -> Any:
+        pass
+
+    def get(self, key: str) -> dict:
+        return self.update(key, lambda state: (state, dict(state)))
+
+
+class InMemoryStateStore(StateStore):
+    """State shared by threads of current process"""
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def update(self, key: str, func: Callable[[dict], tuple[dict, Any]]) -> Any:
+        with self._lock:
+            state, result = func(dict(self._states.get(key, {})))
+            self._states[key] = state
+            return result
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+
+
+class FileStateStore(StateStore):
+    """
+    State shared by processes on the same host: each key is kept in its own JSON file in `directory`,
+    updates are serialized with exclusive `flock` on that file (POSIX only)
+    """
+
+    _UNSAFE_CHARS_PATTERN = re.compile(r"[^A-Za-z0-9._-]")
+
+    def __init__(self, directory: str | Path):
+        import fcntl  # noqa: F401 - fail early on platforms without POSIX file locks
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()  # flock is per open file, threads of one process are serialized separately
+
+    def update(self, key: str, func: Callable[[dict], tuple[dict, Any]]) -> Any:
+        import fcntl
+        file_path = self.directory.joinpath(self._UNSAFE_CHARS_PATTERN.sub("_", key) + ".json")
+        with self._lock, open(file_path, mode="a+", encoding="utf-8") as file:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                content = file.read()
+                try:
+                    state = json.loads(content) if content else {}
+                except ValueError:
+                    state = {}  # corrupted/partially written state is reset
+                new_state, result = func(state)
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(new_state))
+                file.flush()
+                return result
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
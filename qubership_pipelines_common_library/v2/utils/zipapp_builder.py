@@ -0,0 +1,237 @@
+import ast
+import compileall
+import hashlib
+import importlib.machinery
+import json
+import logging
+import py_compile
+import shutil
+import sys
+import tempfile
+import zipapp
+
+from datetime import datetime, timezone
+from modulefinder import ModuleFinder
+from pathlib import Path
+
+
+class ZipappBuilder:
+    """
+    Builds `.pyz` CLI archive from folder with installed application and its dependencies
+    (e.g. result of `pip install --target <source_dir> <your_cli_wheel>`).
+
+    - Top-level packages not reachable from `main` and registered `commands` are pruned (reachability is found statically
+      with `modulefinder`, including imports inside functions). Classes referenced by classpath in known registries
+      (see `DYNAMIC_CLASSPATH_REGISTRIES`) are followed too, once registry module is reachable.
+      Other packages loaded dynamically can be listed in `keep_packages`
+    - Modules are precompiled into hash-based `.pyc` files (placed next to sources, as `zipimport` expects),
+      so they are not compiled on every run. Bytecode is specific to Python version used for the build
+    - Optionally, same content is written as pre-extracted folder (runnable with `python <folder>`, with `.pyc` in `__pycache__`),
+      for runners that extract module anyway (see `need_to_extract` of `DownloadArtifact`)
+
+    Both outputs contain `pyz_manifest.json` describing the build
+    """
+
+    MANIFEST_FILE_NAME = "pyz_manifest.json"
+    MAIN_TEMPLATE = "# -*- coding: utf-8 -*-\nimport {module}\n{module}.{function}()\n"
+
+    # module -> names of its (class-level or module-level) dicts, whose values are classpaths imported at runtime
+    DYNAMIC_CLASSPATH_REGISTRIES = {
+        "qubership_pipelines_common_library.v2.secret_manager.providers.multi_store_provider": ("PROVIDER_MAP", "CREDENTIALS_MAP"),
+    }
+
+    def __init__(self, source_dir: str | Path, main: str, commands: list[str] = None, keep_packages: list[str] = None,
+                 prune: bool = True, compile_bytecode: bool = True, compressed: bool = True,
+                 dynamic_classpath_registries: dict[str, list[str]] = None):
+        """
+        Arguments:
+            source_dir (str): Folder with installed application and dependencies, it's not modified
+            main (str): Entry point of CLI, in `module:function` form (e.g. `my_cli.__main__:cli`)
+            commands (list[str]): Classpaths of registered commands, e.g. values of `LazyCommandGroup` registry
+                (commands imported by `main` module are found without it)
+            keep_packages (list[str]): Top-level packages that must not be pruned
+            prune (bool): Whether unused top-level packages should be removed
+            compile_bytecode (bool): Whether modules should be precompiled
+            compressed (bool): Whether archive should be compressed
+            dynamic_classpath_registries (dict): Additional registries of classpaths, same as `DYNAMIC_CLASSPATH_REGISTRIES`
+        """
+        self.source_dir = Path(source_dir)
+        self.main_module, _, self.main_function = main.partition(":")
+        if not self.main_module or not self.main_function:
+            raise ValueError(f"Entry point should be in 'module:function' form, got '{main}'")
+        self.main = main
+        self.commands = commands or []
+        self.keep_packages = set(keep_packages or [])
+        self.prune = prune
+        self.compile_bytecode = compile_bytecode
+        self.compressed = compressed
+        self.dynamic_classpath_registries = {**ZipappBuilder.DYNAMIC_CLASSPATH_REGISTRIES, **(dynamic_classpath_registries or {})}
+
+    def build(self, output_path: str | Path, extracted_path: str | Path = None) -> dict:
+        """Writes archive to `output_path` (and pre-extracted layout to `extracted_path`, if provided), returns manifest"""
+        with tempfile.TemporaryDirectory(prefix="zipapp_") as temp_dir:
+            staging_dir = Path(temp_dir, "app")
+            shutil.copytree(self.source_dir, staging_dir, ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+            staging_dir.joinpath("__main__.py").write_text(
+                ZipappBuilder.MAIN_TEMPLATE.format(module=self.main_module, function=self.main_function), encoding="utf-8")
+            pruned = self.prune_packages(staging_dir) if self.prune else []
+            manifest = {
+                "main": self.main,
+                "python_version": f"{sys.version_info.major}.{sys.version_info.minor}",
+                "bytecode": self.compile_bytecode,
+                "commands": self.commands,
+                "packages": sorted(self._top_level_names(staging_dir)),
+                "pruned_packages": pruned,
+                "built_at": datetime.now(timezone.utc).isoformat(),
+            }
+
+            if extracted_path:
+                extracted_path = Path(extracted_path)
+                shutil.rmtree(extracted_path, ignore_errors=True)
+                shutil.copytree(staging_dir, extracted_path)
+                if self.compile_bytecode:
+                    self._compile(extracted_path, legacy=False)
+                self._write_manifest(extracted_path, manifest)
+
+            if self.compile_bytecode:
+                self._compile(staging_dir, legacy=True)
+            self._write_manifest(staging_dir, manifest)
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            zipapp.create_archive(staging_dir, output_path, compressed=self.compressed)
+        logging.info("Built %s (%.1f MB), pruned packages: %s", output_path, output_path.stat().st_size / (1024 * 1024),
+                     pruned or "none")
+        return manifest
+
+    def prune_packages(self, app_dir: Path) -> list[str]:
+        """Removes top-level packages (and their `.dist-info`) not used by entry point and commands, returns their names"""
+        used = self.find_used_packages(app_dir) | self.keep_packages
+        pruned = []
+        for name, paths in self._top_level_names(app_dir).items():
+            if name not in used:
+                for path in paths:
+                    if path.is_dir():
+                        shutil.rmtree(path)
+                    else:
+                        path.unlink()
+                pruned.append(name)
+        for dist_info in app_dir.glob("*.dist-info"):
+            record_names = self._record_top_level_names(dist_info)
+            if record_names and record_names <= set(pruned):
+                shutil.rmtree(dist_info)
+        return sorted(pruned)
+
+    def find_used_packages(self, app_dir: Path) -> set[str]:
+        """Returns top-level names of modules reachable from entry point and commands"""
+        finder = _NamespaceAwareModuleFinder(path=[str(app_dir)] + sys.path)
+        for module in [self.main_module] + [class_path.rsplit(".", 1)[0] for class_path in self.commands]:
+            self._analyze(finder, module)
+        analyzed_registries = set()
+        while found_registries := [module for module in self.dynamic_classpath_registries
+                                   if module in finder.modules and module not in analyzed_registries]:
+            for registry in found_registries:
+                analyzed_registries.add(registry)
+                for class_path in self._registry_class_paths(finder.modules[registry].__file__,
+                                                             self.dynamic_classpath_registries[registry]):
+                    try:
+                        self._analyze(finder, class_path.rsplit(".", 1)[0])
+                    except ValueError as e:
+                        logging.warning("Class '%s' registered in %s is not available: %s", class_path, registry, e)
+        return {name.split(".")[0] for name in finder.modules}
+
+    @staticmethod
+    def _analyze(finder: ModuleFinder, module: str):
+        try:
+            finder.import_hook(module)
+        except (ImportError, SyntaxError) as e:
+            raise ValueError(f"Could not analyze imports of '{module}': {e}")
+        except Exception as e:
+            raise ValueError(f"Could not analyze imports of '{module}' ({type(e).__name__}: {e}), "
+                             f"use 'prune=False' or check its import graph")
+
+    @staticmethod
+    def _registry_class_paths(module_file: str, attributes: list[str]) -> list[str]:
+        """String values of dicts assigned to `attributes` in module source (registries are not imported during build)"""
+        if not module_file:
+            return []
+        class_paths = []
+        for node in ast.walk(ast.parse(Path(module_file).read_text(encoding="utf-8"))):
+            if not isinstance(node, ast.Assign) \
+                    or not any(isinstance(target, ast.Name) and target.id in attributes for target in node.targets):
+                continue
+            registry = node.value
+            if isinstance(registry, ast.Call) and registry.args:  # dict wrapped in mapping class, e.g. 'LazyClassMap({...})'
+                registry = registry.args[0]
+            if isinstance(registry, ast.Dict):
+                class_paths.extend(value.value for value in registry.values
+                                       if isinstance(value, ast.Constant) and isinstance(value.value, str) and "." in value.value)
+        return class_paths
+
+    @staticmethod
+    def _top_level_names(app_dir: Path) -> dict[str, list[Path]]:
+        """Importable top-level packages and modules (`name` -> paths), metadata and data folders are not included"""
+        names = {}
+        for path in app_dir.iterdir():
+            if path.name == "__main__.py" or path.name == ZipappBuilder.MANIFEST_FILE_NAME:
+                continue
+            if path.is_dir():
+                name = path.name.removesuffix(".libs")  # bundled shared libraries of binary wheels, e.g. 'numpy.libs'
+            elif path.suffix == ".py":
+                name = path.stem
+            elif path.suffix in (".so", ".pyd"):
+                name = path.name.split(".")[0]
+            else:
+                continue
+            if name.isidentifier():
+                names.setdefault(name, []).append(path)
+        return names
+
+    @staticmethod
+    def _record_top_level_names(dist_info: Path) -> set[str]:
+        record = dist_info.joinpath("RECORD")
+        if not record.is_file():
+            return set()
+        names = set()
+        for line in record.read_text(encoding="utf-8").splitlines():
+            top_level = line.split(",", 1)[0].split("/", 1)[0]
+            if not top_level or top_level == dist_info.name or top_level in ("..", "bin"):
+                continue
+            names.add(top_level.split(".")[0])
+        return names
+
+    @staticmethod
+    def _compile(app_dir: Path, legacy: bool):
+        """`legacy` places `.pyc` next to sources, which is where `zipimport` looks for them (instead of `__pycache__`)"""
+        if not compileall.compile_dir(app_dir, quiet=1, legacy=legacy, workers=0,
+                                      invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH):
+            logging.warning("Some modules in %s could not be compiled, they will be compiled on import", app_dir)
+
+    @staticmethod
+    def _write_manifest(app_dir: Path, manifest: dict):
+        files = {}
+        for path in sorted(app_dir.rglob("*")):
+            if path.is_file():
+                files[path.relative_to(app_dir).as_posix()] = hashlib.sha256(path.read_bytes()).hexdigest()
+        app_dir.joinpath(ZipappBuilder.MANIFEST_FILE_NAME).write_text(
+            json.dumps({**manifest, "files": files}, indent=2), encoding="utf-8")
+
+
+class _NamespaceAwareModuleFinder(ModuleFinder):
+    """`ModuleFinder` that also follows PEP 420 namespace packages (e.g. `google.cloud`), which it fails to load itself"""
+
+    NAMESPACE_PACKAGE = "namespace_package"
+
+    def find_module(self, name, path, parent=None):
+        fullname = f"{parent.__name__}.{name}" if parent is not None else name
+        if fullname not in self.excludes and not (path is None and name in sys.builtin_module_names):
+            spec = importlib.machinery.PathFinder.find_spec(name, path if path is not None else self.path)
+            if spec is not None and spec.origin in (None, "namespace") and spec.submodule_search_locations is not None:
+                return None, list(spec.submodule_search_locations), ("", "", self.NAMESPACE_PACKAGE)
+        return super().find_module(name, path, parent)
+
+    def load_module(self, fqname, fp, pathname, file_info):
+        if file_info[2] == self.NAMESPACE_PACKAGE:
+            module = self.add_module(fqname)
+            module.__path__ = pathname
+            return module
+        return super().load_module(fqname, fp, pathname, file_info)
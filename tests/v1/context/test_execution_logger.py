@@ -0,0 +1,100 @@
+import logging
+import queue
+import shutil
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+from qubership_pipelines_common_library.v1.execution.exec_logger import ExecutionLogger, _BoundedQueueHandler
+from tests.v2.profiling.test_command_profiler import SampleProfiledCommand
+
+
+class TestExecutionLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.path_logs = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        ExecutionLogger.configure(None)
+        ExecutionLogger.close_all()
+        shutil.rmtree(self.path_logs, ignore_errors=True)
+
+    def _root_handlers_count(self) -> int:
+        return len(logging.getLogger().handlers)
+
+    def test_sync_logger_detaches_handlers_on_close(self):
+        # given
+        ExecutionLogger.configure(False)
+        root_handlers_count = self._root_handlers_count()
+        execution_logger = ExecutionLogger(self.path_logs)
+        # when
+        execution_logger.info("own record")
+        logging.getLogger("other").warning("other record")
+        execution_logger.close()
+        execution_logger.close()
+        # then
+        self.assertEqual(root_handlers_count, self._root_handlers_count())
+        self.assertEqual([], execution_logger.logger.handlers)
+        self.assertIn("own record", self.path_logs.joinpath(ExecutionLogger.FILE_NAME_EXECUTION).read_text())
+        self.assertNotIn("other record", self.path_logs.joinpath(ExecutionLogger.FILE_NAME_EXECUTION).read_text())
+        self.assertIn("other record", self.path_logs.joinpath(ExecutionLogger.FILE_NAME_FULL).read_text())
+
+    def test_async_logger_writes_records_in_background(self):
+        # given
+        ExecutionLogger.configure(True)
+        root_handlers_count = self._root_handlers_count()
+        execution_logger = ExecutionLogger(self.path_logs)
+        params = {"value": 1}
+        # when
+        execution_logger.info("params: %s", params)
+        params["value"] = 2
+        execution_logger.debug("debug record")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("other").exception("other record")
+        execution_logger.close()
+        # then
+        self.assertEqual(root_handlers_count, self._root_handlers_count())
+        execution_log = self.path_logs.joinpath(ExecutionLogger.FILE_NAME_EXECUTION).read_text()
+        full_log = self.path_logs.joinpath(ExecutionLogger.FILE_NAME_FULL).read_text()
+        self.assertIn("params: {'value': 1}", execution_log)
+        self.assertNotIn("debug record", execution_log)
+        self.assertNotIn("other record", execution_log)
+        self.assertIn("debug record", full_log)
+        self.assertIn("ValueError: boom", full_log)
+
+    def test_full_queue_drops_records(self):
+        handler = _BoundedQueueHandler(queue.Queue(maxsize=1), put_timeout_seconds=0.01)
+        record = logging.makeLogRecord({"msg": "record"})
+        handler.emit(record)
+        handler.emit(record)
+        self.assertEqual(1, handler.dropped)
+
+    def test_dropped_records_warning_is_written_into_log_files(self):
+        # given
+        ExecutionLogger.configure(True)
+        execution_logger = ExecutionLogger(self.path_logs)
+        queue_handler = next(handler for _, handler in execution_logger._attached_handlers)
+        # when
+        queue_handler.dropped = 3
+        execution_logger.close()
+        # then
+        for file_name in (ExecutionLogger.FILE_NAME_EXECUTION, ExecutionLogger.FILE_NAME_FULL):
+            self.assertIn("3 log records were dropped because log queue was full",
+                          self.path_logs.joinpath(file_name).read_text())
+
+    def test_commands_do_not_accumulate_handlers(self):
+        root_handlers_count = self._root_handlers_count()
+        with patch.dict("os.environ", {ExecutionLogger.ASYNC_LOGGING_ENV: "true"}):
+            for _ in range(2):
+                with self.assertRaises(SystemExit):
+                    cmd = SampleProfiledCommand(input_params={"params": {"value": "1"}}, folder_path=str(self.path_logs))
+                    cmd.run()
+        self.assertEqual(root_handlers_count, self._root_handlers_count())
+        self.assertIn("Status: SUCCESS", Path(cmd.context.path_logs).joinpath(ExecutionLogger.FILE_NAME_EXECUTION).read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import unittest
+
+# Modules CLI applications import to register commands, and third-party SDKs they must not pull in at import time
+LIGHT_MODULES = [
+    "qubership_pipelines_common_library.v1.utils.utils_cli",
+    "qubership_pipelines_common_library.v1.gitlab_client",
+    "qubership_pipelines_common_library.v1.jenkins_client",
+    "qubership_pipelines_common_library.v1.github_client",
+    "qubership_pipelines_common_library.v1.kube_client",
+    "qubership_pipelines_common_library.v2.github.github_run_pipeline_command",
+    "qubership_pipelines_common_library.v2.gitlab.gitlab_run_pipeline_command",
+    "qubership_pipelines_common_library.v2.jenkins.jenkins_run_pipeline_command",
+    "qubership_pipelines_common_library.v2.secret_manager.secret_manager",
+    "qubership_pipelines_common_library.v2.secret_manager.providers.multi_store_provider",
+]
+HEAVY_MODULES = ["gitlab", "jenkins", "ghapi", "kubernetes", "boto3", "hvac", "google.cloud", "cryptography"]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Imports module in a fresh interpreter with `-X importtime`, returns cumulative import time (us) of each module"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if line.startswith("import time:") and len(parts) == 3 and parts[1].strip().isdigit():
+            times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_heavy_sdks_are_imported_lazily(self):
+        for module in LIGHT_MODULES:
+            with self.subTest(module=module):
+                times = _import_times(module)
+                self.assertIn(module, times)
+                heavy = [name for name in times if any(name == sdk or name.startswith(f"{sdk}.") for sdk in HEAVY_MODULES)]
+                self.assertEqual([], heavy, f"{module} imports heavy SDK modules at import time")
+
+
+if __name__ == '__main__':
+    unittest.main()
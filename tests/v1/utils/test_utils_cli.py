@@ -2,7 +2,7 @@
 
 from click.testing import CliRunner
 from qubership_pipelines_common_library.v1.execution.exec_logger import ExecutionLogger
-from qubership_pipelines_common_library.v1.utils.utils_cli import utils_cli, DEFAULT_CONTEXT_FILE_PATH
+from qubership_pipelines_common_library.v1.utils.utils_cli import utils_cli, DEFAULT_CONTEXT_FILE_PATH, LazyCommandGroup
 
 
 class TestUtilsCli(unittest.TestCase):
@@ -99,6 +99,38 @@ def test_command(**kwargs):
         self.assertEqual(parsed_result.get("params").get("result"), 23) # from insecure_params
         self.assertEqual(parsed_result.get("kind"), "AtlasModuleParamsSecure") # from secure_params, takes precedence and overwrites insecure value
 
+    def test_profiler_param(self):
+        from qubership_pipelines_common_library.v2.profiling.command_profiler import CommandProfiler
+
+        @click.command()
+        @utils_cli
+        def test_profiler_command(**kwargs):
+            assert CommandProfiler.get_profiler_mode() == CommandProfiler.ProfilerMode.CPROFILE
+
+        try:
+            result = CliRunner().invoke(test_profiler_command, ['--profiler=cprofile'])
+        finally:
+            CommandProfiler.PROFILER_MODE = None
+        self.assertTrue(result.exit_code == 0)
+
+    def test_lazy_command_group(self):
+        @click.group(cls=LazyCommandGroup, lazy_commands={
+            "calc": "tests.v1.context.test_sample_execution_command.SampleExecutionCommand",
+            "missing": "tests.not_existing_module.NotExistingCommand",
+        })
+        def cli():
+            pass
+
+        help_result = CliRunner().invoke(cli, ['--help'])
+        self.assertEqual(0, help_result.exit_code)
+        self.assertIn("calc", help_result.output)
+        self.assertIn("Runs NotExistingCommand", help_result.output)
+
+        result = CliRunner().invoke(cli, ['calc', '-p params.param_1=9', '-p params.param_2=10',
+                                          '--cli-output-mode=INSECURE_PARAMS'])
+        self.assertEqual(19, yaml.safe_load(result.output).get("params").get("result"))
+        self.assertIsInstance(CliRunner().invoke(cli, ['missing']).exception, ImportError)
+
 
 if __name__ == '__main__':
     unittest.main()
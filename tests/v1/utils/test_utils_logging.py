@@ -0,0 +1,50 @@
+import ast
+import logging
+import unittest
+
+from pathlib import Path
+from qubership_pipelines_common_library.v1.utils.utils_logging import LazyLog
+
+PACKAGE_ROOT = Path(__file__).parents[3].joinpath("qubership_pipelines_common_library")
+
+
+def _eager_debug_calls(source: str) -> list[int]:
+    """Returns line numbers of `.debug(...)` calls whose message is formatted before the call"""
+    lines = []
+    for node in ast.walk(ast.parse(source)):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "debug" and node.args):
+            continue
+        message = node.args[0]
+        if (isinstance(message, ast.JoinedStr)
+                or (isinstance(message, ast.BinOp) and isinstance(message.op, ast.Mod))
+                or (isinstance(message, ast.Call) and isinstance(message.func, ast.Attribute) and message.func.attr == "format")):
+            lines.append(node.lineno)
+    return lines
+
+
+class TestUtilsLogging(unittest.TestCase):
+
+    def test_lazy_log_is_evaluated_only_when_record_is_emitted(self):
+        calls = []
+        logger = logging.getLogger("test_lazy_log")
+        logger.setLevel(logging.INFO)
+        logger.debug("value: %s", LazyLog(lambda: calls.append("called") or "value"))
+        self.assertEqual([], calls)
+        with self.assertLogs(logger, logging.INFO) as logs:
+            logger.info("value: %s", LazyLog(lambda: calls.append("called") or "value"))
+        self.assertEqual(["called"], calls)
+        self.assertEqual(["INFO:test_lazy_log:value: value"], logs.output)
+
+    def test_audit_detects_eager_formatting(self):
+        source = 'logger.debug(f"a {b}")\nlogger.debug("a %s" % b)\nlogger.debug("a {}".format(b))\nlogger.debug("a %s", b)\n'
+        self.assertEqual([1, 2, 3], _eager_debug_calls(source))
+
+    def test_debug_messages_are_formatted_lazily(self):
+        violations = [f"{path.relative_to(PACKAGE_ROOT)}:{line}"
+                      for path in sorted(PACKAGE_ROOT.rglob("*.py"))
+                      for line in _eager_debug_calls(path.read_text(encoding="utf-8"))]
+        self.assertEqual([], violations, "Use %-style arguments (or LazyLog) instead of formatting debug messages eagerly")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,12 @@
+import fnmatch
+import time
+
 from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import unquote
 
 import pytest
+import requests
 from unittest.mock import Mock, patch
 
 from qubership_pipelines_common_library.v2.artifacts_finder.artifact_finder import ArtifactFinder
@@ -10,7 +16,9 @@
 from qubership_pipelines_common_library.v2.artifacts_finder.model.artifact_provider import ArtifactProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.model.credentials import Credentials
 from qubership_pipelines_common_library.v2.artifacts_finder.providers.artifactory import ArtifactoryProvider
+from qubership_pipelines_common_library.v2.artifacts_finder.providers.aws_code_artifact import AwsCodeArtifactProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.providers.azure_artifacts import AzureArtifactsProvider
+from qubership_pipelines_common_library.v2.artifacts_finder.providers.composite import CompositeArtifactProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.providers.gcp_artifact_registry import GcpArtifactRegistryProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.providers.nexus import NexusProvider
 from qubership_pipelines_common_library.v2.artifacts_finder.utils.artifact_finder_utils import ArtifactFinderUtils
@@ -79,6 +87,105 @@ def test_credentials_provider_contract(self, boto_client_mock):
         assert credentials.access_key == "test_assumed_access_key"
         assert credentials.secret_key == "test_assumed_secret_key"
 
+    @patch('boto3.client')
+    def test_assumed_role_credentials_are_cached_until_expiry(self, boto_client_mock):
+        from datetime import datetime, timedelta, timezone
+        AwsCredentialsProvider.credentials_cache.clear()
+        sts_client = Mock()
+        boto_client_mock.return_value = sts_client
+        sts_client.assume_role.return_value = {"Credentials": {
+            "AccessKeyId": "assumed_key", "SecretAccessKey": "assumed_secret", "SessionToken": "token",
+            "Expiration": datetime.now(timezone.utc) + timedelta(hours=1),
+        }}
+
+        def provider():
+            return AwsCredentialsProvider().with_assume_role(
+                access_key="cache_test_key", secret_key="secret", region_name="eu-west", role_arn="role")
+
+        first = provider().get_credentials()
+        second = provider().get_credentials()
+        assert first is second
+        assert sts_client.assume_role.call_count == 1
+
+        provider().with_cache(False).get_credentials()
+        assert sts_client.assume_role.call_count == 2
+        AwsCredentialsProvider.credentials_cache.clear()
+
+    def test_credentials_cache_refreshes_in_background_before_expiry(self):
+        import time
+        from datetime import datetime, timedelta, timezone
+        from qubership_pipelines_common_library.v2.artifacts_finder.auth.credentials_cache import CredentialsCache
+        cache = CredentialsCache(refresh_margin_seconds=3600)
+        cache.RETRY_REFRESH_SECONDS = 0.05
+        fetch_count = []
+
+        def fetch():
+            fetch_count.append(1)
+            return Credentials(access_token=f"token-{len(fetch_count)}"), datetime.now(timezone.utc) + timedelta(minutes=30)
+
+        credentials = cache.get_or_fetch(("tenant", {"client_id": "id"}), fetch)
+        assert credentials.access_token == "token-1"
+        observed_tokens = set()
+        deadline = time.monotonic() + 5
+        while len(fetch_count) < 10 and time.monotonic() < deadline:
+            observed_tokens.add(credentials.access_token)  # read without lock, as sessions do
+        cache.clear()
+
+        assert credentials.access_token != "token-1"
+        assert None not in observed_tokens
+        assert cache.get_or_fetch(("tenant", {"client_id": "other"}), fetch) is not credentials
+        cache.clear()
+
+    def test_credentials_cache_stops_refreshing_idle_entries(self):
+        from datetime import datetime, timedelta, timezone
+        from qubership_pipelines_common_library.v2.artifacts_finder.auth.credentials_cache import CredentialsCache
+        cache = CredentialsCache(refresh_margin_seconds=3600, idle_ttl_seconds=0.2)
+        cache.RETRY_REFRESH_SECONDS = 0.05
+        fetch_count = []
+
+        def fetch():
+            fetch_count.append(1)
+            return Credentials(access_token=f"token-{len(fetch_count)}"), datetime.now(timezone.utc) + timedelta(minutes=30)
+
+        credentials = cache.get_or_fetch(("tenant", {"client_id": "idle"}), fetch)
+        time.sleep(0.6)
+        fetches_when_idle = len(fetch_count)
+        time.sleep(0.3)
+        assert len(fetch_count) == fetches_when_idle
+        assert cache.get_current(credentials) is credentials
+        assert len(fetch_count) == fetches_when_idle
+
+        active = cache.get_or_fetch(("tenant", {"client_id": "active"}), fetch)
+        cache.stop_refreshing()
+        fetches_after_stop = len(fetch_count)
+        time.sleep(0.2)
+        assert len(fetch_count) == fetches_after_stop
+        assert cache.get_current(active) is active
+        cache.clear()
+
+    def test_aws_clients_read_credentials_refreshed_by_cache(self):
+        from datetime import datetime, timedelta, timezone
+        AwsCredentialsProvider.credentials_cache.clear()
+        fetch_count = []
+
+        def fetch():
+            fetch_count.append(1)
+            # first credentials are about to expire, so client creation has to get refreshed ones from the cache
+            expiration = datetime.now(timezone.utc) + (timedelta(seconds=30) if len(fetch_count) == 1 else timedelta(hours=1))
+            return Credentials(access_key=f"key-{len(fetch_count)}", secret_key="secret", session_token=f"token-{len(fetch_count)}",
+                               region_name="eu-west-1", expiration=expiration), expiration
+
+        credentials = AwsCredentialsProvider.credentials_cache.get_or_fetch(("aws", "refreshable"), fetch)
+        provider = AwsCodeArtifactProvider(credentials=credentials, domain="domain", repository="repo")
+        frozen = provider._aws_client._request_signer._credentials.get_frozen_credentials()
+
+        assert (frozen.access_key, frozen.token) == ("key-2", "token-2")
+        assert credentials.access_key == "key-2"
+        assert AwsCodeArtifactProvider(credentials=credentials, domain="domain", repository="repo")._aws_client is provider._aws_client
+        assert len(fetch_count) == 2
+        AwsCodeArtifactProvider.clear_cache()
+        AwsCredentialsProvider.credentials_cache.clear()
+
     def test_select_latest_returns_payload_of_greatest_comparable(self):
         comparer = DefaultVersionComparer()
         candidates = [("1.0.0", "url-a"), ("2.0.0", "url-b"), ("1.5.0", "url-c")]
@@ -180,6 +287,7 @@ def side_effect(url, **kwargs):
 
     @patch('requests.sessions.Session.get')
     def test_azure_version_wildcard_search(self, requests_mock):
+        AzureArtifactsProvider.clear_cache()
         org, project, feed_id = "myorg", "myproj", "MYFEEDID"
         versions_url = f"https://feeds.dev.azure.com/{org}/{project}/_apis/packaging/feeds/{feed_id}/packages/PKGID/versions"
 
@@ -258,8 +366,309 @@ def expected_url(version):
         ]
 
         sent_filter = gcp_client.list_files.call_args.kwargs["request"].filter
-        assert sent_filter == f'name="{repo}/files/*test-component-master-*"'
+        assert sent_filter == f'name="{repo}/files/*test-component-master-*-RELEASE.yaml"'
+        assert gcp_client.list_files.call_args.kwargs["request"].page_size == GcpArtifactRegistryProvider.DEFAULT_PAGE_SIZE
 
         latest = finder.find_artifact_urls(artifact_id="test-component", version="master-*-RELEASE",
                                            extension="yaml", latest=True)
         assert latest == [expected_url("master-6.0.0-RELEASE")]
+
+    @patch('boto3.client')
+    def test_aws_version_wildcard_search_paginated(self, boto_client_mock):
+        AwsCodeArtifactProvider.clear_cache()
+        aws_client = Mock()
+        boto_client_mock.return_value = aws_client
+        pages = {
+            "list_packages": [
+                {"packages": [{"namespace": "com.example", "package": "test-component"}]},
+                {"packages": [{"namespace": "org.other", "package": "test-component"},
+                              {"namespace": "org.other", "package": "test-component-ext"}]},
+            ],
+            "list_package_versions": {
+                "com.example": [{"versions": [{"version": "master-5.0.0-RELEASE"}]},
+                                {"versions": [{"version": "master-6.0.0-RELEASE"}, {"version": "dev-1.0.0-RELEASE"}]}],
+                "org.other": [{"versions": [{"version": "master-5.5.0-RELEASE"}]}],
+            },
+        }
+
+        def get_paginator(operation):
+            paginator = Mock()
+            if operation == "list_packages":
+                paginator.paginate.side_effect = lambda **kwargs: pages["list_packages"]
+            elif operation == "list_package_versions":
+                paginator.paginate.side_effect = lambda **kwargs: pages["list_package_versions"][kwargs["namespace"]]
+            else:
+                paginator.paginate.side_effect = lambda **kwargs: [{
+                    "namespace": kwargs["namespace"], "package": kwargs["package"], "version": kwargs["packageVersion"],
+                    "assets": [{"name": f"test-component-{kwargs['packageVersion']}.yaml"}, {"name": "test-component.pom"}],
+                }]
+            return paginator
+
+        aws_client.get_paginator.side_effect = get_paginator
+        credentials = Credentials(access_key="key", secret_key="secret", region_name="eu-west")
+        finder = ArtifactFinder(artifact_provider=AwsCodeArtifactProvider(
+            credentials=credentials, domain="domain", repository="repo", max_workers=4))
+
+        urls = finder.find_artifact_urls(artifact_id="test-component", version="master-*-RELEASE", extension="yaml")
+        assert urls == [
+            "com.example/test-component/master-5.0.0-RELEASE/test-component-master-5.0.0-RELEASE.yaml",
+            "com.example/test-component/master-6.0.0-RELEASE/test-component-master-6.0.0-RELEASE.yaml",
+            "org.other/test-component/master-5.5.0-RELEASE/test-component-master-5.5.0-RELEASE.yaml",
+        ]
+
+        latest = finder.find_artifact_urls(artifact_id="test-component", version="master-*-RELEASE",
+                                           extension="yaml", latest=True)
+        assert latest == ["com.example/test-component/master-6.0.0-RELEASE/test-component-master-6.0.0-RELEASE.yaml"]
+
+        AwsCodeArtifactProvider(credentials=credentials, domain="domain", repository="other-repo")
+        assert boto_client_mock.call_count == 1
+        AwsCodeArtifactProvider.clear_cache()
+
+    @patch('google.cloud.artifactregistry_v1.ArtifactRegistryClient')
+    def test_gcp_latest_via_versions_api(self, gcp_client_cls):
+        from types import SimpleNamespace
+        repo = "projects/proj/locations/us/repositories/repo"
+        package = f"{repo}/packages/com.example:test-component"
+        gcp_client = Mock()
+        gcp_client_cls.return_value = gcp_client
+        gcp_client.list_versions.return_value = [
+            SimpleNamespace(name=f"{package}/versions/master-7.0.0-DEV"),
+            SimpleNamespace(name=f"{package}/versions/master-6.0.0-RELEASE"),
+            SimpleNamespace(name=f"{package}/versions/master-5.0.0-RELEASE"),
+        ]
+        encoded = "com%2Fexample%2Ftest-component%2Fmaster-6.0.0-RELEASE%2Ftest-component-master-6.0.0-RELEASE.yaml"
+        gcp_client.list_files.return_value = [SimpleNamespace(name=f"{repo}/files/{encoded}")]
+
+        finder = ArtifactFinder(artifact_provider=GcpArtifactRegistryProvider(
+            credentials=Credentials(google_credentials_object=Mock(), authorized_session=Mock()),
+            project="proj", region_name="us", repository="repo", use_versions_api=True))
+
+        latest = finder.find_artifact_urls(group_id="com.example", artifact_id="test-component",
+                                           version="master-*-RELEASE", extension="yaml", latest=True)
+        assert latest == [f"https://artifactregistry.googleapis.com/download/v1/{repo}/files/{encoded}:download?alt=media"]
+
+        versions_request = gcp_client.list_versions.call_args.kwargs["request"]
+        assert versions_request.parent == package
+        assert versions_request.order_by == "create_time desc"
+        assert gcp_client.list_files.call_count == 1
+        assert gcp_client.list_files.call_args.kwargs["request"].filter == \
+            f'name="{repo}/files/*test-component-master-6.0.0-RELEASE.yaml"'
+
+    @patch('google.cloud.artifactregistry_v1.ArtifactRegistryClient')
+    def test_gcp_wildcard_filter_benchmark(self, gcp_client_cls):
+        # Local stand-in for GAR list_files pager: applies name filter server-side and serves results page by page
+        repo = "projects/proj/locations/us/repositories/repo"
+        all_files = [
+            SimpleNamespace(name=f"{repo}/files/com%2Fexample%2Ftest-component%2F{v}%2Ftest-component-{v}.{ext}")
+            for major in range(50) for minor in range(20)
+            for v in (f"master-{major}.{minor}.0-RELEASE", f"master-{major}.{minor}.0-DEV")
+            for ext in ("yaml", "json", "pom")
+        ]
+        pages_served = []
+
+        def list_files(request):
+            name_filter = request.filter.removeprefix('name="').removesuffix('"')
+            matched = [f for f in all_files if fnmatch.fnmatchcase(unquote(f.name), name_filter)]
+            for start in range(0, len(matched), request.page_size):
+                pages_served.append(request.filter)
+                yield from matched[start:start + request.page_size]
+
+        gcp_client = Mock()
+        gcp_client_cls.return_value = gcp_client
+        gcp_client.list_files.side_effect = list_files
+        provider = GcpArtifactRegistryProvider(
+            credentials=Credentials(google_credentials_object=Mock(), authorized_session=Mock()),
+            project="proj", region_name="us", repository="repo", page_size=100)
+        artifact = Artifact(artifact_id="test-component", version="master-*-RELEASE", extension="yaml")
+
+        urls = provider.search_artifacts(artifact)
+        narrow_pages = len(pages_served)
+
+        pages_served.clear()
+        broad_files = list(list_files(SimpleNamespace(filter=f'name="{repo}/files/*test-component-master-*"', page_size=100)))
+        broad_pages = len(pages_served)
+
+        assert len(urls) == 1000
+        assert gcp_client.list_files.call_count == 1
+        assert narrow_pages == 10
+        assert len(broad_files) == 6000
+        assert broad_pages == 60
+
+    @patch('requests.sessions.Session.get')
+    def test_azure_versions_listed_concurrently_and_cached(self, requests_mock):
+        AzureArtifactsProvider.clear_cache()
+        org, project, feed_id = "myorg", "myproj", "MYFEEDID"
+        feed_url = f"https://feeds.dev.azure.com/{org}/{project}/_apis/packaging/feeds/{feed_id}"
+        group_versions = {"com.example": "master-5.0.0-RELEASE", "org.other": "master-7.0.0-RELEASE",
+                          "net.third": "master-6.0.0-RELEASE"}
+        groups = list(group_versions)
+
+        def version_entry(group, v):
+            return {
+                "version": v,
+                "protocolMetadata": {"data": {"version": v, "groupId": group, "artifactId": "test-component"}},
+                "files": [{"name": f"test-component-{v}.yaml"}],
+            }
+
+        versions_calls = []
+
+        def side_effect(url, **kwargs):
+            mock_resp = Mock()
+            mock_resp.status_code = 200
+            if url.endswith("/versions"):
+                versions_calls.append(url)
+                group = url.split("/")[-2]
+                mock_resp.json.return_value = {"value": [version_entry(group, group_versions[group])]}
+                assert kwargs["params"]["includeUrls"] == "false"
+            else:
+                mock_resp.json.return_value = {"value": [{"_links": {
+                    "versions": {"href": f"{feed_url}/packages/{group}/versions"},
+                    "feed": {"href": feed_url},
+                }} for group in groups]}
+            return mock_resp
+
+        requests_mock.side_effect = side_effect
+        finder = ArtifactFinder(artifact_provider=AzureArtifactsProvider(
+            credentials=Credentials(access_token="token"), organization=org, project=project, feed="myfeed",
+            max_workers=3))
+
+        urls = finder.find_artifact_urls(artifact_id="test-component", version="master-*-RELEASE", extension="yaml")
+        assert [url.split("/maven/")[1].split("/")[0] for url in urls] == groups
+        assert len(versions_calls) == 3
+
+        latest = finder.find_artifact_urls(artifact_id="test-component", version="master-*-RELEASE",
+                                           extension="yaml", latest=True)
+        assert len(latest) == 1 and "/org.other/" in latest[0]
+        assert len(versions_calls) == 3
+
+        # other credentials don't see cached versions, expired entries are dropped
+        other_finder = ArtifactFinder(artifact_provider=AzureArtifactsProvider(
+            credentials=Credentials(access_token="other-token"), organization=org, project=project, feed="myfeed",
+            cache_ttl_seconds=0.05))
+        other_finder.find_artifact_urls(artifact_id="test-component", version="master-*-RELEASE", extension="yaml")
+        assert len(versions_calls) == 6
+        time.sleep(0.1)
+        finder.find_artifact_urls(artifact_id="test-component", version="master-*-RELEASE", extension="yaml")
+        assert len(versions_calls) == 6
+        assert len(AzureArtifactsProvider._versions_cache) == 3
+        AzureArtifactsProvider.clear_cache()
+
+    @staticmethod
+    def _mock_provider(name, urls=None, delay=0.0, error=None):
+        def search_artifacts(**kwargs):
+            time.sleep(delay)
+            if error:
+                raise error
+            return urls or []
+
+        provider = Mock(spec=ArtifactProvider)
+        provider.get_provider_name.return_value = name
+        provider.search_artifacts.side_effect = search_artifacts
+        return provider
+
+    def test_composite_first_success_returns_fastest_and_downloads_via_owner(self, tmp_path):
+        slow = self._mock_provider("slow", urls=["slow_url"], delay=0.5)
+        fast = self._mock_provider("fast", urls=["fast_url"])
+        finder = ArtifactFinder(artifact_provider=CompositeArtifactProvider(providers=[slow, fast]))
+
+        assert finder.find_artifact_urls(artifact_id="test-component", version="1.0.0") == ["fast_url"]
+
+        finder.download_artifact("fast_url", tmp_path / "file.jar")
+        fast.download_artifact.assert_called_once()
+        slow.download_artifact.assert_not_called()
+
+    def test_composite_downloads_direct_url_only_with_provider_of_its_registry(self, tmp_path):
+        nexus = NexusProvider(registry_url="https://nexus.example.com/repository/maven", username="user", password="pass")
+        artifactory = ArtifactoryProvider(registry_url="https://artifactory.example.com/artifactory", username="user", password="pass")
+        azure = AzureArtifactsProvider(credentials=Credentials(access_token="token"), organization="myorg", project="proj", feed="feed")
+        composite = CompositeArtifactProvider(providers=[nexus, artifactory, azure])
+        with patch.object(NexusProvider, "generic_download") as nexus_download, \
+                patch.object(ArtifactoryProvider, "generic_download") as artifactory_download, \
+                patch.object(AzureArtifactsProvider, "generic_download") as azure_download:
+            composite.download_artifact("https://artifactory.example.com/artifactory/libs/app-1.0.jar", tmp_path / "app.jar")
+            artifactory_download.assert_called_once()
+
+            with pytest.raises(Exception, match="does not belong to registry of any configured provider"):
+                composite.download_artifact("https://attacker.example.org/app-1.0.jar", tmp_path / "app.jar")
+            with pytest.raises(Exception, match="does not belong"):
+                composite.download_artifact("https://pkgs.dev.azure.com/otherorg/_apis/packaging/app.jar", tmp_path / "app.jar")
+            nexus_download.assert_not_called()
+            azure_download.assert_not_called()
+            assert artifactory_download.call_count == 1
+
+    def test_composite_priority_and_merge_all(self):
+        primary = self._mock_provider("primary", urls=["primary_url", "shared_url"], delay=0.2)
+        secondary = self._mock_provider("secondary", urls=["shared_url", "secondary_url"])
+        artifact = Artifact(artifact_id="test-component", version="1.0.0")
+
+        priority = CompositeArtifactProvider(providers=[primary, secondary], strategy="priority")
+        assert priority.search_artifacts(artifact=artifact) == ["primary_url", "shared_url"]
+
+        merge_all = CompositeArtifactProvider(providers=[primary, secondary], strategy="MERGE_ALL")
+        assert merge_all.search_artifacts(artifact=artifact) == ["primary_url", "shared_url", "secondary_url"]
+
+    def test_composite_merge_all_selects_latest_across_providers(self):
+        nexus = self._mock_provider("nexus", urls=[
+            "https://nexus.example.com/repository/maven/org/test-component/1.9.0/test-component-1.9.0.jar"])
+        azure_url = ("https://pkgs.dev.azure.com/org/proj/_apis/packaging/feeds/feed/maven/org/test-component/1.10.0/"
+                     "test-component-1.10.0.jar/content?api-version=7.1-preview.1")
+        azure = self._mock_provider("azure", urls=[azure_url])
+        gcp = self._mock_provider("gcp", urls=[
+            "https://artifactregistry.googleapis.com/download/v1/projects/p/locations/l/repositories/r/files/"
+            "org%2Ftest-component%2F1.2.0%2Ftest-component-1.2.0.jar:download?alt=media"])
+        finder = ArtifactFinder(artifact_provider=CompositeArtifactProvider(providers=[nexus, azure, gcp], strategy="MERGE_ALL"))
+
+        assert finder.find_artifact_urls(artifact_id="test-component", version="1.*", latest=True) == [azure_url]
+        assert len(finder.find_artifact_urls(artifact_id="test-component", version="1.*")) == 3
+
+    def test_composite_demotes_failing_and_timed_out_providers(self):
+        failing = self._mock_provider("failing", error=Exception("503 Service Unavailable"))
+        hanging = self._mock_provider("hanging", urls=["hanging_url"], delay=0.5)
+        healthy = self._mock_provider("healthy", urls=["healthy_url"], delay=0.05)
+        composite = CompositeArtifactProvider(providers=[failing, hanging, healthy], strategy="PRIORITY",
+                                              provider_timeout_seconds=0.2, max_failures=2)
+        artifact = Artifact(artifact_id="test-component", version="1.0.0")
+
+        for _ in range(2):
+            assert composite.search_artifacts(artifact=artifact) == ["healthy_url"]
+        assert composite.get_health(failing).demoted_until > 0
+        assert composite.get_health(hanging).demoted_until > 0
+        assert composite.get_health(healthy).failures == 0
+
+        failing.search_artifacts.reset_mock()
+        assert composite.search_artifacts(artifact=artifact) == ["healthy_url"]
+        failing.search_artifacts.assert_not_called()
+
+    def test_finder_for_command_builds_composite_for_multiple_providers(self):
+        cmd = Mock()
+        cmd.timeout_seconds, cmd.verify = 30, True
+        cmd.context.input_param_get.return_value = {
+            "nexus": {"registry_url": "https://mock.nexus.url"},
+            "artifactory": {"registry_url": "https://mock.artifactory.url"},
+            "fanout": {"strategy": "PRIORITY", "priority": ["artifactory"], "provider_timeout_seconds": 10},
+        }
+        finder = ArtifactFinderUtils.create_artifact_finder_for_command(cmd)
+
+        assert isinstance(finder.provider, CompositeArtifactProvider)
+        assert finder.provider.strategy is CompositeArtifactProvider.Strategy.PRIORITY
+        assert [type(p) for p in finder.provider.providers] == [ArtifactoryProvider, NexusProvider]
+
+    def test_finder_for_command_skips_only_unavailable_providers(self):
+        cmd = Mock()
+        cmd.timeout_seconds, cmd.verify = 30, True
+        cmd.context.input_param_get.return_value = {
+            "nexus": {"registry_url": "https://mock.nexus.url"},
+            "azure": {"auth_type": "OAUTH2", "organization": "org", "project": "proj", "feed": "feed", "tenant_id": "tenant",
+                      "client_id": "client", "client_secret": "secret", "target_resource": "resource"},
+        }
+        with patch("requests.post", side_effect=requests.exceptions.ConnectionError("Connection refused")):
+            finder = ArtifactFinderUtils.create_artifact_finder_for_command(cmd)
+        assert [type(p) for p in finder.provider.providers] == [NexusProvider]
+
+        del cmd.context.input_param_get.return_value["azure"]["client_secret"]
+        with pytest.raises(Exception, match="Missing fields: \\['client_secret'\\]"):
+            ArtifactFinderUtils.create_artifact_finder_for_command(cmd)
+
+        cmd.context.input_param_get.return_value["azure"]["auth_type"] = "PASSWORD"
+        with pytest.raises(Exception, match="Unsupported auth type for Azure"):
+            ArtifactFinderUtils.create_artifact_finder_for_command(cmd)
@@ -0,0 +1,41 @@
+import json
+import os
+import stat
+import sys
+
+from pathlib import Path
+
+import pytest
+
+FAKE_PODMAN = Path(__file__).parent / "fake_podman.py"
+
+
+class FakePodman:
+
+    def __init__(self, state_dir: Path):
+        self.state_dir = state_dir
+
+    def container_root(self, name: str) -> Path:
+        return self.state_dir / "containers" / name
+
+    def calls(self, command: str = None) -> list[list[str]]:
+        log_path = self.state_dir / "calls.log"
+        if not log_path.exists():
+            return []
+        calls = [json.loads(line) for line in log_path.read_text().splitlines()]
+        return [call for call in calls if command is None or call[0] == command]
+
+
+@pytest.fixture
+def fake_podman(tmp_path_factory, monkeypatch):
+    """Puts `podman` executable emulating containers with local folders first on PATH"""
+    fake_podman_dir = tmp_path_factory.mktemp("fake_podman")  # tmp_path itself is cleared by commands using it as folder_path
+    bin_dir = fake_podman_dir / "bin"
+    bin_dir.mkdir()
+    executable = bin_dir / "podman"
+    executable.write_text(f"#!/bin/sh\nexec \"{sys.executable}\" \"{FAKE_PODMAN}\" \"$@\"\n")
+    executable.chmod(executable.stat().st_mode | stat.S_IEXEC)
+    state_dir = fake_podman_dir / "state"
+    monkeypatch.setenv("FAKE_PODMAN_STATE", str(state_dir))
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    return FakePodman(state_dir)
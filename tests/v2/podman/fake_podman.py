@@ -0,0 +1,141 @@
+"""
+Minimal stand-in for `podman` CLI used in tests: "containers" are folders in `FAKE_PODMAN_STATE`, and container command
+is executed on host inside that folder (with `CONTAINER_ROOT` env var pointing to it). Each call is appended to `calls.log`
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+
+from pathlib import Path
+
+STATE = Path(os.environ["FAKE_PODMAN_STATE"])
+VALUE_FLAGS = {"--name", "--workdir", "--env", "--env-file", "--mount", "--entrypoint", "--label"}
+
+
+def container_root(name: str) -> Path:
+    return STATE / "containers" / name
+
+
+def parse_run_args(args: list[str]) -> tuple[dict, str, list[str]]:
+    options = {"env": [], "env_file": [], "mount": [], "label": []}
+    i = 0
+    while i < len(args) and args[i].startswith("-"):
+        flag = args[i]
+        if flag in VALUE_FLAGS:
+            key = flag.lstrip("-").replace("-", "_")
+            if key in ("env", "env_file", "mount", "label"):
+                options[key].append(args[i + 1])
+            else:
+                options[key] = args[i + 1]
+            i += 2
+        else:
+            options[flag.lstrip("-")] = True
+            i += 1
+    return options, args[i], args[i + 1:]
+
+
+def env_file_args(env_files: list[str]) -> list[str]:
+    return [line for env_file in env_files for line in Path(env_file).read_text().splitlines() if "=" in line]
+
+
+def run_in_container(name: str, command: list[str], env_args: list[str] = ()) -> int:
+    root = container_root(name)
+    env = {**os.environ, "CONTAINER_ROOT": str(root), "CONTAINER_NAME": name}
+    for env_arg in env_args:
+        if "=" in env_arg:
+            key, value = env_arg.split("=", 1)
+            env[key] = value
+    if not command:
+        return 0
+    return subprocess.run(command, cwd=root, env=env).returncode
+
+
+def container_path(name: str, path: str) -> Path:
+    return container_root(name) / path.lstrip("/")
+
+
+def main(args: list[str]) -> int:
+    STATE.mkdir(parents=True, exist_ok=True)
+    with open(STATE / "calls.log", "a") as log:
+        log.write(json.dumps(args) + "\n")
+    command = args[0]
+    if command == "--version":
+        print("podman version 5.0.0-fake")
+        return 0
+    if command == "pull":
+        image = args[-1]
+        if "missing" in image:
+            print(f"Error: {image}: image not known", file=sys.stderr)
+            return 125
+        print("sha256:" + "a" * 64)
+        return 0
+    if command == "image" and args[1] == "inspect":
+        image = args[-1]
+        if "missing" in image:
+            return 125
+        print(f"{image.split('@')[0].split(':')[0]}@sha256:" + "a" * 64)
+        return 0
+    if command == "container" and args[1] == "inspect":
+        name = args[-1]
+        if not container_root(name).exists():
+            print(f"Error: no such container {name}", file=sys.stderr)
+            return 125
+        labels = dict(label.split("=", 1) for label in json.loads((STATE / "containers" / f"{name}.json").read_text())["options"]["label"])
+        # supports only formats used by PodmanRunImage: running state, optionally followed by value of a label
+        label_key = args[args.index("--format") + 1].partition('index .Config.Labels "')[2].partition('"')[0]
+        print("true" + (f" {labels.get(label_key, '<no value>')}" if label_key else ""))
+        return 0
+    if command == "run":
+        options, image, container_command = parse_run_args(args[1:])
+        for mount in options["mount"]:
+            source = dict(part.split("=", 1) for part in mount.split(","))["source"]
+            if not Path(source).exists():
+                print(f"Error: statfs {Path(source).absolute()}: no such file or directory", file=sys.stderr)
+                return 125
+        name = options["name"]
+        root = container_root(name)
+        root.mkdir(parents=True, exist_ok=True)
+        (STATE / "containers" / f"{name}.json").write_text(json.dumps({"image": image, "options": options}))
+        if options.get("d") or options.get("detach"):
+            print(name)
+            return 0
+        return run_in_container(name, container_command, env_file_args(options["env_file"]) + options["env"])
+    if command == "exec":
+        options, name, container_command = parse_run_args(args[1:])
+        if not container_root(name).exists():
+            print(f"Error: no container with name or ID \"{name}\" found", file=sys.stderr)
+            return 125
+        return run_in_container(name, container_command, env_file_args(options["env_file"]) + options["env"])
+    if command == "cp":
+        source, target = args[-2], args[-1]
+        name, path = source.split(":", 1)
+        source_path = container_path(name, path)
+        if not source_path.exists():
+            print(f"Error: \"{path}\" could not be found on container {name}", file=sys.stderr)
+            return 125
+        if target == "-":
+            with tarfile.open(fileobj=sys.stdout.buffer, mode="w|") as archive:
+                archive.add(source_path, arcname=source_path.name)
+            return 0
+        target_path = Path(target)
+        if target_path.is_dir():
+            target_path = target_path / source_path.name
+        if source_path.is_dir():
+            shutil.copytree(source_path, target_path, dirs_exist_ok=True)
+        else:
+            shutil.copy2(source_path, target_path)
+        return 0
+    if command == "rm":
+        name = args[-1]
+        shutil.rmtree(container_root(name), ignore_errors=True)
+        (STATE / "containers" / f"{name}.json").unlink(missing_ok=True)
+        return 0
+    print(f"Error: unsupported fake command {args}", file=sys.stderr)
+    return 125
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,3 +1,9 @@
+import logging
+import sys
+import time
+
+from pathlib import Path
+
 import pytest
 from qubership_pipelines_common_library.v2.podman.podman_command import PodmanRunImage
 
@@ -19,3 +25,162 @@ def test_podman_run_fails_without_binaries(self, caplog, tmp_path):
 
         assert exit_result.value.code == 1
         assert "StatusCode: 404" in caplog.text
+
+    def test_podman_run_streams_output(self, fake_podman, caplog, tmp_path):
+        # given
+        script = "import sys; [print(f'line {i}') for i in range(5000)]; print('warning', file=sys.stderr)"
+        input_params = {'params': {'image': 'python:3.11', 'command': f'"{sys.executable}" -c "{script}"',
+                                   'execution_config': {'stream_output': True, 'stdout_tail_lines': 3,
+                                                        'save_stdout_to_params': True}}}
+        # when
+        with caplog.at_level(logging.DEBUG), pytest.raises(SystemExit) as exit_result:
+            cmd = PodmanRunImage(folder_path=str(tmp_path), input_params=input_params)
+            cmd.run()
+        # then
+        assert exit_result.value.code == 0
+        assert cmd.context.output_params.get("params.stdout") == "line 4997\nline 4998\nline 4999\n"
+        assert cmd.context.output_params.get("params.stderr") == "warning\n"
+        stdout_file = Path(cmd.context.input_param_get("paths.output.files"), "container_stdout.txt")
+        assert len(stdout_file.read_text().splitlines()) == 5000
+        assert "[stdout] line 4999" in caplog.text
+        assert "[stderr] warning" in caplog.text
+        assert not fake_podman.container_root(cmd.container_name).exists()
+
+    def test_podman_run_removes_pass_via_file_env_file(self, fake_podman, tmp_path):
+        script = "import os; print(os.environ['TOKEN'])"
+        input_params = {'params': {'image': 'python:3.11', 'command': f'"{sys.executable}" -c "{script}"',
+                                   'execution_config': {'save_stdout_to_params': True},
+                                   'before_script': {'env_vars': {'pass_via_file': {'TOKEN': 'secret'}}}}}
+        with pytest.raises(SystemExit) as exit_result:
+            cmd = PodmanRunImage(folder_path=str(tmp_path), input_params=input_params)
+            cmd.run()
+        assert exit_result.value.code == 0
+        assert cmd.context.output_params.get("params.stdout") == "secret\n"
+        assert not list(cmd.context_dir_path.glob("temp/*.env"))
+
+    def test_podman_run_streaming_timeout_kills_process(self, fake_podman, tmp_path):
+        input_params = {'params': {'image': 'python:3.11', 'command': f'"{sys.executable}" -c "import time; time.sleep(30)"',
+                                   'execution_config': {'stream_output': True, 'timeout': 0.5}}}
+        started_at = time.perf_counter()
+        with pytest.raises(SystemExit) as exit_result:
+            PodmanRunImage(folder_path=str(tmp_path), input_params=input_params).run()
+        assert exit_result.value.code == 1
+        assert time.perf_counter() - started_at < 10
+
+    def test_podman_run_bulk_copy(self, fake_podman, caplog, tmp_path):
+        # given
+        script = ("import os, pathlib; root = pathlib.Path(os.environ['CONTAINER_ROOT']); "
+                  "(root / 'WORK/state/logs').mkdir(parents=True); (root / 'OTHER').mkdir(); "
+                  "(root / 'WORK/state/result.json').write_text('{\\\"status\\\": \\\"ok\\\"}'); "
+                  "(root / 'WORK/state/logs/run.log').write_text('log'); (root / 'WORK/skipped.txt').write_text('skipped'); "
+                  "(root / 'OTHER/report.txt').write_text('report'); "
+                  "os.link(root / 'WORK/state/logs/run.log', root / 'WORK/state/logs/linked.log'); "
+                  "os.link(root / 'WORK/skipped.txt', root / 'WORK/state_link.txt')")
+        input_params = {'params': {'image': 'python:3.11', 'command': f'"{sys.executable}" -c "{script}"',
+                                   'execution_config': {'bulk_copy': True},
+                                   'after_script': {
+                                       'copy_files_to_host': {'output/state': '/WORK/state',
+                                                              'output/run.log': '/WORK/state/logs/run.log',
+                                                              'output/report.txt': '/OTHER/report.txt',
+                                                              'output/missing.txt': '/WORK/missing.txt',
+                                                              'output/state_link.txt': '/WORK/state_link.txt'},
+                                       'extract_params_from_files': {'/WORK/state/result.json': 'result'}}}}
+        # when
+        with pytest.raises(SystemExit) as exit_result:
+            cmd = PodmanRunImage(folder_path=str(tmp_path), input_params=input_params)
+            cmd.run()
+        # then
+        assert exit_result.value.code == 0
+        output_dir = cmd.context_dir_path.joinpath("output")
+        assert output_dir.joinpath("state", "result.json").read_text() == '{"status": "ok"}'
+        assert output_dir.joinpath("state", "logs", "run.log").read_text() == "log"
+        assert output_dir.joinpath("run.log").read_text() == "log"
+        assert output_dir.joinpath("state", "logs", "linked.log").read_text() == "log"
+        assert output_dir.joinpath("report.txt").read_text() == "report"
+        assert not output_dir.joinpath("skipped.txt").exists()
+        assert cmd.context.output_params.get("params.extracted_output.result") == {"status": "ok"}
+        assert "Failed to copy /WORK/missing.txt to output/missing.txt" in caplog.text
+        assert ("Failed to copy /WORK/state_link.txt to output/state_link.txt: "
+                "/WORK/state_link.txt is a hard link to /WORK/skipped.txt, which is not copied") in caplog.text
+        assert not output_dir.joinpath("state_link.txt").exists()
+        assert sorted(call[1:] for call in fake_podman.calls("cp")) == [
+            [f"{cmd.container_name}:/OTHER/report.txt", str(output_dir.joinpath("report.txt"))],
+            [f"{cmd.container_name}:/WORK", "-"],
+        ]
+
+    def test_podman_run_pre_pull_pins_image_digest_once(self, fake_podman, monkeypatch, tmp_path):
+        # given
+        monkeypatch.setattr(PodmanRunImage, "_pinned_images", {})
+        input_params = {'params': {'image': 'python:3.11', 'command': f'"{sys.executable}" -c "print(1)"',
+                                   'execution_config': {'pre_pull': True}}}
+        # when
+        for i in range(2):
+            with pytest.raises(SystemExit) as exit_result:
+                cmd = PodmanRunImage(folder_path=str(tmp_path.joinpath(str(i))), input_params=input_params)
+                cmd.run()
+            assert exit_result.value.code == 0
+        # then
+        pinned_image = "python@sha256:" + "a" * 64
+        assert cmd.context.output_params.get("params.pinned_image") == pinned_image
+        assert len(fake_podman.calls("pull")) == 1
+        run_calls = fake_podman.calls("run")
+        assert len(run_calls) == 2
+        assert all("--pull=never" in call and pinned_image in call for call in run_calls)
+
+    def test_podman_run_pre_pull_fails_for_missing_image(self, fake_podman, monkeypatch, caplog, tmp_path):
+        monkeypatch.setattr(PodmanRunImage, "_pinned_images", {})
+        input_params = {'params': {'image': 'missing:latest', 'execution_config': {'pre_pull': True}}}
+        with pytest.raises(SystemExit) as exit_result:
+            PodmanRunImage(folder_path=str(tmp_path), input_params=input_params).run()
+        assert exit_result.value.code == 1
+        assert "Failed to pull image missing:latest" in caplog.text
+        assert not fake_podman.calls("run")
+
+    def test_podman_run_reuses_warm_container(self, fake_podman, tmp_path):
+        # given
+        script = "import pathlib; state = pathlib.Path('state.txt'); state.write_text(state.read_text() + 'x' if state.exists() else 'x'); print(state.read_text())"
+        outputs = []
+        # when
+        for i, stop in enumerate([False, False, True]):
+            input_params = {'params': {'image': 'python:3.11', 'command': f'"{sys.executable}" -c "{script}"',
+                                       'execution_config': {'warm_container': 'warm_test', 'stop_warm_container': stop,
+                                                            'save_stdout_to_params': True},
+                                       'before_script': {'env_vars': {'pass_via_file': {'TOKEN': 'secret'}}}}}
+            with pytest.raises(SystemExit) as exit_result:
+                cmd = PodmanRunImage(folder_path=str(tmp_path.joinpath(str(i))), input_params=input_params)
+                cmd.run()
+            assert exit_result.value.code == 0
+            assert not list(cmd.context_dir_path.glob("temp/*.env"))
+            outputs.append(cmd.context.output_params.get("params.stdout"))
+        # then
+        assert outputs == ["x\n", "xx\n", "xxx\n"]
+        run_calls = fake_podman.calls("run")
+        assert len(run_calls) == 1
+        assert run_calls[0][-2:] == ["python:3.11", "3600"]
+        assert run_calls[0][run_calls[0].index("--entrypoint") + 1] == "sleep"
+        assert len(fake_podman.calls("exec")) == 3
+        assert len(fake_podman.calls("rm")) == 1
+        assert not fake_podman.container_root("warm_test").exists()
+
+    def test_podman_run_recreates_mismatched_warm_container_and_removes_it_on_failure(self, fake_podman, caplog, tmp_path):
+        # given
+        def run_in_warm_container(i, image, exit_code=0):
+            input_params = {'params': {'image': image, 'command': f'"{sys.executable}" -c "import sys; sys.exit({exit_code})"',
+                                       'execution_config': {'warm_container': 'warm_test', 'warm_container_ttl': 60}}}
+            with pytest.raises(SystemExit) as exit_result:
+                PodmanRunImage(folder_path=str(tmp_path.joinpath(str(i))), input_params=input_params).run()
+            return exit_result.value.code
+        # when
+        assert run_in_warm_container(0, 'python:3.11') == 0
+        assert run_in_warm_container(1, 'python:3.12') == 0
+        # then
+        run_calls = fake_podman.calls("run")
+        assert [call[-2:] for call in run_calls] == [["python:3.11", "60"], ["python:3.12", "60"]]
+        assert "--rm" in run_calls[0]
+        assert "was started with different image" in caplog.text
+        assert fake_podman.container_root("warm_test").exists()
+        # when
+        assert run_in_warm_container(2, 'python:3.12', exit_code=1) == 1
+        # then
+        assert len(fake_podman.calls("run")) == 2
+        assert not fake_podman.container_root("warm_test").exists()
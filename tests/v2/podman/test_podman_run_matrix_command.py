@@ -0,0 +1,77 @@
+import json
+import sys
+
+import pytest
+from qubership_pipelines_common_library.v2.podman.podman_run_matrix_command import PodmanRunMatrix
+
+ENTRY_SCRIPT = ("import json, os, pathlib, sys, time; started = time.time(); time.sleep(0.3); "
+                "pathlib.Path(os.environ['CONTAINER_ROOT'], 'result.json').write_text(json.dumps({'suite': os.environ['SUITE']})); "
+                "pathlib.Path(os.environ['TIMINGS_DIR'], os.environ['SUITE']).write_text(f'{started} {time.time()}'); "
+                "print('suite', os.environ['SUITE']); sys.exit(int(os.environ.get('EXIT_CODE', '0')))")
+
+
+def _entry(suite: str, exit_code: int = 0) -> dict:
+    return {'name': suite, 'before_script': {'env_vars': {'explicit': {'SUITE': suite, 'EXIT_CODE': exit_code}}}}
+
+
+class TestPodmanRunMatrix:
+
+    @pytest.fixture
+    def input_params(self, tmp_path_factory):
+        self.timings_dir = tmp_path_factory.mktemp("timings")
+        return {'params': {
+            'image': 'python:3.11',
+            'command': f'"{sys.executable}" -c "{ENTRY_SCRIPT}"',
+            'execution_config': {'max_parallel': 2, 'save_stdout_to_params': True},
+            'before_script': {'mounts': {'mounted/{name}': '/WORK'},
+                              'env_vars': {'explicit': {'TIMINGS_DIR': str(self.timings_dir)},
+                                           'pass_via_file': {'TOKEN': 'secret'}}},
+            'after_script': {'copy_files_to_host': {'results/{name}.json': '/result.json'},
+                             'extract_params_from_files': {'/result.json': 'result'}},
+            'matrix': [_entry('unit'), _entry('integration', exit_code=3), _entry('e2e')],
+        }}
+
+    def test_matrix_runs_entries_concurrently_and_aggregates_results(self, fake_podman, caplog, tmp_path, input_params):
+        # when
+        with pytest.raises(SystemExit) as exit_result:
+            cmd = PodmanRunMatrix(folder_path=str(tmp_path), input_params=input_params)
+            cmd.run()
+        # then
+        assert exit_result.value.code == 1
+        output = cmd.context.output_params
+        assert output.get("params.return_codes") == {"unit": 0, "integration": 3, "e2e": 0}
+        assert output.get("params.failed_entries") == ["integration"]
+        assert output.get("params.matrix.unit.status") == "SUCCESS"
+        assert output.get("params.matrix.integration.status") == "FAILED"
+        assert output.get("params.matrix.e2e.extracted_output.result") == {"suite": "e2e"}
+        assert output.get("params.matrix.e2e.stdout") == "suite e2e\n"
+        assert json.loads(cmd.context_dir_path.joinpath("results", "unit.json").read_text()) == {"suite": "unit"}
+        assert cmd.output_files_path.joinpath("integration", "container_stdout.txt").read_text() == "suite integration\n"
+        assert "[e2e] [stdout] suite e2e" in caplog.text
+        assert all(cmd.context_dir_path.joinpath("mounted", name).is_dir() for name in ("unit", "integration", "e2e"))
+
+        timings = [tuple(map(float, path.read_text().split())) for path in self.timings_dir.iterdir()]
+        max_overlap = max(sum(1 for start, end in timings if start <= moment < end) for moment, _ in timings)
+        assert max_overlap == 2
+        assert len(fake_podman.calls("run")) == 3
+        assert not list(fake_podman.container_root("").glob("podman_*/"))
+        assert not list(cmd.context_dir_path.glob("temp/*.env"))
+
+    def test_matrix_fail_fast_skips_pending_entries(self, fake_podman, tmp_path, input_params):
+        input_params['params']['execution_config'] = {'max_parallel': 1, 'fail_fast': True}
+        input_params['params']['matrix'] = [_entry('unit', exit_code=1), _entry('e2e')]
+        with pytest.raises(SystemExit) as exit_result:
+            cmd = PodmanRunMatrix(folder_path=str(tmp_path), input_params=input_params)
+            cmd.run()
+        assert exit_result.value.code == 1
+        assert cmd.context.output_params.get("params.matrix.e2e.status") == "SKIPPED"
+        assert cmd.context.output_params.get("params.return_codes") == {"unit": 1, "e2e": None}
+        assert len(fake_podman.calls("run")) == 1
+
+    def test_matrix_fails_with_duplicate_entry_names(self, fake_podman, caplog, tmp_path, input_params):
+        input_params['params']['matrix'] = [_entry('unit'), _entry('unit')]
+        with pytest.raises(SystemExit) as exit_result:
+            PodmanRunMatrix(folder_path=str(tmp_path), input_params=input_params).run()
+        assert exit_result.value.code == 1
+        assert "Duplicate matrix entry name 'unit'" in caplog.text
+        assert not fake_podman.calls("run")
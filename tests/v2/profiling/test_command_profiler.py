@@ -0,0 +1,98 @@
+import json
+import shutil
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+from qubership_pipelines_common_library.v1.execution.exec_command import ExecutionCommand, ExecutionCommandExtension
+from qubership_pipelines_common_library.v2.profiling.command_profiler import CommandProfiler
+from qubership_pipelines_common_library.v2.telemetry.tracing import InMemorySpanExporter, Tracer
+
+
+class SampleProfiledCommand(ExecutionCommand):
+
+    def _validate(self):
+        return self.context.validate(["paths.input.params", "params.value"])
+
+    def _execute(self):
+        self.context.output_param_set("params.result", self.context.input_param_get("params.value"))
+        self.context.output_params_save()
+
+
+class FailingCommand(SampleProfiledCommand):
+
+    def _execute(self):
+        raise Exception("Execution failed")
+
+
+class SamplePreExt(ExecutionCommandExtension):
+    def execute(self):
+        pass
+
+
+class TestCommandProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.folder_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder_path, ignore_errors=True)
+        CommandProfiler.PROFILER_MODE = None
+
+    def _run(self, command_class, profiler_mode: str = "timings") -> tuple[int, dict | None]:
+        with patch.dict("os.environ", {CommandProfiler.PROFILER_MODE_ENV: profiler_mode}), \
+                self.assertRaises(SystemExit) as exit_result:
+            cmd = command_class(input_params={"params": {"value": "42"}}, folder_path=self.folder_path,
+                                pre_execute_actions=[SamplePreExt()])
+            cmd.run()
+        timings_file = Path(cmd.context.path_logs).joinpath(CommandProfiler.FILE_NAME_TIMINGS)
+        return exit_result.exception.code, json.loads(timings_file.read_text()) if timings_file.exists() else None
+
+    def test_phase_timings_are_saved(self):
+        # when
+        code, timings = self._run(SampleProfiledCommand)
+        # then
+        self.assertEqual(0, code)
+        self.assertEqual("SampleProfiledCommand", timings["command"])
+        self.assertEqual("TIMINGS", timings["profiler"])
+        phase_names = [phase["name"] for phase in timings["phases"]]
+        self.assertEqual(["context_bootstrap", "log_input_params", "validate", "pre_execute",
+                          "pre_execute/SamplePreExt", "execute", "execute/output_params_save", "post_execute",
+                          "cli_output"], phase_names)
+        self.assertTrue(all(phase["status"] == "success" for phase in timings["phases"]))
+        self.assertGreaterEqual(timings["total_seconds"], sum(
+            phase["duration_seconds"] for phase in timings["phases"] if "/" not in phase["name"]))
+
+    def test_failed_phase_is_marked(self):
+        # when
+        code, timings = self._run(FailingCommand)
+        # then
+        self.assertEqual(1, code)
+        statuses = {phase["name"]: phase["status"] for phase in timings["phases"]}
+        self.assertEqual("failure", statuses["execute"])
+        self.assertNotIn("post_execute", statuses)
+
+    def test_cprofile_capture_enabled_by_env(self):
+        # when
+        _, timings = self._run(SampleProfiledCommand, profiler_mode="cprofile")
+        # then
+        self.assertEqual("CPROFILE", timings["profiler"])
+        self.assertEqual(CommandProfiler.FILE_NAME_CPROFILE, timings["profile_file"])
+        self.assertTrue(any(Path(self.folder_path).rglob(CommandProfiler.FILE_NAME_CPROFILE)))
+
+    def test_timings_are_saved_only_when_profiling_or_tracing_is_enabled(self):
+        code, timings = self._run(SampleProfiledCommand, profiler_mode="off")
+        self.assertEqual(0, code)
+        self.assertIsNone(timings)
+
+        Tracer.configure(InMemorySpanExporter())
+        try:
+            _, timings = self._run(SampleProfiledCommand, profiler_mode="off")
+        finally:
+            Tracer.reset()
+        self.assertEqual("OFF", timings["profiler"])
+
+    def test_measure_outside_of_command_does_nothing(self):
+        with CommandProfiler.measure("standalone"):
+            pass
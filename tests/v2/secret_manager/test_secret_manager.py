@@ -122,6 +122,87 @@ def test_secret_exists_false(self):
         sm = SecretManager(secret_provider=mock_prov)
         assert sm.secret_exists("path/to/secret") is False
 
+    def test_read_secrets_fetches_each_secret_once(self):
+        payloads = {"app/db": '{"user": "admin", "password": "pwd", "port": 5432}', "app/token": "plain-token"}
+        calls = []
+
+        class BulkProvider(MockSecretProvider):
+            def read_secret(self, path: str):
+                calls.append(path)
+                return payloads.get(path)
+
+        sm = SecretManager(secret_provider=BulkProvider())
+        result = sm.read_secrets(["app/db#/user", "app/db#/password", "app/db#/port", "app/token", "app/missing#/key"],
+                                 default_value="default")
+        assert result == {"app/db#/user": "admin", "app/db#/password": "pwd", "app/db#/port": "5432",
+                          "app/token": "plain-token", "app/missing#/key": "default"}
+        assert sorted(calls) == ["app/db", "app/missing", "app/token"]
+
+    def test_read_secrets_fail_on_missing(self):
+        sm = SecretManager(secret_provider=MockSecretProvider(read_return=None))
+        with pytest.raises(Exception, match="No secrets found"):
+            sm.read_secrets(["a#/b", "c"], fail_on_missing=True)
+
+    def test_read_secrets_groups_by_store_in_multistore(self):
+        p = MultiStoreProvider()
+        inner1 = MagicMock()
+        inner1.read_secret.return_value = '{"a": "1", "b": "2"}'
+        inner2 = MagicMock()
+        inner2.read_secret.return_value = '{"a": "3"}'
+        p._build_provider = MagicMock(side_effect=lambda provider_type, store_id: inner1 if store_id == "s1" else inner2)
+
+        result = SecretManager(secret_provider=p).read_secrets([
+            "ref+vault://app/cfg?secret_store_id=s1#/a",
+            "ref+vault://app/cfg?secret_store_id=s1#/b",
+            "ref+vault://app/cfg?secret_store_id=s2#/a",
+        ])
+
+        assert list(result.values()) == ["1", "2", "3"]
+        inner1.read_secret.assert_called_once_with(path="ref+vault://app/cfg?secret_store_id=s1")
+        inner2.read_secret.assert_called_once_with(path="ref+vault://app/cfg?secret_store_id=s2")
+
+    def test_cache_serves_repeated_reads_and_is_invalidated_by_writes(self):
+        calls = []
+
+        class CountingProvider(MockSecretProvider):
+            def read_secret(self, path: str):
+                calls.append(path)
+                return '{"user": "admin", "password": "pwd"}'
+
+        sm = SecretManager(secret_provider=CountingProvider(update_return="updated"), cache_ttl_seconds=60)
+        assert sm.read_secret("app/db#/user") == "admin"
+        assert sm.read_secret("app/db#/password") == "pwd"
+        assert sm.read_secrets(["app/db#/user", "app/db"]) == {"app/db#/user": "admin", "app/db": '{"user": "admin", "password": "pwd"}'}
+        assert sm.secret_exists("app/db") is True
+        assert calls == ["app/db"]
+
+        sm.read_secret("app/db#/user", no_cache=True)
+        assert calls == ["app/db", "app/db#/user"]
+
+        sm.update_secret("app/db#/user", "root")
+        sm.read_secret("app/db#/user")
+        assert calls == ["app/db", "app/db#/user", "app/db"]
+
+    def test_cache_is_disabled_by_default(self):
+        mock_prov = MockSecretProvider(read_return="my-secret")
+        sm = SecretManager(secret_provider=mock_prov)
+        assert sm.cache is None
+        assert sm.read_secret("path#/key") == "my-secret"
+        assert mock_prov.read_called_with == "path#/key"
+
+    def test_secret_cache_ttl_and_max_entries(self):
+        from qubership_pipelines_common_library.v2.secret_manager.secret_cache import SecretCache
+        cache = SecretCache(ttl_seconds=60, max_entries=2)
+        cache.put(("p", "a"), "1")
+        cache.put(("p", "b"), "2")
+        assert cache.get(("p", "a")) == (True, "1")
+        cache.put(("p", "c"), "3")
+        assert cache.get(("p", "b")) == (False, None)
+        assert len(cache) == 2
+
+        with patch("time.monotonic", return_value=10 ** 9):
+            assert cache.get(("p", "a")) == (False, None)
+
 
 @pytest.fixture
 def mock_hvac_client():
@@ -307,6 +388,37 @@ def test_delete_secret_fragment_missing_key(self, mock_hvac_client):
         with pytest.raises(Exception, match="not found"):
             provider.delete_secret("secret_v1/path#/nonexistent")
 
+    def test_mount_detected_once_for_sibling_secrets(self, mock_hvac_client):
+        mock_hvac_client.secrets.kv.v2.read_secret_version.return_value = {"data": {"data": {"key": "value"}}}
+        creds = Credentials(token="t")
+        with patch("hvac.Client", return_value=mock_hvac_client):
+            provider = HashicorpVaultProvider(url="http://vault", credentials=creds)
+        provider.read_secret("secret_v2/app1/config#/key")
+        provider.read_secret("secret_v2/app2/config#/key")
+        provider.secret_exists("secret_v2/app3")
+
+        mount_reads = [c for c in mock_hvac_client.read.call_args_list if c.args[0].startswith("sys/internal/ui/mounts/")]
+        assert len(mount_reads) == 1
+        assert mock_hvac_client.secrets.kv.v2.read_secret_version.call_args.kwargs == {"path": "app3", "mount_point": "secret_v2/"}
+
+    def test_mount_cache_longest_prefix_and_warm_up(self, mock_hvac_client):
+        from qubership_pipelines_common_library.v2.secret_manager.providers.hashicorp_vault import VaultMountCache
+        mock_hvac_client.sys.list_mounted_secrets_engines.return_value = {"data": {
+            "team/": {"type": "kv", "options": {"version": "1"}},
+            "team/v2store/": {"type": "kv", "options": {"version": "2"}},
+            "sys/": {"type": "system", "options": None},
+        }}
+        mount_cache = VaultMountCache()
+        creds = Credentials(token="t")
+        with patch("hvac.Client", return_value=mock_hvac_client):
+            provider = HashicorpVaultProvider(url="http://vault", credentials=creds, mount_cache=mount_cache, warm_up_mounts=True)
+            HashicorpVaultProvider(url="http://vault", credentials=creds, mount_cache=mount_cache)
+
+        assert len(mount_cache) == 2
+        assert provider._detect_kv_version_and_mount_point("team/v2store/app/db") == (2, "app/db", "team/v2store/")
+        assert provider._detect_kv_version_and_mount_point("team/app/db") == (1, "app/db", "team/")
+        mock_hvac_client.read.assert_not_called()
+
 
 class TestHashicorpVaultCredentialsProvider:
     def test_with_env_vars_token(self):
@@ -388,6 +500,82 @@ def test_read_secret_different_store_ids_new_provider(self):
         assert p.read_secret("ref+vault://path2?secret_store_id=store2") == "val2"
         assert p._build_provider.call_count == 2
 
+    def test_warm_up_builds_stores_concurrently_once(self):
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+        p = MultiStoreProvider()
+
+        def build(provider_type, store_id):
+            barrier.wait()  # fails with BrokenBarrierError unless all three stores are built at the same time
+            return MagicMock(name=f"{provider_type}-{store_id}")
+
+        p._build_provider = MagicMock(side_effect=build)
+        p.warm_up([
+            "ref+vault://a/b#/c",
+            "ref+vault://a/d",
+            "ref+awssecrets://x?secret_store_id=s1",
+            "ref+azurekeyvault://vault/secret",
+        ])
+
+        assert p._build_provider.call_count == 3
+        p.with_provider("ref+vault://other")
+        assert p._build_provider.call_count == 3
+
+    def test_warm_up_skips_failed_stores(self):
+        p = MultiStoreProvider()
+        p._build_provider = MagicMock(side_effect=ValueError("Vault address not found"))
+        p.warm_up(["ref+vault://a/b", "ref+openbao://a/b"])
+        with pytest.raises(ValueError, match="Vault address not found"):
+            p.with_provider("ref+vault://a/b")
+        assert p._build_provider.call_count == 3
+
+    def test_shared_store_failed_in_warm_up_is_built_again(self):
+        MultiStoreProvider.clear_shared_providers()
+        try:
+            first = MultiStoreProvider(shared=True)
+            first._build_provider = MagicMock(side_effect=ConnectionError("Connection refused"))
+            first.warm_up(["ref+vault://a/b"])
+
+            second = MultiStoreProvider(shared=True)
+            provider = MagicMock()
+            second._build_provider = MagicMock(return_value=provider)
+            assert second.with_provider("ref+vault://a/b") is provider
+        finally:
+            MultiStoreProvider.clear_shared_providers()
+
+    def test_shared_providers_reused_across_instances(self):
+        MultiStoreProvider.clear_shared_providers()
+        try:
+            first = MultiStoreProvider(shared=True)
+            first._build_provider = MagicMock(return_value=MagicMock())
+            provider = first.with_provider("ref+vault://a/b")
+
+            second = MultiStoreProvider(shared=True)
+            second._build_provider = MagicMock()
+            assert second.with_provider("ref+vault://c/d") is provider
+            second._build_provider.assert_not_called()
+
+            isolated = MultiStoreProvider()
+            isolated._build_provider = MagicMock(return_value=MagicMock())
+            assert isolated.with_provider("ref+vault://a/b") is not provider
+        finally:
+            MultiStoreProvider.clear_shared_providers()
+
+    def test_provider_maps_and_old_module_names_resolve_to_classes(self):
+        from qubership_pipelines_common_library.v2.secret_manager.providers import multi_store_provider
+        from qubership_pipelines_common_library.v2.secret_manager.providers.multi_store_provider import (
+            HashicorpVaultProvider as ReExportedProvider, HashicorpVaultCredentialsProvider as ReExportedCredentials)
+
+        assert ReExportedProvider is HashicorpVaultProvider
+        assert ReExportedCredentials is HashicorpVaultCredentialsProvider
+        assert MultiStoreProvider.PROVIDER_MAP["vault"] is HashicorpVaultProvider
+        assert dict(MultiStoreProvider.CREDENTIALS_MAP.items())["vault"] is HashicorpVaultCredentialsProvider
+        assert all(isinstance(cls, type) for cls in MultiStoreProvider.PROVIDER_MAP.values())
+        assert MultiStoreProvider.get_provider_class("vault") is HashicorpVaultProvider
+        assert MultiStoreProvider.get_credentials_provider_class("vault") is HashicorpVaultCredentialsProvider
+        with pytest.raises(AttributeError):
+            multi_store_provider.UnknownProvider
+
 
 class TestParseUri:
 
@@ -413,3 +601,22 @@ def test_with_multiple_query_params(self):
         p = MultiStoreProvider()
         result = p.parse_provider_type("ref+awssecrets://path?foo=bar&secret_store_id=s1&baz=qux")
         assert result == ("awssecrets", "s1")
+
+
+class TestMultiStoreMountCache:
+
+    def test_vault_stores_on_same_server_share_mount_cache(self):
+        env = {"VAULT_ADDR": "http://vault", "VAULT_TOKEN": "t1",
+               "S2_VAULT_ADDR": "http://vault/", "S2_VAULT_TOKEN": "t2",
+               "S3_VAULT_ADDR": "http://other-vault", "S3_VAULT_TOKEN": "t3"}
+        client = MagicMock()
+        client.is_authenticated.return_value = True
+        with patch.dict(os.environ, env, clear=True), patch("hvac.Client", return_value=client):
+            p = MultiStoreProvider(warm_up_vault_mounts=True)
+            default = p.with_provider("ref+vault://secret/a")
+            second = p.with_provider("ref+vault://secret/a?secret_store_id=S2")
+            third = p.with_provider("ref+vault://secret/a?secret_store_id=S3")
+
+        assert default.mount_cache is second.mount_cache
+        assert default.mount_cache is not third.mount_cache
+        assert client.sys.list_mounted_secrets_engines.call_count == 2
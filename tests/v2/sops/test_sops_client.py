@@ -2,6 +2,7 @@
 import sys
 import shutil
 import stat
+import tempfile
 import unittest
 import pytest
 import requests
@@ -98,5 +99,89 @@ def test_sops_decrypt_non_encrypted_file__should_return_empty_string(self):
         self.assertEqual("", actual_decrypted_content)
 
 
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Fake sops executable is a shell script")
+class TestSopsClientBatch(unittest.TestCase):
+
+    FAKE_SOPS_SCRIPT = """#!/bin/sh
+if [ "$1" = "--config" ]; then
+  echo "$2" >> "$(dirname "$0")/configs.log"
+  file="$4"
+else
+  file="$2"
+fi
+case "$file" in *broken*) echo "cannot process $file" >&2; exit 1;; esac
+if [ "$1" = "-d" ]; then
+  echo "key: $SOPS_AGE_KEY"
+else
+  echo "sops: {age: [{recipient: fake}]}"
+fi
+cat "$file"
+"""
+
+    def setUp(self):
+        self.temp_folder = Path(tempfile.mkdtemp())
+        self.fake_sops_path = self.temp_folder.joinpath("sops")
+        self.fake_sops_path.write_text(self.FAKE_SOPS_SCRIPT)
+        self.fake_sops_path.chmod(self.fake_sops_path.stat().st_mode | stat.S_IEXEC)
+        self.sources = []
+        for i in range(5):
+            source = self.temp_folder.joinpath(f"params-{i}.yaml")
+            source.write_text(f"value: {i}\n")
+            self.sources.append(source)
+        self.sops_client = SopsClient(self.temp_folder.joinpath("configs"))
+        self.sops_client.sops_executable = self.fake_sops_path
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder)
+
+    def test_encrypt_files__reuses_one_config_for_batch(self):
+        # when
+        result = self.sops_client.encrypt_files("age1key", {source: None for source in self.sources}, max_workers=3)
+        # then
+        self.assertTrue(all(result.values()))
+        for i, source in enumerate(self.sources):
+            self.assertEqual(f"sops: {{age: [{{recipient: fake}}]}}\nvalue: {i}\n", source.read_text())
+        used_configs = self.temp_folder.joinpath("configs.log").read_text().splitlines()
+        self.assertEqual(len(self.sources), len(used_configs))
+        self.assertEqual(1, len(set(used_configs)))
+        self.assertFalse(any(self.temp_folder.joinpath("configs").iterdir()))
+
+    def test_encrypt_files__failed_file_gets_empty_content(self):
+        # given
+        broken = self.temp_folder.joinpath("broken.yaml")
+        broken.write_text("value: x\n")
+        target = self.temp_folder.joinpath("out", "broken-encrypted.yaml")
+        # when
+        result = self.sops_client.encrypt_files("age1key", {self.sources[0]: None, broken: target})
+        # then
+        self.assertEqual({self.sources[0]: True, broken: False}, result)
+        self.assertEqual("", target.read_text())
+        self.assertEqual("value: x\n", broken.read_text())
+
+    def test_decrypt_files__streams_content_into_targets(self):
+        # given
+        broken = self.temp_folder.joinpath("broken.yaml")
+        broken.write_text("value: x\n")
+        files = {source: self.temp_folder.joinpath("decrypted", source.name) for source in self.sources}
+        files[broken] = self.temp_folder.joinpath("decrypted", broken.name)
+        # when
+        result = self.sops_client.decrypt_files(" AGE-KEY ", files, max_workers=2)
+        # then
+        self.assertFalse(result.pop(broken))
+        self.assertTrue(all(result.values()))
+        self.assertFalse(files[broken].exists())
+        for i, source in enumerate(self.sources):
+            self.assertEqual(f"key: AGE-KEY\nvalue: {i}\n", files[source].read_text())
+        self.assertEqual(len(self.sources), len(list(self.temp_folder.joinpath("decrypted").iterdir())))
+
+    def test_decrypt_files__without_key_does_nothing(self):
+        # when
+        result = self.sops_client.decrypt_files("", {self.sources[0]: self.sources[0]})
+        # then
+        self.assertEqual({self.sources[0]: False}, result)
+        self.assertEqual("value: 0\n", self.sources[0].read_text())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,151 @@
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+import yaml
+
+from pathlib import Path
+from unittest.mock import patch
+from qubership_pipelines_common_library.v1.execution.exec_context_file import ExecutionContextFile
+from qubership_pipelines_common_library.v1.utils.utils_dictionary import UtilsDictionary
+from qubership_pipelines_common_library.v2.sops.age_crypto import AgeCrypto
+from qubership_pipelines_common_library.v2.sops.sops_client import SopsClient
+from qubership_pipelines_common_library.v2.sops.sops_crypto import SopsCrypto
+
+
+class TestSopsCrypto(unittest.TestCase):
+
+    AGE_PRIVATE_KEY = "AGE-SECRET-KEY-1SHXCVUX3RWY7HTCRZYJ2CCMH7XVFQT2K509JR59JFR4EQRY66D7S4H70YM"
+    AGE_PUBLIC_KEY = "age1gryqvlh4zq7tl8qgfsuc0pla5yv04ypclg73m8mwpfjaa0vvmurq6536ws"
+    SOURCE_FILE_PATH = Path("tests/v2/sops/data/generated-file-secure.yaml")
+    # encrypted by `sops` CLI v3.11.0 with AGE_PUBLIC_KEY
+    SOPS_CLI_ENCRYPTED_FILE_PATH = Path("tests/v2/sops/data/generated-file-secure-encrypted.yaml")
+
+    CONTENT = {
+        "kind": "AtlasModuleParamsSecure",
+        "params": {"token": "secret", "port": 8080, "ratio": 0.25, "enabled": True, "empty": "", "missing": None,
+                   "hosts": ["a", "b"], "comment_unencrypted": "visible"},
+    }
+
+    def setUp(self):
+        self.temp_folder = Path(tempfile.mkdtemp())
+        self.sops_crypto = SopsCrypto()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder)
+
+    def test_age_recipient_from_identity(self):
+        self.assertEqual(self.AGE_PUBLIC_KEY, AgeCrypto.recipient_from_identity(self.AGE_PRIVATE_KEY))
+
+    def test_age_encrypt_decrypt_multiple_chunks(self):
+        # given
+        identity, recipient = AgeCrypto.generate_identity()
+        data = os.urandom(AgeCrypto.CHUNK_SIZE * 2 + 7)
+        # when
+        armored = AgeCrypto.encrypt(data, [self.AGE_PUBLIC_KEY, recipient])
+        # then
+        self.assertTrue(armored.startswith(AgeCrypto.ARMOR_BEGIN))
+        self.assertEqual(data, AgeCrypto.decrypt(armored, [identity]))
+        self.assertEqual(data, AgeCrypto.decrypt(armored, [self.AGE_PRIVATE_KEY]))
+        with self.assertRaises(ValueError):
+            AgeCrypto.decrypt(armored, [AgeCrypto.generate_identity()[0]])
+
+    def test_encrypt_decrypt_content(self):
+        # when
+        encrypted = self.sops_crypto.encrypt_content(self.CONTENT, self.AGE_PUBLIC_KEY)
+        # then
+        self.assertTrue(SopsClient.is_encrypted(encrypted))
+        self.assertEqual(self.AGE_PUBLIC_KEY, encrypted["sops"]["age"][0]["recipient"])
+        self.assertRegex(encrypted["params"]["token"], r"^ENC\[AES256_GCM,data:.*,type:str\]$")
+        self.assertRegex(encrypted["params"]["port"], r"type:int\]$")
+        self.assertRegex(encrypted["params"]["hosts"][1], r"type:str\]$")
+        self.assertEqual("", encrypted["params"]["empty"])
+        self.assertIsNone(encrypted["params"]["missing"])
+        self.assertEqual("visible", encrypted["params"]["comment_unencrypted"])
+        self.assertEqual(self.CONTENT, self.sops_crypto.decrypt_content(encrypted, self.AGE_PRIVATE_KEY))
+
+    def test_decrypt_content__detects_tampering(self):
+        # given
+        encrypted = self.sops_crypto.encrypt_content(self.CONTENT, self.AGE_PUBLIC_KEY)
+        encrypted["params"]["comment_unencrypted"] = "changed"
+        # when / then
+        with self.assertRaisesRegex(ValueError, "MAC mismatch"):
+            self.sops_crypto.decrypt_content(encrypted, self.AGE_PRIVATE_KEY)
+
+    def test_decrypt_file_encrypted_by_sops_cli(self):
+        # when
+        decrypted = yaml.safe_load(self.sops_crypto.get_decrypted_content_by_path(
+            self.AGE_PRIVATE_KEY, self.SOPS_CLI_ENCRYPTED_FILE_PATH))
+        # then
+        with open(self.SOURCE_FILE_PATH) as file:
+            self.assertEqual(yaml.safe_load(file), decrypted)
+
+    def test_decrypt_file__wrong_key_returns_empty_string(self):
+        self.assertEqual("", self.sops_crypto.get_decrypted_content_by_path(
+            AgeCrypto.generate_identity()[0], self.SOPS_CLI_ENCRYPTED_FILE_PATH))
+
+    def test_execution_context_file_save_encrypted_and_load(self):
+        # given
+        path = self.temp_folder.joinpath("params_secure.yaml")
+        params = ExecutionContextFile().init_params_secure().set("params.token", "secret")
+        # when
+        params.save(path, age_public_key=self.AGE_PUBLIC_KEY)
+        # then
+        with open(path) as file:
+            self.assertTrue(SopsClient.is_encrypted(yaml.safe_load(file)))
+        self.assertEqual("secret", ExecutionContextFile(path, age_private_key=self.AGE_PRIVATE_KEY).get("params.token", None))
+        self.assertEqual("", ExecutionContextFile(path).get("kind"))
+
+    def test_execution_context_file_load_decrypts_sops_cli_file(self):
+        with patch.object(ExecutionContextFile, "SUPPORTED_KINDS", ["atlasConfigSecure"]), \
+                patch.object(ExecutionContextFile, "SUPPORTED_API_VERSIONS", ["v2"]):
+            loaded = ExecutionContextFile(self.SOPS_CLI_ENCRYPTED_FILE_PATH, age_private_key=self.AGE_PRIVATE_KEY)
+        self.assertEqual("admin", loaded.get("systems.registry.password"))
+
+
+@unittest.skipUnless(os.environ.get("SOPS_EXECUTABLE") or shutil.which("sops"), "sops executable is not available")
+class TestSopsCryptoCliInterop(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_folder = Path(tempfile.mkdtemp())
+        self.sops_executable = os.environ.get("SOPS_EXECUTABLE") or shutil.which("sops")
+        self.identity, self.recipient = AgeCrypto.generate_identity()
+        self.sops_crypto = SopsCrypto()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder)
+
+    def test_sops_cli_decrypts_native_encryption(self):
+        for file_name in ["params.yaml", "params.json"]:
+            # given
+            source = self.temp_folder.joinpath(file_name)
+            source.write_text('{"params": {"token": "secret", "port": 8080, "flags": [true, 1.5]}}')
+            encrypted = self.temp_folder.joinpath(f"encrypted-{file_name}")
+            # when
+            self.sops_crypto.encrypt_content_by_path(self.recipient, source, encrypted)
+            result = subprocess.run((self.sops_executable, "-d", encrypted), capture_output=True, text=True,
+                                    env={**os.environ, "SOPS_AGE_KEY": self.identity})
+            # then
+            self.assertEqual(0, result.returncode, result.stderr)
+            decrypted = json.loads(result.stdout) if file_name.endswith(".json") else yaml.safe_load(result.stdout)
+            self.assertEqual("secret", UtilsDictionary.get_by_path(decrypted, "params.token", None))
+            self.assertEqual([True, 1.5], UtilsDictionary.get_by_path(decrypted, "params.flags", None))
+
+    def test_native_decrypts_sops_cli_encryption(self):
+        # given
+        source = self.temp_folder.joinpath("params.yaml")
+        source.write_text(yaml.safe_dump(TestSopsCrypto.CONTENT, sort_keys=False))
+        config = self.temp_folder.joinpath(".sops.yaml")
+        config.write_text(yaml.safe_dump({"creation_rules": [{"age": self.recipient}]}))
+        # when
+        result = subprocess.run((self.sops_executable, "--config", config, "encrypt", source),
+                                capture_output=True, text=True)
+        # then
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertEqual(TestSopsCrypto.CONTENT, self.sops_crypto.decrypt_content(yaml.safe_load(result.stdout), self.identity))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import json
+import shutil
+import tempfile
+import unittest
+import requests
+
+from pathlib import Path
+from unittest.mock import patch
+from qubership_pipelines_common_library.v2.secret_manager.secret_cache import SecretCache
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
+from qubership_pipelines_common_library.v2.telemetry.metrics import Metrics, MetricsRegistry
+from qubership_pipelines_common_library.v2.utils.retry_decorator import RetryDecorator
+from tests.v2.profiling.test_command_profiler import SampleProfiledCommand, FailingCommand
+from tests.v2.telemetry.test_tracing import StubAdapter
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        Metrics.reset()
+        self.temp_folder = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        Metrics.reset()
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_prometheus_text_format(self):
+        # given
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests", ("system",)).inc(system='jira "cloud"')
+        registry.gauge("queue_size", "Queue size").set(3)
+        histogram = registry.histogram("latency_seconds", "Latency", ("system",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, system="nexus")
+        histogram.observe(5, system="nexus")
+        # when
+        text = registry.to_prometheus_text()
+        # then
+        self.assertIn('# TYPE requests_total counter\nrequests_total{system="jira \\"cloud\\""} 1\n', text)
+        self.assertIn("queue_size 3\n", text)
+        self.assertIn('latency_seconds_bucket{system="nexus",le="0.1"} 1\n', text)
+        self.assertIn('latency_seconds_bucket{system="nexus",le="1.0"} 1\n', text)
+        self.assertIn('latency_seconds_bucket{system="nexus",le="+Inf"} 2\n', text)
+        self.assertIn('latency_seconds_sum{system="nexus"} 5.05\n', text)
+        self.assertIn('latency_seconds_count{system="nexus"} 2\n', text)
+
+    def test_histogram_percentiles(self):
+        histogram = MetricsRegistry().histogram("latency_seconds", "Latency", buckets=(1.0, 2.0, 4.0))
+        for value in [0.5] * 50 + [1.5] * 40 + [3.0] * 10:
+            histogram.observe(value)
+        self.assertEqual(1.0, histogram.percentile(0.5))
+        self.assertEqual(2.0, histogram.percentile(0.9))
+        self.assertEqual(3.8, histogram.percentile(0.99))
+        self.assertEqual({"count": 100, "sum": 115.0, "p50": 1.0, "p90": 2.0, "p99": 3.8}, histogram.get())
+
+    def test_registry_rejects_conflicting_metrics_and_labels(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls", ("system",))
+        self.assertIs(counter, registry.counter("calls_total", "Calls", ("system",)))
+        with self.assertRaises(ValueError):
+            registry.gauge("calls_total", "Calls", ("system",))
+        with self.assertRaises(ValueError):
+            counter.inc(method="GET")
+        with self.assertRaises(ValueError):
+            counter.inc(-1, system="jira")
+
+    def test_instrumented_session_records_requests_without_tracing(self):
+        # given
+        session = requests.Session()
+        session.mount("https://", StubAdapter(status_code=404))
+        Instrumentation.instrument_session(session, "Nexus")
+        # when
+        session.get("https://nexus.example.com/service/rest/v1/search")
+        session.get("https://nexus.example.com/service/rest/v1/search")
+        # then
+        self.assertEqual(2, Metrics.http_requests.get(system="Nexus", method="GET", status="404"))
+        self.assertEqual(2, Metrics.http_request_duration.get(system="Nexus", method="GET")["count"])
+
+    def test_retries_and_cache_lookups_are_counted(self):
+        # given
+        attempts = []
+
+        @RetryDecorator(condition_func=lambda result: result is not None, retry_wait_seconds=0.01)
+        def flaky():
+            attempts.append(1)
+            return "ok" if len(attempts) == 3 else None
+        cache = SecretCache(ttl_seconds=60, name="test")
+        # when
+        flaky()
+        cache.get(("key",))
+        cache.put(("key",), "value")
+        cache.get(("key",))
+        # then
+        self.assertEqual(2, Metrics.retries.get(function=flaky.__qualname__))
+        self.assertEqual(1, Metrics.cache_requests.get(cache="test", result="hit"))
+        self.assertEqual(1, Metrics.cache_requests.get(cache="test", result="miss"))
+
+    def test_command_run_exports_metrics(self):
+        # given
+        textfile_dir = self.temp_folder.joinpath("textfile")
+        with patch.dict("os.environ", {Metrics.METRICS_EXPORT_ENV: "prometheus, json",
+                                       Metrics.METRICS_TEXTFILE_DIR_ENV: str(textfile_dir)}):
+            with self.assertRaises(SystemExit):
+                cmd = SampleProfiledCommand(input_params={"params": {"value": "1"}}, folder_path=str(self.temp_folder))
+                cmd.run()
+        # when
+        path_logs = Path(cmd.context.path_logs)
+        prometheus_text = path_logs.joinpath(Metrics.FILE_NAME_PROMETHEUS).read_text()
+        metrics = json.loads(path_logs.joinpath(Metrics.FILE_NAME_JSON).read_text())
+        # then
+        self.assertIn('pipelines_command_last_success{command="SampleProfiledCommand"} 1\n', prometheus_text)
+        self.assertEqual(prometheus_text, textfile_dir.joinpath(Metrics.TEXTFILE_NAME).read_text())
+        self.assertEqual("gauge", metrics["pipelines_command_last_duration_seconds"]["type"])
+        self.assertEqual([], list(textfile_dir.glob(".*.tmp")))
+
+    def test_failed_command_is_reported(self):
+        Metrics.configure([Metrics.ExportFormat.JSON])
+        with self.assertRaises(SystemExit):
+            cmd = FailingCommand(input_params={"params": {"value": "1"}}, folder_path=str(self.temp_folder))
+            cmd.run()
+        self.assertEqual(0, Metrics.command_success.get(command="FailingCommand"))
+        self.assertFalse(Path(cmd.context.path_logs).joinpath(Metrics.FILE_NAME_PROMETHEUS).exists())
+        self.assertTrue(Path(cmd.context.path_logs).joinpath(Metrics.FILE_NAME_JSON).exists())
+
+    def test_export_is_disabled_by_default(self):
+        with patch.dict("os.environ", {}, clear=True):
+            Metrics.http_requests.inc(system="jira", method="GET", status="200")
+            Metrics.export(self.temp_folder)
+        self.assertEqual([], list(self.temp_folder.iterdir()))
+
+
+if __name__ == "__main__":
+    unittest.main()
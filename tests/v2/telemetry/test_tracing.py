@@ -0,0 +1,129 @@
+import json
+import shutil
+import tempfile
+import unittest
+import requests
+
+from pathlib import Path
+from unittest.mock import patch
+from requests.adapters import BaseAdapter
+from qubership_pipelines_common_library.v2.telemetry.instrumentation import Instrumentation
+from qubership_pipelines_common_library.v2.telemetry.tracing import Tracer, InMemorySpanExporter, NOOP_SPAN
+from qubership_pipelines_common_library.v2.utils.retry_decorator import RetryDecorator
+from tests.v2.profiling.test_command_profiler import SampleProfiledCommand
+
+
+class StubAdapter(BaseAdapter):
+
+    def __init__(self, status_code: int = 200):
+        super().__init__()
+        self.status_code = status_code
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.request = request
+        response.url = request.url
+        response._content = b"{}"
+        return response
+
+    def close(self):
+        pass
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        Tracer.configure(self.exporter)
+
+    def tearDown(self):
+        Tracer.reset()
+
+    def test_tracing_is_disabled_by_default(self):
+        Tracer.reset()
+        with patch.dict("os.environ", {}, clear=True):
+            with Tracer.span("operation") as span:
+                self.assertIs(NOOP_SPAN, span)
+            self.assertFalse(Tracer.is_enabled())
+
+    def test_nested_spans(self):
+        # when
+        with Tracer.span("parent") as parent:
+            with self.assertRaises(ValueError):
+                with Tracer.span("child", attributes={"key": "value"}):
+                    raise ValueError("boom")
+        # then
+        child_span, parent_span = self.exporter.spans
+        self.assertEqual(parent.span_id, child_span.parent_span_id)
+        self.assertEqual(parent_span.trace_id, child_span.trace_id)
+        self.assertEqual(Tracer.StatusCode.ERROR, child_span.status_code)
+        self.assertEqual("ValueError", child_span.attributes["error.type"])
+        self.assertEqual(Tracer.StatusCode.UNSET, parent_span.status_code)
+        self.assertIsNone(Tracer.get_current_span())
+
+    def test_instrumented_session_reports_client_spans(self):
+        # given
+        session = requests.Session()
+        session.mount("https://", StubAdapter(status_code=404))
+        Instrumentation.instrument_session(session, "jira")
+        Instrumentation.instrument_session(session, "jira")
+        # when
+        session.get("https://jira.example.com/rest/api/2/issue/12345/comment")
+        # then
+        span, = self.exporter.spans
+        self.assertEqual("GET /rest/api/{id}/issue/{id}/comment", span.name)
+        self.assertEqual(Tracer.SpanKind.CLIENT, span.kind)
+        self.assertEqual("jira", span.attributes["pipelines.system"])
+        self.assertEqual("jira.example.com", span.attributes["server.address"])
+        self.assertEqual(404, span.attributes["http.response.status_code"])
+        self.assertEqual(Tracer.StatusCode.ERROR, span.status_code)
+
+    def test_url_template(self):
+        self.assertEqual("/repository/maven/com/example/app/{id}/app-1.0.0.jar",
+                         Instrumentation.url_template("/repository/maven/com/example/app/1.0.0/app-1.0.0.jar"))
+        self.assertEqual("/builds/{id}", Instrumentation.url_template(
+            "/builds/0f8fad5b-d9cb-469f-a165-70867728950e"))
+        self.assertEqual("/", Instrumentation.url_template(""))
+
+    def test_retry_decorator_span_counts_retries(self):
+        # given
+        attempts = []
+
+        @RetryDecorator(condition_func=lambda result: result is not None, retry_wait_seconds=0.01)
+        def flaky():
+            attempts.append(1)
+            return "ok" if len(attempts) == 3 else None
+        # when
+        self.assertEqual("ok", flaky())
+        # then
+        span, = self.exporter.spans
+        self.assertIn("flaky", span.name)
+        self.assertEqual(2, span.attributes["pipelines.retry.count"])
+
+    def test_command_run_exports_otlp_json(self):
+        # given
+        Tracer.reset()
+        folder_path = tempfile.mkdtemp()
+        try:
+            with patch.dict("os.environ", {Tracer.TRACING_EXPORTER_ENV: "otlp_json"}):
+                with self.assertRaises(SystemExit):
+                    cmd = SampleProfiledCommand(input_params={"params": {"value": "1"}}, folder_path=folder_path)
+                    cmd.run()
+            # when
+            lines = Path(cmd.context.path_logs).joinpath("otlp_traces.json").read_text().splitlines()
+        finally:
+            shutil.rmtree(folder_path, ignore_errors=True)
+        # then
+        spans = [span for line in lines
+                 for resource_spans in json.loads(line)["resourceSpans"]
+                 for scope_spans in resource_spans["scopeSpans"]
+                 for span in scope_spans["spans"]]
+        by_name = {span["name"]: span for span in spans}
+        root = by_name["command SampleProfiledCommand"]
+        self.assertNotIn("parentSpanId", root)
+        self.assertEqual(root["spanId"], by_name["phase execute"]["parentSpanId"])
+        self.assertEqual(by_name["phase execute"]["spanId"], by_name["phase output_params_save"]["parentSpanId"])
+        self.assertEqual({root["traceId"]}, {span["traceId"] for span in spans})
+        self.assertEqual(1, root["kind"])
+        self.assertTrue(int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"]))
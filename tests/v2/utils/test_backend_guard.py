@@ -0,0 +1,155 @@
+import shutil
+import tempfile
+import time
+import unittest
+
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+from qubership_pipelines_common_library.v2.utils.backend_guard import BackendGuard
+from qubership_pipelines_common_library.v2.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from qubership_pipelines_common_library.v2.utils.rate_limiter import RateLimiter
+from qubership_pipelines_common_library.v2.utils.retry_decorator import RetryDecorator, RetryError
+from qubership_pipelines_common_library.v2.utils.state_store import FileStateStore
+
+
+def _reserve_from_shared_limiter(directory: str) -> float:
+    return RateLimiter("git.example.com", rate_per_second=1, burst=2, store=FileStateStore(directory)).reserve()
+
+
+class TestBackendGuard(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        BackendGuard.reset()
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_rate_limiter_allows_burst_then_spaces_calls(self):
+        limiter = RateLimiter("jira.example.com", rate_per_second=10, burst=2)
+        self.assertEqual(0.0, limiter.reserve())
+        self.assertEqual(0.0, limiter.reserve())
+        self.assertAlmostEqual(0.1, limiter.reserve(), delta=0.01)
+        self.assertAlmostEqual(0.2, limiter.reserve(), delta=0.01)
+
+    def test_rate_limiter_state_is_shared_between_processes(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            waits = sorted(executor.map(_reserve_from_shared_limiter, [self.temp_folder] * 3))
+        self.assertEqual([0.0, 0.0], waits[:2])
+        self.assertGreater(waits[2], 0.5)
+
+    def test_circuit_breaker_opens_and_recovers(self):
+        # given
+        breaker = CircuitBreaker("gitlab.example.com", failure_threshold=2, recovery_timeout_seconds=0.1)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+        # then
+        self.assertEqual(CircuitBreaker.State.OPEN, breaker.get_state())
+        with self.assertRaises(CircuitOpenError) as context:
+            breaker.before_call()
+        self.assertLessEqual(context.exception.retry_after_seconds, 0.1)
+        # when recovery timeout passes, single probe is allowed
+        time.sleep(0.1)
+        breaker.before_call()
+        self.assertEqual(CircuitBreaker.State.HALF_OPEN, breaker.get_state())
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(CircuitBreaker.State.CLOSED, breaker.get_state())
+
+    def test_failed_probe_opens_circuit_again(self):
+        breaker = CircuitBreaker("gitlab.example.com", failure_threshold=1, recovery_timeout_seconds=0.05,
+                                 store=FileStateStore(self.temp_folder))
+        breaker.record_failure()
+        time.sleep(0.05)
+        breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual(CircuitBreaker.State.OPEN, breaker.get_state())
+        self.assertEqual(CircuitBreaker.State.OPEN, CircuitBreaker("gitlab.example.com", store=FileStateStore(self.temp_folder)).get_state())
+
+    def test_host_key(self):
+        self.assertEqual("git.example.com:8443", BackendGuard.host_key("https://user@Git.Example.com:8443/api/v4"))
+        self.assertEqual("jira.example.com", BackendGuard.host_key("jira.example.com"))
+        self.assertIsNone(BackendGuard.host_key(None))
+        self.assertIs(BackendGuard.for_host("https://jira.example.com/rest"), BackendGuard.for_host("jira.example.com"))
+
+    def test_guard_is_configured_from_env(self):
+        with patch.dict("os.environ", {BackendGuard.RATE_LIMIT_ENV: "0", BackendGuard.FAILURE_THRESHOLD_ENV: "3",
+                                       BackendGuard.STATE_DIR_ENV: self.temp_folder}):
+            guard = BackendGuard.for_host("jira.example.com")
+        self.assertIsNone(guard.rate_limiter)
+        self.assertEqual(3, guard.circuit_breaker.failure_threshold)
+        self.assertIsInstance(guard.circuit_breaker.store, FileStateStore)
+
+    def test_retry_stops_when_circuit_stays_open_beyond_deadline(self):
+        # given
+        BackendGuard.configure(rate_per_second=0, failure_threshold=2, recovery_timeout_seconds=60)
+        calls = []
+
+        @RetryDecorator(retry_timeout_seconds=5, retry_wait_seconds=0.01, raise_on_failure=True,
+                        backend_func=lambda url: url)
+        def call(url: str):
+            calls.append(url)
+            raise ConnectionError("unavailable")
+        # when
+        started_at = time.monotonic()
+        with self.assertRaises(RetryError) as context:
+            call("https://github.example.com/api/v3")
+        # then
+        self.assertLess(time.monotonic() - started_at, 1)
+        self.assertEqual(2, len(calls))
+        self.assertIsInstance(context.exception.__cause__, CircuitOpenError)
+        # other callers of the same host fail fast without calling it
+        with self.assertRaises(RetryError):
+            call("https://github.example.com/other")
+        self.assertEqual(2, len(calls))
+
+    def test_retry_reports_success_to_breaker(self):
+        BackendGuard.configure(rate_per_second=0, failure_threshold=3)
+        results = [None, None, "ok"]
+
+        @RetryDecorator(condition_func=lambda result: result is not None, retry_wait_seconds=0.01,
+                        backend_func=lambda url: url)
+        def call(url: str):
+            return results.pop(0)
+        self.assertEqual("ok", call("https://jira.example.com"))
+        self.assertEqual(CircuitBreaker.State.CLOSED, BackendGuard.for_host("jira.example.com").circuit_breaker.get_state())
+
+    def test_client_errors_do_not_open_circuit(self):
+        # given
+        BackendGuard.configure(rate_per_second=0, failure_threshold=2)
+        statuses = []
+
+        @RetryDecorator(condition_func=lambda response: response.ok, retry_timeout_seconds=0.1, retry_wait_seconds=0.01,
+                        raise_on_failure=True, backend_func=lambda url, status: url)
+        def call(url: str, status: int):
+            statuses.append(status)
+            return SimpleNamespace(ok=status < 400, status_code=status)
+        # when
+        for _ in range(3):
+            with self.assertRaises(RetryError):
+                call("https://jira.example.com/rest/api/2/issue/MISSING-1/comment", 404)
+        # then
+        breaker = BackendGuard.for_host("jira.example.com").circuit_breaker
+        self.assertEqual(CircuitBreaker.State.CLOSED, breaker.get_state())
+        self.assertTrue(call("https://jira.example.com/rest/api/2/issue/VALID-1/comment", 201).ok)
+        self.assertFalse(BackendGuard.is_backend_failure(ValueError("unexpected payload")))
+        self.assertTrue(BackendGuard.is_backend_failure(TimeoutError()))
+        with self.assertRaises(RetryError):
+            call("https://jira.example.com/rest/api/2/issue/VALID-1/comment", 503)
+        self.assertEqual(CircuitBreaker.State.OPEN, breaker.get_state())
+
+    def test_positional_retry_arguments_are_used(self):
+        @RetryDecorator(condition_func=lambda result: False, raise_on_failure=True)
+        def never(retry_timeout_seconds: int = 180, retry_wait_seconds: int = 1):
+            return None
+        started_at = time.monotonic()
+        with self.assertRaises(RetryError):
+            never(0.05, 0.01)
+        self.assertLess(time.monotonic() - started_at, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import logging
+import unittest
+import yaml
+
+from unittest.mock import patch
+from qubership_pipelines_common_library.v1.execution.exec_logger import ExecutionLogger
+from qubership_pipelines_common_library.v2.utils.crypto_utils import CryptoUtils, MaskedParamsView
+
+
+class TestMaskedParamsView(unittest.TestCase):
+
+    CONTENT = {
+        "kind": "AtlasModuleParamsSecure",
+        "apiVersion": "v1",
+        "params": {"token": "secret", "empty": "", "missing": None, "hosts": ["a", {"port": 8080}], "nested": {}},
+        "systems": {"jenkins": {"url": "https://jenkins", "password": "admin", "kind": "not-excluded"}},
+    }
+
+    def test_masked_view_matches_masked_copy(self):
+        expected = yaml.dump(CryptoUtils.mask_values(self.CONTENT), default_flow_style=False)
+        self.assertEqual(expected, str(MaskedParamsView(self.CONTENT, True)))
+        self.assertNotIn("secret", str(MaskedParamsView(self.CONTENT, True)))
+
+    def test_unmasked_view(self):
+        self.assertEqual(yaml.dump(self.CONTENT, default_flow_style=False), str(MaskedParamsView(self.CONTENT, False)))
+
+    def test_view_is_rendered_once(self):
+        view = MaskedParamsView(self.CONTENT, True)
+        with patch("yaml.dump", wraps=yaml.dump) as dump:
+            first, second = str(view), str(view)
+        self.assertEqual(first, second)
+        self.assertEqual(1, dump.call_count)
+
+    def test_view_is_not_rendered_for_dropped_record(self):
+        logger = logging.getLogger("test_masked_params_view")
+        logger.setLevel(logging.WARNING)
+        view = MaskedParamsView(self.CONTENT, True)
+        with patch("yaml.dump") as dump:
+            logger.info("params: %s", view)
+        dump.assert_not_called()
+
+    def test_execution_logger_is_enabled_for_checks_handlers(self):
+        execution_logger = ExecutionLogger(None)
+        handler = logging.NullHandler()
+        handler.setLevel(logging.ERROR)
+        with patch.object(execution_logger.logger, "handlers", [handler]), \
+                patch.object(execution_logger.logger, "propagate", False):
+            self.assertFalse(execution_logger.isEnabledFor(logging.INFO))
+            self.assertTrue(execution_logger.isEnabledFor(logging.ERROR))
@@ -0,0 +1,125 @@
+import asyncio
+import time
+import unittest
+
+from unittest.mock import patch, MagicMock
+from qubership_pipelines_common_library.v2.utils.retry_decorator import RetryDecorator, RetryError
+
+
+class TestRetryDecorator(unittest.TestCase):
+
+    def test_exponential_backoff_is_capped(self):
+        # given
+        attempts = []
+
+        @RetryDecorator(condition_func=lambda result: result, backoff_multiplier=2, max_wait_seconds=5)
+        def flaky():
+            attempts.append(1)
+            return len(attempts) == 5
+        # when
+        with patch("time.sleep") as sleep:
+            self.assertTrue(flaky())
+        # then
+        self.assertEqual([1, 2, 4, 5], [call.args[0] for call in sleep.call_args_list])
+
+    def test_full_jitter_stays_within_backoff(self):
+        decorator = RetryDecorator(backoff_multiplier=2, jitter=True)
+        for retries in range(1, 6):
+            self.assertTrue(0 <= decorator.compute_wait_seconds(1, retries) <= 2 ** (retries - 1))
+
+    def test_deadline_counts_time_spent_in_calls(self):
+        # given
+        attempts = []
+
+        @RetryDecorator(condition_func=lambda result: False, retry_timeout_seconds=0.2, retry_wait_seconds=0.01,
+                        raise_on_failure=True)
+        def slow():
+            attempts.append(1)
+            time.sleep(0.05)
+        # when
+        started_at = time.monotonic()
+        with self.assertRaises(RetryError) as context:
+            slow()
+        # then
+        self.assertLess(time.monotonic() - started_at, 0.5)
+        self.assertLessEqual(len(attempts), 5)
+        self.assertEqual(len(attempts), context.exception.attempts)
+
+    def test_exits_on_exhaustion_by_default(self):
+        @RetryDecorator(condition_func=lambda result: False, retry_timeout_seconds=0.05, retry_wait_seconds=0.01)
+        def never():
+            return None
+        with self.assertRaises(SystemExit) as context:
+            never()
+        self.assertEqual(1, context.exception.code)
+
+    def test_exception_policies(self):
+        # given
+        calls = []
+
+        @RetryDecorator(retry_wait_seconds=0.01, retry_on=(ConnectionError,), give_up_on=(ConnectionRefusedError,),
+                        raise_on_failure=True)
+        def call(error: Exception):
+            calls.append(error)
+            if len(calls) < 3:
+                raise error
+            return "ok"
+        # when / then
+        self.assertEqual("ok", call(ConnectionResetError()))
+        calls.clear()
+        with self.assertRaises(ConnectionRefusedError):
+            call(ConnectionRefusedError())
+        with self.assertRaises(KeyError):
+            call(KeyError())
+        self.assertEqual(2, len(calls))
+
+    def test_last_exception_is_chained_into_retry_error(self):
+        @RetryDecorator(retry_timeout_seconds=0.05, retry_wait_seconds=0.01, raise_on_failure=True)
+        def failing():
+            raise ConnectionError("unavailable")
+        with self.assertRaises(RetryError) as context:
+            failing()
+        self.assertIsInstance(context.exception.__cause__, ConnectionError)
+
+    def test_retry_after_header_extends_wait(self):
+        # given
+        throttled = MagicMock(ok=False, headers={"Retry-After": "3"})
+        responses = [throttled, MagicMock(ok=True, headers={})]
+
+        @RetryDecorator(condition_func=lambda response: response.ok, retry_wait_seconds=1)
+        def request():
+            return responses.pop(0)
+        # when
+        with patch("time.sleep") as sleep:
+            request()
+        # then
+        sleep.assert_called_once_with(3.0)
+        self.assertEqual(0.0, RetryDecorator.get_retry_after_seconds(
+            MagicMock(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})))
+        self.assertIsNone(RetryDecorator.get_retry_after_seconds(MagicMock(headers={})))
+
+    def test_call_kwargs_do_not_change_decorator_defaults(self):
+        decorator = RetryDecorator(condition_func=lambda result: True)
+        decorated = decorator(lambda retry_timeout_seconds=None, retry_wait_seconds=None: "ok")
+        self.assertEqual("ok", decorated(retry_timeout_seconds=5, retry_wait_seconds=2))
+        self.assertEqual((180, 1), (decorator.retry_timeout_seconds, decorator.retry_wait_seconds))
+
+    def test_async_function(self):
+        # given
+        attempts = []
+
+        @RetryDecorator.with_backoff(condition_func=lambda result: result == "ok", retry_wait_seconds=0.01)
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError()
+            return "ok" if len(attempts) == 3 else None
+        # when
+        result = asyncio.run(flaky())
+        # then
+        self.assertEqual("ok", result)
+        self.assertEqual(3, len(attempts))
+
+
+if __name__ == "__main__":
+    unittest.main()
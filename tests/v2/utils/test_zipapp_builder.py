@@ -0,0 +1,109 @@
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+
+from pathlib import Path
+from qubership_pipelines_common_library.v2.utils.zipapp_builder import ZipappBuilder
+
+SOURCES = {
+    "sample_cli/__init__.py": "",
+    "sample_cli/__main__.py": "import used_sdk\n\n\ndef cli():\n    print(f'main: {used_sdk.NAME}')\n",
+    "sample_cli/commands.py": "class SampleCommand:\n    def run(self):\n        import lazy_sdk\n        return lazy_sdk.NAME\n",
+    "used_sdk/__init__.py": "NAME = 'used'\n",
+    "lazy_sdk/__init__.py": "NAME = 'lazy'\n",
+    "unused_sdk/__init__.py": "NAME = 'unused'\n",
+    "unused_sdk-1.0.dist-info/RECORD": "unused_sdk/__init__.py,,\nunused_sdk-1.0.dist-info/RECORD,,\n",
+    "dynamic_sdk.py": "NAME = 'dynamic'\n",
+}
+
+
+class TestZipappBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_folder = Path(tempfile.mkdtemp())
+        self.source_dir = self.temp_folder.joinpath("source")
+        for path, content in SOURCES.items():
+            self.source_dir.joinpath(path).parent.mkdir(parents=True, exist_ok=True)
+            self.source_dir.joinpath(path).write_text(content)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_build_prunes_unused_packages_and_precompiles_modules(self):
+        # given
+        builder = ZipappBuilder(self.source_dir, "sample_cli.__main__:cli", commands=["sample_cli.commands.SampleCommand"],
+                                keep_packages=["dynamic_sdk"])
+        output_path = self.temp_folder.joinpath("dist", "sample_cli.pyz")
+        extracted_path = self.temp_folder.joinpath("extracted")
+        # when
+        manifest = builder.build(output_path, extracted_path)
+        # then
+        self.assertEqual(["unused_sdk"], manifest["pruned_packages"])
+        self.assertEqual(["dynamic_sdk", "lazy_sdk", "sample_cli", "used_sdk"], manifest["packages"])
+        with zipfile.ZipFile(output_path) as archive:
+            names = archive.namelist()
+            archived_manifest = json.loads(archive.read(ZipappBuilder.MANIFEST_FILE_NAME))
+        self.assertIn("sample_cli/commands.pyc", names)
+        self.assertIn("lazy_sdk/__init__.pyc", names)
+        self.assertFalse([name for name in names if name.startswith("unused_sdk")])
+        self.assertIn("sample_cli/commands.pyc", archived_manifest["files"])
+        self.assertFalse(self.source_dir.joinpath("sample_cli", "commands.pyc").exists())
+
+        for runnable in (output_path, extracted_path):
+            result = subprocess.run([sys.executable, str(runnable)], capture_output=True, text=True, check=True)
+            self.assertEqual("main: used\n", result.stdout)
+        self.assertTrue(list(extracted_path.joinpath("sample_cli", "__pycache__").glob("commands.*.pyc")))
+        self.assertTrue(extracted_path.joinpath(ZipappBuilder.MANIFEST_FILE_NAME).is_file())
+        self.assertFalse(extracted_path.joinpath("unused_sdk-1.0.dist-info").exists())
+
+    def test_build_without_pruning(self):
+        builder = ZipappBuilder(self.source_dir, "sample_cli.__main__:cli", prune=False, compile_bytecode=False)
+        manifest = builder.build(self.temp_folder.joinpath("sample_cli.pyz"))
+        self.assertEqual([], manifest["pruned_packages"])
+        self.assertIn("unused_sdk", manifest["packages"])
+
+    def test_namespace_packages_and_registered_classpaths_are_not_pruned(self):
+        # given
+        extra_sources = {
+            "sample_cli/registry.py": "class Registry:\n    PROVIDER_MAP = {'sdk': 'registry_sdk.provider.Provider'}\n",
+            "sample_cli/commands.py": "class SampleCommand:\n    def run(self):\n        import ns_sdk.cloud.storage\n"
+                                      "        from sample_cli.registry import Registry\n",
+            "ns_sdk/cloud/storage.py": "NAME = 'namespace'\n",
+            "registry_sdk/__init__.py": "",
+            "registry_sdk/provider.py": "class Provider:\n    pass\n",
+        }
+        for path, content in extra_sources.items():
+            self.source_dir.joinpath(path).parent.mkdir(parents=True, exist_ok=True)
+            self.source_dir.joinpath(path).write_text(content)
+        builder = ZipappBuilder(self.source_dir, "sample_cli.__main__:cli", commands=["sample_cli.commands.SampleCommand"],
+                                dynamic_classpath_registries={"sample_cli.registry": ["PROVIDER_MAP"]})
+        # when
+        manifest = builder.build(self.temp_folder.joinpath("sample_cli.pyz"))
+        # then
+        self.assertIn("ns_sdk", manifest["packages"])
+        self.assertIn("registry_sdk", manifest["packages"])
+        self.assertEqual(["dynamic_sdk", "lazy_sdk", "unused_sdk"], manifest["pruned_packages"])
+
+    def test_secret_manager_stores_are_known_registries(self):
+        registry = "qubership_pipelines_common_library.v2.secret_manager.providers.multi_store_provider"
+        module_file = Path(__file__).parents[3].joinpath(*registry.split(".")).with_suffix(".py")
+        class_paths = ZipappBuilder._registry_class_paths(str(module_file), ZipappBuilder.DYNAMIC_CLASSPATH_REGISTRIES[registry])
+        self.assertIn("qubership_pipelines_common_library.v2.secret_manager.providers.hashicorp_vault.HashicorpVaultProvider",
+                      class_paths)
+        self.assertIn("qubership_pipelines_common_library.v2.artifacts_finder.auth.gcp_credentials.GcpCredentialsProvider",
+                      class_paths)
+        self.assertEqual(10, len(class_paths))
+
+    def test_unknown_entry_point_fails(self):
+        with self.assertRaises(ValueError):
+            ZipappBuilder(self.source_dir, "sample_cli")
+        with self.assertRaises(ValueError):
+            ZipappBuilder(self.source_dir, "not_existing_cli:cli").build(self.temp_folder.joinpath("sample_cli.pyz"))
+
+
+if __name__ == "__main__":
+    unittest.main()